@@ -0,0 +1,22 @@
+from fastapi import APIRouter, status
+
+from app.domain.schemas.cache import CacheStatsResponse
+from app.domain.usecases.cache import CacheUsecaseDependency
+
+router: APIRouter = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get(
+	"/stats",
+	response_model=CacheStatsResponse,
+	status_code=status.HTTP_200_OK,
+	summary="Retrieve cache counters",
+	response_description="Hit, miss and eviction counters per cache layer",
+)
+async def stats(usecase: CacheUsecaseDependency) -> CacheStatsResponse:
+	"""
+	Retrieve hit, miss and eviction counters of the application caches.
+
+	- **Returns**: Counters per cache layer, used to size the caches
+	"""
+	return await usecase.stats()
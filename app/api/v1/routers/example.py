@@ -1,19 +1,120 @@
-from fastapi import APIRouter, Depends, Request, status
-from pydantic import UUID4
+from collections.abc import AsyncIterator
+from datetime import datetime
+from uuid import UUID
 
-from app.domain.schemas.bulk_insert import BulkInsertCreate, BulkInsertResponse
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.conditional import (
+	entity_tag,
+	is_conditional,
+	is_fresh,
+	not_modified,
+	validators,
+)
+from app.core.config import settings
+from app.domain.schemas.base import BaseSchema
+from app.domain.schemas.batch import BatchResponse
+from app.domain.schemas.bulk_delete import BulkDeleteResponse
+from app.domain.schemas.bulk_insert import (
+	BulkInsertColumnar,
+	BulkInsertCreate,
+	BulkInsertResponse,
+	OnConflict,
+)
+from app.domain.schemas.bulk_update import BulkUpdate, BulkUpdateResponse
 from app.domain.schemas.collection_reponse import CollectionResponse
 from app.domain.schemas.example import (
+	ExampleBulkUpdate,
+	ExampleColumns,
 	ExampleCreate,
+	ExampleExportParams,
+	ExampleFilterParams,
 	ExampleQueryParams,
 	ExampleResponse,
 	ExampleUpdate,
+	ExampleUpsert,
 )
+from app.domain.schemas.job import JobResponse
 from app.domain.usecases.example import ExampleUsecaseDependency
 
 router: APIRouter = APIRouter(prefix="/example", tags=["examples"])
 
 
+def projected(content: BaseModel, headers: dict[str, str] | None = None) -> Response:
+	"""Serializes a sparse fieldset as is: the declared response model would
+	reject the fields it leaves out."""
+	return Response(
+		content=content.model_dump_json(), media_type="application/json", headers=headers
+	)
+
+
+def resource_tag(request: Request, updated_at: datetime) -> str:
+	return entity_tag(request.url, updated_at.timestamp())
+
+
+def resource_validators(request: Request, updated_at: datetime) -> dict[str, str]:
+	return validators(resource_tag(request, updated_at), updated_at)
+
+
+@router.get(
+	"/export",
+	response_class=StreamingResponse,
+	status_code=status.HTTP_200_OK,
+	summary="Export resources",
+	response_description="Every matching resource, as NDJSON or CSV",
+)
+async def export(
+	request: Request,
+	usecase: ExampleUsecaseDependency,
+	export_params: ExampleExportParams = Depends(),
+) -> StreamingResponse:
+	"""
+	Stream every resource matching the filters, without pagination.
+
+	- **export_params**: The same filters as the collection endpoint
+	(including `field__op=value` expressions), the `fields` to export and
+	the `format`: `ndjson` (one JSON resource per line) or `csv` (with a
+	header row, values as Postgres prints them)
+	- **Returns**: The resources in creation order, streamed as they are read
+	"""
+	content: AsyncIterator[bytes] = usecase.export(
+		request=request, export_params=export_params
+	)
+	filename: str = f"example.{export_params.format}"
+	return StreamingResponse(
+		content,
+		media_type=export_params.format.media_type,
+		headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+	)
+
+
+@router.get(
+	"/batch",
+	response_model=BatchResponse[ExampleResponse],
+	status_code=status.HTTP_200_OK,
+	summary="Retrieve several resources by id",
+	response_description="The resources found and the ids that were not",
+)
+async def get_many(
+	usecase: ExampleUsecaseDependency,
+	ids: list[UUID] = Query(
+		min_length=1,
+		max_length=settings.BATCH_GET_MAX_IDS,
+		description="Ids of the resources, repeated: `ids=...&ids=...`",
+	),
+) -> BatchResponse[ExampleResponse]:
+	"""
+	Retrieve many resources in one round trip, instead of one call per id.
+
+	- **ids**: UUIDs of the resources, at most `BATCH_GET_MAX_IDS` of them
+	- **Returns**: The resources in the order of `ids`, and the ids that
+	do not exist
+	"""
+	return await usecase.get_many(ids=ids)
+
+
 @router.get(
 	"/{id}",
 	response_model=ExampleResponse,
@@ -21,15 +122,41 @@ router: APIRouter = APIRouter(prefix="/example", tags=["examples"])
 	summary="Retrieve a single resource",
 	response_description="Resource data found",
 )
-async def get(id: UUID4, usecase: ExampleUsecaseDependency) -> ExampleResponse:
+async def get(
+	id: UUID,
+	request: Request,
+	response: Response,
+	usecase: ExampleUsecaseDependency,
+	fields: str | None = Query(
+		default=None,
+		description="Comma separated fields to return, all of them when omitted",
+		examples=["id,name"],
+	),
+) -> ExampleResponse | Response:
 	"""
 	Retrieve a single resource by its unique ID.
 
 	- **id**: UUID of the resource
+	- **fields**: Optional sparse fieldset, e.g. `id,name`. Only these
+	columns are read and returned; unknown fields are rejected with 400
 	- **Returns**: The resource data if found,
-	otherwise triggers ObjectNotFound exception
+	otherwise triggers ObjectNotFound exception. Carries `ETag` and
+	`Last-Modified`; when `If-None-Match` or `If-Modified-Since` show the
+	client's copy is current, 304 is returned without a body
 	"""
-	return await usecase.get(id=id)
+	if is_conditional(request):
+		updated_at = await usecase.modified_at(id=id)
+		if is_fresh(request, resource_tag(request, updated_at), updated_at):
+			return not_modified(resource_validators(request, updated_at))
+
+	example: BaseSchema = await usecase.get(id=id, fields=fields)
+	# Answered from what `get` read, without another round trip
+	updated_at = await usecase.modified_at(id=id)
+	headers: dict[str, str] = resource_validators(request, updated_at)
+	if fields:
+		return projected(example, headers)
+	response.headers.update(headers)
+	return example  # type: ignore
 
 
 @router.get(
@@ -41,16 +168,51 @@ async def get(id: UUID4, usecase: ExampleUsecaseDependency) -> ExampleResponse:
 )
 async def query(
 	request: Request,
+	response: Response,
 	usecase: ExampleUsecaseDependency,
 	query_params: ExampleQueryParams = Depends(),
-) -> CollectionResponse[ExampleResponse]:
+) -> CollectionResponse[ExampleResponse] | Response:
 	"""
 	Retrieve a collection of resources filtered by optional query parameters.
 
-	- **query_params**: Optional filters for the search
-	- **Returns**: A paginated collection of resources matching the filters
+	- **query_params**: Optional filters for the search. Besides exact matches,
+	any column can be filtered as `field__op=value` with `op` one of eq, ne,
+	lt, lte, gt, gte, in, between (comma separated), like, ilike, startswith,
+	isnull, contains, and contained_by/overlap on array columns. Unknown
+	fields or operators are rejected with 400
+	- **fields**: Optional sparse fieldset, e.g. `id,name`. Each result then
+	holds only these fields
+	- **order_by**/**direction**: Sort column, restricted to indexed ones,
+	and `asc` or `desc`. Ties are broken by id, so pages are stable
+	- **Returns**: A paginated collection of resources matching the filters.
+	Carries an `ETag`; when `If-None-Match` shows the client's copy of the
+	page is current, 304 is returned without a body
 	"""
-	return await usecase.query(request=request, query_params=query_params)
+	if is_conditional(request):
+		etag: str = await usecase.page_tag(request=request, query_params=query_params)
+		if is_fresh(request, etag):
+			return not_modified(validators(etag))
+
+	# Once the page is read, `page_tag` answers from it without a round trip
+	if settings.RAW_READS:
+		content: bytes = await usecase.query_json(
+			request=request, query_params=query_params
+		)
+		headers: dict[str, str] = validators(
+			await usecase.page_tag(request=request, query_params=query_params)
+		)
+		return Response(content=content, media_type="application/json", headers=headers)
+
+	collection: CollectionResponse[BaseSchema] = await usecase.query(
+		request=request, query_params=query_params
+	)
+	headers = validators(
+		await usecase.page_tag(request=request, query_params=query_params)
+	)
+	if query_params.fields:
+		return projected(collection, headers)
+	response.headers.update(headers)
+	return collection  # type: ignore
 
 
 @router.post(
@@ -91,6 +253,130 @@ async def bulk_insert(
 	return await usecase.bulk_insert(data=data)
 
 
+@router.post(
+	"/bulk_insert/columnar",
+	response_model=BulkInsertResponse,
+	status_code=status.HTTP_200_OK,
+	summary="Insert multiple resources in bulk, column by column",
+	response_description="Time spent loading the columns",
+)
+async def bulk_insert_columnar(
+	usecase: ExampleUsecaseDependency, data: BulkInsertColumnar[ExampleColumns]
+) -> BulkInsertResponse:
+	"""
+	Insert resources in bulk from one list of values per field.
+
+	- **data**: Columns of equal length, omitted ones are loaded as null
+	- **Returns**: The time spent loading the columns
+	"""
+	return await usecase.bulk_insert_columnar(data=data)
+
+
+@router.post(
+	"/bulk_insert/merge",
+	response_model=BulkInsertResponse,
+	status_code=status.HTTP_200_OK,
+	summary="Insert or update multiple resources in bulk",
+	response_description="Rows inserted, updated and skipped by the merge",
+)
+async def bulk_merge(
+	usecase: ExampleUsecaseDependency,
+	data: BulkInsertCreate[ExampleUpsert],
+	on_conflict: OnConflict = OnConflict.UPDATE,
+) -> BulkInsertResponse:
+	"""
+	Merge resources by id, so the same payload can safely be loaded twice.
+
+	- **data**: List of resources, each with its id
+	- **on_conflict**: `update` rewrites existing resources that changed,
+	`nothing` leaves them untouched
+	- **Returns**: How many rows were inserted, updated and skipped
+	"""
+	return await usecase.bulk_merge(data=data, on_conflict=on_conflict)
+
+
+@router.post(
+	"/bulk_insert/jobs",
+	response_model=JobResponse,
+	status_code=status.HTTP_202_ACCEPTED,
+	summary="Schedule a bulk insert in the background",
+	response_description="The scheduled job, to be polled on /jobs/{id}",
+)
+async def submit_bulk_insert(
+	response: Response,
+	usecase: ExampleUsecaseDependency,
+	data: BulkInsertCreate[ExampleCreate],
+) -> JobResponse:
+	"""
+	Schedule a bulk insert and return immediately instead of holding the
+	connection for the whole load.
+
+	- **data**: List of resource data to be inserted
+	- **Returns**: The scheduled job; its status is available at `/jobs/{id}`
+	"""
+	job: JobResponse = await usecase.submit_bulk_insert(data=data)
+	response.headers["Location"] = f"/jobs/{job.id}"
+	return job
+
+
+@router.post(
+	"/bulk_insert/stream",
+	response_model=BulkInsertResponse,
+	status_code=status.HTTP_200_OK,
+	summary="Stream multiple resources in bulk",
+	response_description="Time spent loading the stream",
+	openapi_extra={
+		"requestBody": {
+			"required": True,
+			"content": {
+				"application/x-ndjson": {
+					"schema": {"$ref": "#/components/schemas/ExampleCreate"}
+				},
+				"application/json": {
+					"schema": {
+						"type": "array",
+						"items": {"$ref": "#/components/schemas/ExampleCreate"},
+					}
+				},
+			},
+		}
+	},
+)
+async def bulk_insert_stream(
+	request: Request, usecase: ExampleUsecaseDependency
+) -> BulkInsertResponse:
+	"""
+	Insert resources in bulk while the request body is still being received.
+
+	- **body**: NDJSON (one resource per line) or a JSON array of resources
+	- **Returns**: The time spent loading the stream
+	"""
+	return await usecase.bulk_insert_stream(
+		chunks=request.stream(),
+		media_type=request.headers.get("content-type", "application/json"),
+	)
+
+
+@router.patch(
+	"/bulk",
+	response_model=BulkUpdateResponse,
+	status_code=status.HTTP_200_OK,
+	summary="Partially update multiple resources",
+	response_description="Resources matched and changed",
+)
+async def bulk_partial_update(
+	usecase: ExampleUsecaseDependency, data: BulkUpdate[ExampleBulkUpdate]
+) -> BulkUpdateResponse:
+	"""
+	Partially update many resources at once, each by its ID.
+
+	- **data**: List of changes, each with the id of its resource and only
+	the fields to update
+	- **Returns**: How many resources were found and how many actually changed
+	"""
+	return await usecase.bulk_partial_update(data=data)
+
+
 @router.patch(
 	"/{id}",
 	response_model=ExampleResponse,
@@ -99,7 +385,7 @@ async def bulk_insert(
 	response_description="The updated resource",
 )
 async def partial_update(
-	usecase: ExampleUsecaseDependency, data: ExampleUpdate, id: UUID4
+	usecase: ExampleUsecaseDependency, data: ExampleUpdate, id: UUID
 ) -> ExampleResponse:
 	"""
 	Partially update fields of an existing resource by ID.
@@ -117,7 +403,7 @@ async def partial_update(
 	summary="Delete a resource",
 	response_description="No content on successful deletion",
 )
-async def delete(id: UUID4, usecase: ExampleUsecaseDependency) -> None:
+async def delete(id: UUID, usecase: ExampleUsecaseDependency) -> None:
 	"""
 	Delete a resource by its unique ID.
 
@@ -125,3 +411,22 @@ async def delete(id: UUID4, usecase: ExampleUsecaseDependency) -> None:
 	- **Returns**: No content (204) on successful deletion
 	"""
 	await usecase.delete(id=id)
+
+
+@router.delete(
+	"/",
+	response_model=BulkDeleteResponse,
+	status_code=status.HTTP_200_OK,
+	summary="Delete the resources matching filters",
+	response_description="Number of deleted resources",
+)
+async def delete_by_filter(
+	usecase: ExampleUsecaseDependency, filters: ExampleFilterParams = Depends()
+) -> BulkDeleteResponse:
+	"""
+	Delete every resource matching the filters, in small batches.
+
+	- **filters**: At least one filter is required
+	- **Returns**: The number of deleted resources
+	"""
+	return await usecase.delete_by_filter(filters=filters)
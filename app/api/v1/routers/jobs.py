@@ -0,0 +1,24 @@
+from fastapi import APIRouter, status
+from pydantic import UUID4
+
+from app.domain.schemas.job import JobResponse
+from app.domain.usecases.job import JobUsecaseDependency
+
+router: APIRouter = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get(
+	"/{id}",
+	response_model=JobResponse,
+	status_code=status.HTTP_200_OK,
+	summary="Retrieve a background job",
+	response_description="Job status and progress",
+)
+async def get(id: UUID4, usecase: JobUsecaseDependency) -> JobResponse:
+	"""
+	Retrieve the status of a background job by its unique ID.
+
+	- **id**: UUID of the job
+	- **Returns**: Status, progress, rows loaded and errors of the job
+	"""
+	return await usecase.get(id=id)
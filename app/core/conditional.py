@@ -0,0 +1,68 @@
+"""app/core/conditional.py"""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def entity_tag(*parts: Any) -> str:
+	"""Weak ETag of a representation identified by `parts` (its URL and what
+	its content derives from, e.g. `updated_at`), without serializing it."""
+	raw: str = "\x1f".join(map(str, parts))
+	return f'W/"{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"'
+
+
+def http_date(moment: datetime) -> str:
+	return format_datetime(moment.astimezone(UTC), usegmt=True)
+
+
+def validators(etag: str, last_modified: datetime | None = None) -> dict[str, str]:
+	"""Headers advertising the validators of a response.
+
+	`no-cache` lets clients store the response but makes them revalidate
+	it on every use, instead of guessing a freshness lifetime from
+	`Last-Modified`.
+	"""
+	headers: dict[str, str] = {"ETag": etag, "Cache-Control": "no-cache"}
+	if last_modified is not None:
+		headers["Last-Modified"] = http_date(last_modified)
+	return headers
+
+
+def is_conditional(request: Request) -> bool:
+	"""Whether the client sent validators of a copy it already holds."""
+	return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_fresh(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+	"""Whether the copy the client holds is current (RFC 9110, 13.2.2).
+
+	`If-None-Match` takes precedence and is compared weakly. Otherwise
+	`If-Modified-Since` is compared at the one second precision of HTTP
+	dates; an unparsable date is ignored.
+	"""
+	if_none_match: str | None = request.headers.get("if-none-match")
+	if if_none_match is not None:
+		tags: set[str] = {
+			tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+		}
+		return "*" in tags or etag.removeprefix("W/") in tags
+
+	if_modified_since: str | None = request.headers.get("if-modified-since")
+	if if_modified_since is None or last_modified is None:
+		return False
+	try:
+		since: datetime = parsedate_to_datetime(if_modified_since)
+	except (TypeError, ValueError):
+		return False
+	if since.tzinfo is None:
+		since = since.replace(tzinfo=UTC)
+	return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+	"""An empty 304 repeating the validators of the representation."""
+	return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
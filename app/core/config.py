@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import ClassVar
+from typing import ClassVar, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,6 +16,75 @@ class Settings(BaseSettings):
 	POSTGRES_PASSWORD: str = ""
 	POSTGRES_PORT: str = ""
 
+	# Read replicas, reads outside a Transaction are routed to them
+	DATABASE_REPLICA_URLS: list[str] = []
+	REPLICA_STRATEGY: Literal["round_robin", "least_busy"] = "round_robin"
+
+	# Connection pool, shared by ORM sessions and raw driver connections (COPY)
+	DB_POOL_SIZE: int = 10
+	DB_MAX_OVERFLOW: int = 10
+	DB_POOL_TIMEOUT: float = 30.0
+	# Hard cap of connections per worker process, split between the primary and
+	# the replicas; 0 disables it
+	DB_WORKER_CONNECTION_BUDGET: int = 0
+
+	# COPY loads, batches are spread across COPY_WORKERS pool connections with
+	# at most COPY_MAX_IN_FLIGHT queued (0 means twice the workers)
+	COPY_WORKERS: int = 1
+	COPY_MAX_IN_FLIGHT: int = 0
+
+	# Rows removed per statement by delete-by-filter
+	DELETE_BATCH_SIZE: int = 5000
+
+	# Group commit: concurrent single-row creates arriving within the window
+	# (or until the batch is full) are written by one multi-row INSERT
+	INSERT_COALESCING: bool = False
+	INSERT_COALESCE_WINDOW_MS: float = 2.0
+	INSERT_COALESCE_MAX_BATCH: int = 100
+
+	# Lookups by id issued in the same event loop tick (outside a transaction)
+	# are read together by one `WHERE id = ANY($1)`
+	GET_COALESCING: bool = False
+	GET_COALESCE_MAX_BATCH: int = 500
+
+	# Most ids a single batch get accepts
+	BATCH_GET_MAX_IDS: int = 100
+
+	# Rows fetched per round trip of the server-side cursor behind NDJSON exports
+	EXPORT_BATCH_SIZE: int = 1000
+
+	# Collection counts
+	DEFAULT_COUNT_MODE: Literal["exact", "estimated", "cached"] = "exact"
+	COUNT_CACHE_TTL: float = 30.0
+	COUNT_EXACT_THRESHOLD: int = 10_000
+	# Collections are read on the driver connection and rows serialized straight
+	# to JSON, bypassing the ORM and response model validation
+	RAW_READS: bool = False
+
+	# Background jobs
+	JOBS_STORE: Literal["memory", "postgres"] = "memory"
+	JOBS_CONCURRENCY: int = 2
+	JOBS_MEMORY_MAX: int = 1000
+	# Running jobs are touched this often; one untouched for JOBS_STALE_AFTER
+	# seconds lost its worker and is failed when read or at startup
+	JOBS_HEARTBEAT_INTERVAL: float = 10.0
+	JOBS_STALE_AFTER: float = 60.0
+	# Seconds shutdown waits for jobs in flight before cancelling them
+	JOBS_SHUTDOWN_TIMEOUT: float = 30.0
+
+	# Cache
+	REDIS_URL: str = "redis://localhost:6379/0"
+	# Seconds a cache command may take before the cache is bypassed
+	REDIS_TIMEOUT: float = 1.0
+	# "memory" is per worker: other workers only see a write once the TTL expires
+	ENTITY_CACHE_BACKEND: Literal["none", "memory", "redis"] = "none"
+	ENTITY_CACHE_TTL: float = 30.0
+	ENTITY_CACHE_MAX_SIZE: int = 10_000
+	# Collection pages, dropped as a whole by any write to their table
+	QUERY_CACHE_BACKEND: Literal["none", "memory", "redis"] = "none"
+	QUERY_CACHE_TTL: float = 5.0
+	QUERY_CACHE_MAX_SIZE: int = 1000
+
 	model_config: ClassVar[SettingsConfigDict] = SettingsConfigDict(
 		env_file=".env", extra="allow"
 	)
@@ -1,4 +1,5 @@
 from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 from app.core.exceptions.db import (
@@ -6,6 +7,12 @@ from app.core.exceptions.db import (
 	ObjectAlreadyExistError,
 	ObjectNotFound,
 )
+from app.core.exceptions.payload import InvalidPayloadError, UnsupportedMediaTypeError
+from app.core.exceptions.query import (
+	InvalidCursorError,
+	InvalidFieldsError,
+	InvalidFilterError,
+)
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -38,6 +45,51 @@ def register_exception_handlers(app: FastAPI) -> None:
 			content={"error": exc.message},
 		)
 
+	@app.exception_handler(InvalidCursorError)
+	async def invalid_cursor_handler(
+		request: Request, exc: InvalidCursorError
+	) -> JSONResponse:
+		return JSONResponse(
+			status_code=status.HTTP_400_BAD_REQUEST,
+			content={"error": exc.message},
+		)
+
+	@app.exception_handler(InvalidFilterError)
+	async def invalid_filter_handler(
+		request: Request, exc: InvalidFilterError
+	) -> JSONResponse:
+		return JSONResponse(
+			status_code=status.HTTP_400_BAD_REQUEST,
+			content={"error": exc.message},
+		)
+
+	@app.exception_handler(InvalidFieldsError)
+	async def invalid_fields_handler(
+		request: Request, exc: InvalidFieldsError
+	) -> JSONResponse:
+		return JSONResponse(
+			status_code=status.HTTP_400_BAD_REQUEST,
+			content={"error": exc.message},
+		)
+
+	@app.exception_handler(InvalidPayloadError)
+	async def invalid_payload_handler(
+		request: Request, exc: InvalidPayloadError
+	) -> JSONResponse:
+		return JSONResponse(
+			status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+			content=jsonable_encoder({"error": exc.message, "detail": exc.errors}),
+		)
+
+	@app.exception_handler(UnsupportedMediaTypeError)
+	async def unsupported_media_type_handler(
+		request: Request, exc: UnsupportedMediaTypeError
+	) -> JSONResponse:
+		return JSONResponse(
+			status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+			content={"error": exc.message},
+		)
+
 	@app.exception_handler(Exception)
 	async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
 		error: str = f"Unexpected error [{type(exc).__name__}]: {exc}"
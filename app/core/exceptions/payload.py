@@ -0,0 +1,24 @@
+"""app/core/exceptions/payload.py"""
+
+from typing import Any
+
+from app.core.exceptions.base import CustomBaseException
+from app.core.i18n.manager import _
+
+
+class InvalidPayloadError(CustomBaseException):
+	def __init__(
+		self,
+		*args: object,
+		message: str | None = None,
+		errors: list[Any] | None = None,
+	) -> None:
+		self.message = message or _("Invalid request payload")
+		self.errors = errors or []
+		super().__init__(*args, self.message)
+
+
+class UnsupportedMediaTypeError(CustomBaseException):
+	def __init__(self, *args: object, message: str | None = None) -> None:
+		self.message = message or _("Unsupported media type")
+		super().__init__(*args, self.message)
@@ -0,0 +1,22 @@
+"""app/core/exceptions/query.py"""
+
+from app.core.exceptions.base import CustomBaseException
+from app.core.i18n.manager import _
+
+
+class InvalidCursorError(CustomBaseException):
+	def __init__(self, *args: object, message: str | None = None) -> None:
+		self.message = message or _("Invalid pagination cursor")
+		super().__init__(*args, self.message)
+
+
+class InvalidFilterError(CustomBaseException):
+	def __init__(self, *args: object, message: str | None = None) -> None:
+		self.message = message or _("Invalid filter")
+		super().__init__(*args, self.message)
+
+
+class InvalidFieldsError(CustomBaseException):
+	def __init__(self, *args: object, message: str | None = None) -> None:
+		self.message = message or _("Invalid fields")
+		super().__init__(*args, self.message)
@@ -0,0 +1,151 @@
+"""app/core/streaming.py"""
+
+import json
+import re
+from codecs import getincrementaldecoder
+from collections.abc import AsyncGenerator, AsyncIterable
+from typing import Any
+
+NDJSON_MEDIA_TYPES: tuple[str, ...] = (
+	"application/x-ndjson",
+	"application/ndjson",
+	"application/jsonl",
+)
+WHITESPACE: str = " \t\n\r"
+
+_decoder: json.JSONDecoder = json.JSONDecoder()
+# What changes the nesting of a JSON text outside and inside of strings
+_STRUCTURE: re.Pattern[str] = re.compile(r'[\[\]{},"]')
+_STRING_END: re.Pattern[str] = re.compile(r'["\\]')
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncGenerator[Any]:
+	"""Yields one decoded value per line of a newline-delimited JSON stream.
+
+	Only the current partial line is kept in memory, whatever the stream size.
+	"""
+	buffer: bytes = b""
+	async for chunk in chunks:
+		buffer += chunk
+		*lines, buffer = buffer.split(b"\n")
+		for line in lines:
+			if line.strip():
+				yield json.loads(line)
+	if buffer.strip():
+		yield json.loads(buffer)
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncGenerator[Any]:
+	"""Yields the elements of a top-level JSON array as they arrive.
+
+	The `,` or `]` ending each element is found by scanning outside of strings
+	and nested values, then the element is decoded whole. Memory is bounded by
+	the largest element rather than by the whole document, and a malformed
+	element is rejected as soon as it is complete.
+
+	Raises:
+	    json.JSONDecodeError: If the stream is not a well-formed JSON array.
+	"""
+	text_decoder = getincrementaldecoder("utf-8")()
+	buffer: str = ""
+	# Start of the element being scanned and how far the scan got
+	start: int = 0
+	scan: int = 0
+	depth: int = 0
+	in_string: bool = False
+	separated: bool = False
+	opened: bool = False
+	closed: bool = False
+	exhausted: bool = False
+	iterator = aiter(chunks)
+
+	while not exhausted:
+		try:
+			text: str = text_decoder.decode(await anext(iterator))
+		except StopAsyncIteration:
+			text = text_decoder.decode(b"", final=True)
+			exhausted = True
+		buffer = buffer[start:] + text
+		scan -= start
+		start = 0
+
+		if closed:
+			if buffer.strip(WHITESPACE):
+				raise json.JSONDecodeError("Extra data after the JSON array", buffer, 0)
+			start = len(buffer)
+			continue
+		if not opened:
+			position: int = len(buffer) - len(buffer.lstrip(WHITESPACE))
+			if position == len(buffer):
+				start = position
+				continue
+			if buffer[position] != "[":
+				raise json.JSONDecodeError("Expected a JSON array", buffer, position)
+			opened = True
+			start = scan = position + 1
+
+		while match := (_STRING_END if in_string else _STRUCTURE).search(buffer, scan):
+			char: str = match.group()
+			scan = match.end()
+			if in_string:
+				if char == '"':
+					in_string = False
+				elif scan < len(buffer):
+					scan += 1
+				else:
+					# The escaped character is in the next chunk
+					scan = match.start()
+					break
+			elif char == '"':
+				in_string = True
+			elif char in "[{":
+				depth += 1
+			elif depth:
+				if char != ",":
+					depth -= 1
+			elif char == "}":
+				raise json.JSONDecodeError("Unexpected '}'", buffer, match.start())
+			else:
+				element: str = buffer[start : match.start()]
+				if not element.strip(WHITESPACE):
+					if char == "]" and not separated:
+						closed = True
+						break
+					raise json.JSONDecodeError("Expecting value", buffer, match.start())
+				position = start + len(element) - len(element.lstrip(WHITESPACE))
+				value, end = _decoder.raw_decode(buffer, position)
+				if buffer[end : match.start()].strip(WHITESPACE):
+					raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)
+				yield value
+				separated = char == ","
+				closed = char == "]"
+				start = scan
+				if closed:
+					break
+
+		if closed:
+			if buffer[scan:].strip(WHITESPACE):
+				raise json.JSONDecodeError(
+					"Extra data after the JSON array", buffer, scan
+				)
+			start = len(buffer)
+
+	if not closed:
+		raise json.JSONDecodeError("Unterminated JSON array", buffer, len(buffer))
+
+
+def iter_json_stream(
+	chunks: AsyncIterable[bytes], media_type: str
+) -> AsyncGenerator[Any]:
+	"""Picks the incremental decoder matching the request media type.
+
+	Raises:
+	    ValueError: If the media type is neither NDJSON nor JSON.
+	"""
+	media_type = media_type.split(";", 1)[0].strip().lower()
+	if media_type in NDJSON_MEDIA_TYPES:
+		return iter_ndjson(chunks)
+	elif media_type == "application/json":
+		return iter_json_array(chunks)
+	else:
+		raise ValueError(f"Unsupported media type: {media_type}")
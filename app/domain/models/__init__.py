@@ -1 +1,2 @@
 from app.domain.models.example import ExampleModel
+from app.domain.models.job import JobModel
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.domain.models.base import CreateBaseModel
+
+
+class JobModel(CreateBaseModel):
+	__tablename__: str = "job"
+
+	kind: Mapped[str] = mapped_column(String, nullable=False)
+	status: Mapped[str] = mapped_column(String, nullable=False)
+	total_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+	inserted_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+	errors: Mapped[list[str]] = mapped_column(JSONB, nullable=False, default=list)
+	started_at: Mapped[datetime | None] = mapped_column(
+		DateTime(timezone=True), nullable=True
+	)
+	finished_at: Mapped[datetime | None] = mapped_column(
+		DateTime(timezone=True), nullable=True
+	)
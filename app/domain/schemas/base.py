@@ -1,7 +1,12 @@
 from datetime import datetime
-from typing import ClassVar
+from functools import lru_cache
+from typing import Any, ClassVar, TypedDict
+from uuid import UUID
 
-from pydantic import UUID4, BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
+
+from app.core.exceptions.query import InvalidFieldsError
+from app.core.i18n.manager import _
 
 
 class BaseSchema(BaseModel):
@@ -9,6 +14,56 @@ class BaseSchema(BaseModel):
 
 
 class OutSchema(BaseSchema):
-	id: UUID4 = Field()
+	id: UUID = Field()
 	created_at: datetime = Field()
 	updated_at: datetime = Field()
+
+
+def parse_fields(raw: str | None) -> tuple[str, ...] | None:
+	"""Reads a comma separated `fields` parameter, None when it selects all."""
+	if not raw:
+		return None
+	names: tuple[str, ...] = tuple(
+		dict.fromkeys(name.strip() for name in raw.split(",") if name.strip())
+	)
+	return names or None
+
+
+@lru_cache(maxsize=256)
+def project[SchemaT: BaseSchema](
+	schema: type[SchemaT], fields: tuple[str, ...]
+) -> type[BaseSchema]:
+	"""Returns a schema holding only `fields` of `schema`, declared as there.
+
+	Raises:
+	    InvalidFieldsError: Some of the fields are not part of `schema`.
+	"""
+	unknown: list[str] = [name for name in fields if name not in schema.model_fields]
+	if unknown:
+		raise InvalidFieldsError(message=f"{_('Invalid fields')}: {', '.join(unknown)}")
+	return create_model(
+		f"Partial{schema.__name__}",
+		__base__=BaseSchema,
+		**{
+			name: (schema.model_fields[name].annotation, schema.model_fields[name])
+			for name in fields
+		},  # type: ignore
+	)
+
+
+@lru_cache(maxsize=256)
+def row_type(schema: type[BaseModel]) -> type:
+	"""Mirrors `schema` as a TypedDict. Pydantic serializes plain dicts of
+	that type with the same field serializers as the model itself, so rows
+	can be dumped without building instances. Keys are written in the
+	order of the dict, and keys the schema does not declare are dropped."""
+	fields: dict[str, Any] = {
+		name: field.annotation for name, field in schema.model_fields.items()
+	}
+	return TypedDict(f"{schema.__name__}Row", fields)  # type: ignore
+
+
+@lru_cache(maxsize=256)
+def row_encoder(schema: type[BaseModel]) -> TypeAdapter[Any]:
+	"""Serializer of single rows of `schema`, see `row_type`."""
+	return TypeAdapter(row_type(schema))
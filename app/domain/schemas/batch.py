@@ -0,0 +1,12 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.domain.schemas.base import BaseSchema
+
+
+class BatchResponse[SchemaT: BaseSchema](BaseModel):
+	"""Schema for the records of a batch get, in the order they were asked for."""
+
+	results: list[SchemaT] = Field(description="Records found")
+	missing: list[UUID] = Field(description="Requested ids that do not exist")
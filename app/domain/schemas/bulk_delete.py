@@ -0,0 +1,9 @@
+from pydantic import Field, NonNegativeInt
+
+from app.domain.schemas.base import BaseSchema
+
+
+class BulkDeleteResponse(BaseSchema):
+	deleted_rows: NonNegativeInt = Field(
+		..., description="Number of deleted records", examples=[5000]
+	)
@@ -1,8 +1,40 @@
-from pydantic import Field
+from enum import StrEnum
+from typing import Annotated, Any, Self
+
+from pydantic import (
+	Field,
+	NonNegativeFloat,
+	NonNegativeInt,
+	create_model,
+	model_validator,
+)
 
 from app.domain.schemas.base import BaseSchema
 
 
+class OnConflict(StrEnum):
+	UPDATE = "update"
+	NOTHING = "nothing"
+
+
+def columnar(schema: type[BaseSchema]) -> type[BaseSchema]:
+	"""Builds the column-oriented counterpart of `schema`.
+
+	Every field becomes a list validated item by item with the field's own
+	constraints, so a column is checked in one pass without a model per row.
+	Omitted columns are loaded as NULL.
+	"""
+
+	fields: dict[str, Any] = {
+		name: (
+			list[Annotated[field.annotation, *field.metadata]] | None,
+			Field(default=None, description=field.description),
+		)
+		for name, field in schema.model_fields.items()
+	}
+	return create_model(f"{schema.__name__}Columns", __base__=BaseSchema, **fields)
+
+
 class BulkInsertCreate[SchemaT: BaseSchema](BaseSchema):
 	"""Generic schema for bulk inserts of any Pydantic model."""
 
@@ -18,10 +50,66 @@ class BulkInsertCreate[SchemaT: BaseSchema](BaseSchema):
 	)
 
 
+class BulkInsertColumnar[ColumnsT: BaseSchema](BaseSchema):
+	"""Generic schema for bulk inserts laid out column by column."""
+
+	columns: ColumnsT = Field(
+		...,
+		description="One list of values per field, all of the same length.",
+		examples=[{"name": ["felipe", "gustavo"], "age": [19, 20]}],
+	)
+
+	@model_validator(mode="after")
+	def check_lengths(self) -> Self:
+		lengths: set[int] = {
+			len(values) for values in self.columns.__dict__.values() if values is not None
+		}
+		if len(lengths) != 1:
+			raise ValueError("columns must have the same length")
+		if not lengths.pop():
+			raise ValueError("columns must not be empty")
+		return self
+
+	def to_columns(self) -> dict[str, list[Any]]:
+		"""Returns every field as a column, omitted ones filled with NULL."""
+
+		present: dict[str, list[Any]] = {
+			name: values
+			for name, values in self.columns.__dict__.items()
+			if values is not None
+		}
+		rows: int = len(next(iter(present.values())))
+		return {
+			name: present.get(name, [None] * rows)
+			for name in type(self.columns).model_fields
+		}
+
+
+class CopyConnectionOut(BaseSchema):
+	"""Throughput of one connection used by the load."""
+
+	rows: NonNegativeInt = Field(description="Rows copied by this connection")
+	batches: NonNegativeInt = Field(description="Batches copied by this connection")
+	rows_per_second: NonNegativeFloat = Field(
+		description="Rows per second spent in COPY", examples=[48210.5]
+	)
+
+
 class BulkInsertResponse(BaseSchema):
-	# inserted_rows: int = Field(
-	#     ..., description="Number of inserted rows", examples=[324]
-	# )
+	inserted_rows: NonNegativeInt = Field(
+		..., description="Number of inserted rows", examples=[324]
+	)
+	updated_rows: NonNegativeInt = Field(
+		default=0, description="Existing rows rewritten by a merge", examples=[12]
+	)
+	skipped_rows: NonNegativeInt = Field(
+		default=0,
+		description="Rows a merge left alone: duplicates or unchanged values",
+		examples=[3],
+	)
 	elapsed_time: float = Field(
 		..., description="Time spent for insertion", examples=[32.14]
 	)
+	connections: list[CopyConnectionOut] = Field(
+		default_factory=list, description="Per-connection throughput of the load"
+	)
@@ -0,0 +1,38 @@
+from typing import Self
+
+from pydantic import Field, NonNegativeInt, model_validator
+
+from app.domain.schemas.base import BaseSchema
+
+
+class BulkUpdate[SchemaT: BaseSchema](BaseSchema):
+	"""Generic schema for per-id partial updates of any Pydantic model."""
+
+	items: list[SchemaT] = Field(
+		...,
+		min_length=1,
+		description="Changes to apply, each with the id of its record. "
+		"Fields left out keep their current value.",
+		examples=[
+			[
+				{"id": "0b0d7c1e-8b1a-4c0e-9a53-3f5d2c6e1a47", "age": 20},
+				{"id": "5f0c3e9a-2d4b-4f7e-8c1a-9b6d2e4f1a03", "name": "gustavo"},
+			]
+		],
+	)
+
+	@model_validator(mode="after")
+	def check_distinct_ids(self) -> Self:
+		ids: list[object] = [getattr(item, "id") for item in self.items]
+		if len(set(ids)) != len(ids):
+			raise ValueError("items must have distinct ids")
+		return self
+
+
+class BulkUpdateResponse(BaseSchema):
+	matched_rows: NonNegativeInt = Field(
+		..., description="Records found for the ids sent", examples=[120]
+	)
+	changed_rows: NonNegativeInt = Field(
+		..., description="Records whose values actually changed", examples=[87]
+	)
@@ -0,0 +1,28 @@
+from pydantic import Field, NonNegativeFloat, NonNegativeInt
+
+from app.domain.schemas.base import BaseSchema
+
+
+class CacheStatsOut(BaseSchema):
+	"""Counters of a single cache layer."""
+
+	backend: str = Field(description="Backend serving the cache", examples=["memory"])
+	hits: NonNegativeInt = Field(description="Lookups served from the cache")
+	misses: NonNegativeInt = Field(description="Lookups that fell through")
+	evictions: NonNegativeInt = Field(description="Entries dropped to make room")
+	size: NonNegativeInt = Field(description="Entries currently stored")
+	hit_ratio: NonNegativeFloat = Field(description="hits / (hits + misses)")
+	available: bool = Field(
+		default=True,
+		description="False when the backend is unreachable: counters are then "
+		"those seen by this worker, size and evictions the last ones read",
+	)
+
+
+class CacheStatsResponse(BaseSchema):
+	entity: CacheStatsOut | None = Field(
+		default=None, description="Entity cache counters, null when disabled"
+	)
+	query: CacheStatsOut | None = Field(
+		default=None, description="Query cache counters, null when disabled"
+	)
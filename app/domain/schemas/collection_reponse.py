@@ -1,9 +1,12 @@
-from typing import Self
+from functools import lru_cache
+from typing import Any, Self, TypedDict, get_args
 
 from fastapi import Request
-from pydantic import AnyHttpUrl, BaseModel, Field, NonNegativeInt
+from pydantic import AnyHttpUrl, BaseModel, Field, NonNegativeInt, TypeAdapter
+from starlette.datastructures import URL
 
-from app.domain.schemas.base import BaseSchema
+from app.domain.schemas.base import BaseSchema, row_type
+from app.domain.schemas.pagination import Cursor, PaginationMode
 from app.domain.schemas.query_params import BaseQueryParams
 
 
@@ -13,8 +16,10 @@ class CollectionResponse[SchemaT: BaseSchema](BaseModel):
 	"""
 
 	count: NonNegativeInt = Field(description="Total number of items across all pages")
-	next: AnyHttpUrl = Field(description="URL for the next page of results")
-	previous: AnyHttpUrl = Field(description="URL for the previous page of results")
+	next: AnyHttpUrl | None = Field(description="URL for the next page of results")
+	previous: AnyHttpUrl | None = Field(
+		description="URL for the previous page of results"
+	)
 	results: list[SchemaT] = Field(description="list of items for the current page")
 
 	@classmethod
@@ -24,6 +29,8 @@ class CollectionResponse[SchemaT: BaseSchema](BaseModel):
 		results: list[SchemaT],
 		query_params: BaseQueryParams,
 		count: int,
+		previous_cursor: Cursor | None = None,
+		next_cursor: Cursor | None = None,
 	) -> Self:
 		"""Parses data and request information to create a CollectionResponse instance.
 
@@ -35,24 +42,102 @@ class CollectionResponse[SchemaT: BaseSchema](BaseModel):
 		    query_params (BaseQueryParams):
 		        The query parameters used for pagination (offset and limit).
 		    count (int): The total number of items in the collection across all pages.
+		    previous_cursor (Cursor | None):
+		        Keyset position of the previous page, only used in cursor mode.
+		    next_cursor (Cursor | None):
+		        Keyset position of the next page, only used in cursor mode.
 
 		Returns:
 		    CollectionResponse[SchemaT]:
 		        A CollectionResponse instance populated with pagination
 		        metadata and the current page's results.
 		"""
-		previous_calc: int = query_params.offset - query_params.limit
-		previous_offset: int = previous_calc if previous_calc > 0 else 0
-		next_offset: int = query_params.offset + query_params.limit
+		next_url, previous_url = cls.links(
+			request=request,
+			query_params=query_params,
+			previous_cursor=previous_cursor,
+			next_cursor=next_cursor,
+		)
 
-		collection_response: dict[str, int | list[SchemaT] | str] = {
+		collection_response: dict[str, int | list[SchemaT] | str | None] = {
 			"count": count,
-			"next": str(request.url.include_query_params(offset=next_offset)),
-			"previous": str(request.url.include_query_params(offset=previous_offset)),
+			"next": next_url,
+			"previous": previous_url,
 			"results": results,
 		}
 
 		return cls.model_validate(collection_response)
 
+	@staticmethod
+	def links(
+		request: Request,
+		query_params: BaseQueryParams,
+		previous_cursor: Cursor | None = None,
+		next_cursor: Cursor | None = None,
+	) -> tuple[str | None, str | None]:
+		"""Returns the `(next, previous)` page URLs, see `parse_collection`."""
+		if query_params.pagination == PaginationMode.CURSOR:
+			url: URL = request.url.remove_query_params("offset")
+			next_url: str | None = (
+				str(url.include_query_params(cursor=next_cursor.encode()))
+				if next_cursor
+				else None
+			)
+			previous_url: str | None = (
+				str(url.include_query_params(cursor=previous_cursor.encode()))
+				if previous_cursor
+				else None
+			)
+		else:
+			previous_calc: int = query_params.offset - query_params.limit
+			previous_offset: int = previous_calc if previous_calc > 0 else 0
+			next_offset: int = query_params.offset + query_params.limit
+			next_url = str(request.url.include_query_params(offset=next_offset))
+			previous_url = str(request.url.include_query_params(offset=previous_offset))
+
+		return next_url, previous_url
+
+	@classmethod
+	def dump_rows(
+		cls,
+		request: Request,
+		rows: list[dict[str, Any]],
+		query_params: BaseQueryParams,
+		count: int,
+		previous_cursor: Cursor | None = None,
+		next_cursor: Cursor | None = None,
+	) -> bytes:
+		"""Serializes plain rows as a collection, without building any model.
+
+		The output is byte for byte what `parse_collection` followed by
+		`model_dump_json` gives, provided each row holds the fields of
+		`SchemaT` in declaration order; keys after those are dropped.
+		"""
+		next_url, previous_url = cls.links(
+			request=request,
+			query_params=query_params,
+			previous_cursor=previous_cursor,
+			next_cursor=next_cursor,
+		)
+		return _encoder(cls).dump_json(
+			{
+				"count": count,
+				"next": _URL.validate_python(next_url) if next_url else None,
+				"previous": _URL.validate_python(previous_url) if previous_url else None,
+				"results": rows,
+			}
+		)
+
+
+_URL: TypeAdapter[AnyHttpUrl] = TypeAdapter(AnyHttpUrl)
+
 
-# IMPLEMENTAR: Keyset/Cursor
+@lru_cache(maxsize=64)
+def _encoder(collection: type[CollectionResponse[Any]]) -> TypeAdapter[Any]:
+	"""Mirrors a collection schema as TypedDicts, see `row_type`."""
+	(schema,) = get_args(collection.model_fields["results"].annotation)
+	fields: dict[str, Any] = {
+		name: field.annotation for name, field in collection.model_fields.items()
+	}
+	fields["results"] = list[row_type(schema)]  # type: ignore
+	return TypeAdapter(TypedDict(f"{collection.__name__}Rows", fields))  # type: ignore
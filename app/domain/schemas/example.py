@@ -1,6 +1,11 @@
+from typing import Literal
+from uuid import UUID
+
 from pydantic import Field, NonNegativeInt, TypeAdapter
 
 from app.domain.schemas.base import BaseSchema, OutSchema
+from app.domain.schemas.bulk_insert import columnar
+from app.domain.schemas.export import BaseExportParams
 from app.domain.schemas.query_params import BaseQueryParams
 
 
@@ -22,13 +27,38 @@ class ExampleBase(BaseSchema):
 class ExampleCreate(ExampleBase): ...
 
 
+ExampleColumns: type[BaseSchema] = columnar(ExampleCreate)
+
+
+class ExampleUpsert(ExampleBase):
+	"""A row of a merge, keyed by its id so re-loads are idempotent."""
+
+	id: UUID = Field(description="Id", examples=["01a14d20-82aa-7939-97d4-88c4bca5e3b3"])
+
+
 class ExampleUpdate(ExampleBase): ...
 
 
+class ExampleBulkUpdate(ExampleUpdate):
+	"""Changes to a single record of a bulk update."""
+
+	id: UUID = Field(description="Id", examples=["01a14d20-82aa-7939-97d4-88c4bca5e3b3"])
+
+
 class ExampleResponse(ExampleBase, OutSchema): ...
 
 
-class ExampleQueryParams(BaseQueryParams, ExampleBase): ...
+class ExampleQueryParams(BaseQueryParams, ExampleBase):
+	# Only columns leading an index of the table, see ix_example_*
+	order_by: Literal["id", "created_at"] = Field(
+		default="id", description="Column the results are sorted by"
+	)
+
+
+class ExampleFilterParams(ExampleBase): ...
+
+
+class ExampleExportParams(BaseExportParams, ExampleBase): ...
 
 
 ExampleCollectionOut: TypeAdapter[list[ExampleResponse]] = TypeAdapter(
@@ -0,0 +1,43 @@
+from collections.abc import Mapping
+from enum import StrEnum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.domain.schemas.base import parse_fields
+
+
+class ExportFormat(StrEnum):
+	NDJSON = "ndjson"
+	CSV = "csv"
+
+	@property
+	def media_type(self) -> str:
+		return {"ndjson": "application/x-ndjson", "csv": "text/csv"}[self.value]
+
+
+class BaseExportParams(BaseModel):
+	"""Schema for the controls of an export, any other field is a filter."""
+
+	format: ExportFormat = ExportFormat.NDJSON
+	fields: str | None = Field(
+		default=None,
+		description="Comma separated fields to export, all of them when omitted",
+		examples=["id,name"],
+	)
+
+	def filters(self) -> dict[str, Any]:
+		"""Returns only the filtering fields, without export controls."""
+		return self.model_dump(
+			exclude_none=True, exclude=set(BaseExportParams.model_fields)
+		)
+
+	def selected_fields(self) -> tuple[str, ...] | None:
+		"""Returns the fields asked for by `fields`, None when it selects all."""
+		return parse_fields(self.fields)
+
+	@classmethod
+	def filter_expressions(cls, query: Mapping[str, str]) -> dict[str, str]:
+		"""Returns the `field__op=value` filters of a raw query string, see
+		`BaseQueryParams.filter_expressions`."""
+		return {key: value for key, value in query.items() if key not in cls.model_fields}
@@ -0,0 +1,32 @@
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import UUID4, Field, NonNegativeFloat, NonNegativeInt
+
+from app.domain.schemas.base import BaseSchema
+
+
+class JobStatus(StrEnum):
+	PENDING = "pending"
+	RUNNING = "running"
+	SUCCEEDED = "succeeded"
+	FAILED = "failed"
+
+
+class JobResponse(BaseSchema):
+	"""Represents the state of a background job."""
+
+	id: UUID4 = Field(description="Job id, used to poll its status")
+	kind: str = Field(description="What the job does", examples=["example.bulk_insert"])
+	status: JobStatus = Field(description="Current job status")
+	total_rows: NonNegativeInt = Field(description="Rows submitted", examples=[50000])
+	inserted_rows: NonNegativeInt = Field(
+		description="Rows loaded so far", examples=[25000]
+	)
+	progress: NonNegativeFloat = Field(
+		description="Fraction of rows loaded, from 0 to 1", examples=[0.5]
+	)
+	errors: list[str] = Field(description="Errors that made the job fail")
+	created_at: datetime = Field()
+	started_at: datetime | None = Field(default=None)
+	finished_at: datetime | None = Field(default=None)
@@ -1 +1,105 @@
-#  TODO: CURSOR-BASED PAGINATION
+"""app/domain/schemas/pagination.py"""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from collections.abc import Mapping, Sequence
+from enum import StrEnum
+from functools import partial
+from typing import Any, Self
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.core.exceptions.query import InvalidCursorError
+
+
+class PaginationMode(StrEnum):
+	OFFSET = "offset"
+	CURSOR = "cursor"
+
+
+class CountMode(StrEnum):
+	EXACT = "exact"
+	ESTIMATED = "estimated"
+	CACHED = "cached"
+
+
+class SortDirection(StrEnum):
+	ASC = "asc"
+	DESC = "desc"
+
+
+class CursorDirection(StrEnum):
+	NEXT = "next"
+	PREVIOUS = "previous"
+
+
+class Cursor(BaseModel):
+	"""Opaque keyset position over `(order_by, id)`, or `id` alone when
+	ordering by id, which is time ordered since ids are UUIDv7.
+
+	Clients only ever see the encoded token, so the seek key can change
+	without breaking the public contract.
+	"""
+
+	id: UUID = Field()
+	order_by: str = Field(default="id")
+	# The `order_by` value of the row, as JSON: parsed back to the column type
+	value: Any = Field(default=None)
+	direction: CursorDirection = Field(default=CursorDirection.NEXT)
+
+	@classmethod
+	def at(cls, row: Any, direction: CursorDirection, order_by: str = "id") -> Self:
+		"""Builds a cursor positioned on the given row, an object or a mapping."""
+		get: Any = row.__getitem__ if isinstance(row, Mapping) else partial(getattr, row)
+		return cls(
+			id=get("id"),
+			order_by=order_by,
+			value=None if order_by == "id" else get(order_by),
+			direction=direction,
+		)
+
+	def encode(self) -> str:
+		"""Serializes the cursor into an url-safe token."""
+		raw: bytes = self.model_dump_json().encode()
+		return urlsafe_b64encode(raw).decode().rstrip("=")
+
+	@classmethod
+	def decode(cls, token: str) -> Self:
+		"""Parses a token produced by `encode`.
+
+		Raises:
+		    InvalidCursorError: If the token is malformed or was tampered with.
+		"""
+		padded: str = token + "=" * (-len(token) % 4)
+		try:
+			return cls.model_validate_json(urlsafe_b64decode(padded))
+		except (Base64Error, ValueError) as exc:
+			raise InvalidCursorError from exc
+
+
+def page_cursors(
+	rows: Sequence[Any], limit: int, current: Cursor | None, order_by: str = "id"
+) -> tuple[Cursor | None, Cursor | None]:
+	"""Returns the `(previous, next)` cursors surrounding a keyset page.
+
+	A page shorter than `limit` means there is nothing left in the direction
+	it was read, so no cursor is emitted on that side.
+	"""
+	if not rows:
+		return None, None
+
+	full_page: bool = len(rows) >= limit
+	backwards: bool = (
+		current is not None and current.direction == CursorDirection.PREVIOUS
+	)
+	has_previous: bool = full_page if backwards else current is not None
+	has_next: bool = True if backwards else full_page
+
+	previous_cursor: Cursor | None = (
+		Cursor.at(rows[0], CursorDirection.PREVIOUS, order_by) if has_previous else None
+	)
+	next_cursor: Cursor | None = (
+		Cursor.at(rows[-1], CursorDirection.NEXT, order_by) if has_next else None
+	)
+	return previous_cursor, next_cursor
@@ -1,4 +1,11 @@
-from pydantic import BaseModel, NonNegativeInt
+from collections.abc import Mapping
+from typing import Any, Self
+
+from pydantic import BaseModel, Field, NonNegativeInt, model_validator
+
+from app.core.config import settings
+from app.domain.schemas.base import parse_fields
+from app.domain.schemas.pagination import CountMode, PaginationMode, SortDirection
 
 
 class BaseQueryParams(BaseModel):
@@ -6,4 +13,39 @@ class BaseQueryParams(BaseModel):
 
 	offset: NonNegativeInt = 0
 	limit: NonNegativeInt = 10
-	# order_by: Literal["created_at", "updated_at"] = "created_at"
+	pagination: PaginationMode = PaginationMode.OFFSET
+	cursor: str | None = None
+	count_mode: CountMode = CountMode(settings.DEFAULT_COUNT_MODE)
+	# Narrowed by each resource to the columns an index can sort, ties
+	# (and the cursor) are broken by id
+	order_by: str = "id"
+	direction: SortDirection = SortDirection.ASC
+	fields: str | None = Field(
+		default=None,
+		description="Comma separated fields to return, all of them when omitted",
+		examples=["id,name"],
+	)
+
+	@model_validator(mode="after")
+	def cursor_implies_keyset(self) -> Self:
+		"""A cursor is only meaningful in keyset mode, so it switches to it."""
+		if self.cursor is not None:
+			self.pagination = PaginationMode.CURSOR
+		return self
+
+	def filters(self) -> dict[str, Any]:
+		"""Returns only the filtering fields, without pagination controls."""
+		return self.model_dump(
+			exclude_none=True, exclude=set(BaseQueryParams.model_fields)
+		)
+
+	def selected_fields(self) -> tuple[str, ...] | None:
+		"""Returns the fields asked for by `fields`, None when it selects all."""
+		return parse_fields(self.fields)
+
+	@classmethod
+	def filter_expressions(cls, query: Mapping[str, str]) -> dict[str, str]:
+		"""Returns the `field__op=value` filters of a raw query string, i.e.
+		every parameter this schema does not declare. They are validated, and
+		unknown ones rejected, when the query is built."""
+		return {key: value for key, value in query.items() if key not in cls.model_fields}
@@ -0,0 +1,39 @@
+"""app/domain/usecases/cache.py"""
+
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.domain.schemas.cache import CacheStatsOut, CacheStatsResponse
+from app.infra.cache.base import CacheBackend, CacheStats
+from app.infra.cache.entity import EntityCache, get_entity_cache
+from app.infra.cache.query import QueryCache, get_query_cache
+
+
+class CacheUsecase:
+	"""Exposes the state of the application caches."""
+
+	@staticmethod
+	async def _stats_out(backend: CacheBackend) -> CacheStatsOut:
+		stats: CacheStats = await backend.stats()
+		lookups: int = stats.hits + stats.misses
+		return CacheStatsOut(
+			backend=backend.name,
+			hits=stats.hits,
+			misses=stats.misses,
+			evictions=stats.evictions,
+			size=stats.size,
+			hit_ratio=stats.hits / lookups if lookups else 0.0,
+			available=stats.available,
+		)
+
+	async def stats(self) -> CacheStatsResponse:
+		entity_cache: EntityCache | None = get_entity_cache()
+		query_cache: QueryCache | None = get_query_cache()
+		return CacheStatsResponse(
+			entity=await self._stats_out(entity_cache.backend) if entity_cache else None,
+			query=await self._stats_out(query_cache.backend) if query_cache else None,
+		)
+
+
+CacheUsecaseDependency = Annotated[CacheUsecase, Depends()]
@@ -1,97 +1,403 @@
 """app/domain/usecases/example.py"""
 
-from collections.abc import Generator, Iterator
+import json
+from collections.abc import (
+	AsyncGenerator,
+	AsyncIterable,
+	AsyncIterator,
+	Generator,
+	Iterator,
+	Mapping,
+	Sequence,
+)
+from datetime import datetime
 from itertools import chain
 from timeit import default_timer
 from typing import Annotated, Any
+from uuid import UUID
 
 from asyncpg.exceptions import PostgresError
 from fastapi import Depends, Request
-from pydantic import UUID4
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from app.core.conditional import entity_tag
+from app.core.config import settings
 from app.core.exceptions.db import (
 	DBOperationError,
 	ObjectAlreadyExistError,
 	ObjectNotFound,
 )
+from app.core.exceptions.payload import InvalidPayloadError, UnsupportedMediaTypeError
+from app.core.exceptions.query import InvalidFilterError
 from app.core.i18n.manager import _
 from app.core.logging import logger
+from app.core.streaming import iter_json_stream
 from app.domain.models.example import ExampleModel
-from app.domain.schemas.bulk_insert import BulkInsertCreate, BulkInsertResponse
+from app.domain.schemas.base import BaseSchema, parse_fields, project, row_encoder
+from app.domain.schemas.batch import BatchResponse
+from app.domain.schemas.bulk_delete import BulkDeleteResponse
+from app.domain.schemas.bulk_insert import (
+	BulkInsertColumnar,
+	BulkInsertCreate,
+	BulkInsertResponse,
+	OnConflict,
+)
+from app.domain.schemas.bulk_update import BulkUpdate, BulkUpdateResponse
 from app.domain.schemas.collection_reponse import CollectionResponse
 from app.domain.schemas.example import (
+	ExampleBulkUpdate,
 	ExampleCollectionOut,
+	ExampleColumns,
 	ExampleCreate,
+	ExampleExportParams,
+	ExampleFilterParams,
 	ExampleQueryParams,
 	ExampleResponse,
 	ExampleUpdate,
+	ExampleUpsert,
+)
+from app.domain.schemas.export import ExportFormat
+from app.domain.schemas.job import JobResponse
+from app.domain.schemas.pagination import (
+	CountMode,
+	Cursor,
+	PaginationMode,
+	page_cursors,
 )
+from app.infra.db.helpers.copy import CopyStats, MergeStats
+from app.infra.db.helpers.counting import CountCache
+from app.infra.jobs.runner import JobRunnerDependency, ProgressCallback
+from app.infra.jobs.store import Job
 from app.infra.repositories.example import ExampleRepositoryDependency
 
+# Columns a page is validated on, see `ExampleUsecase.page_tag`
+PAGE_VALIDATORS: tuple[str, ...] = ("id", "updated_at")
+
+
+def with_validators(
+	fields: tuple[str, ...], validators: tuple[str, ...]
+) -> tuple[str, ...]:
+	"""Adds the validator columns to a sparse fieldset, once. The response
+	schema leaves them out again."""
+	return tuple(dict.fromkeys((*fields, *validators)))
+
 
 class ExampleUsecase:
 	"""Handles business logic for example table."""
 
-	def __init__(self, example_repository: ExampleRepositoryDependency) -> None:
+	def __init__(
+		self,
+		example_repository: ExampleRepositoryDependency,
+		job_runner: JobRunnerDependency,
+	) -> None:
 		"""Initializes the usecase with example repository.
 
 		Args:
 		    example_repository (ExampleRepositoryDependency):
 				Repository for accessing example data.
+		    job_runner (JobRunnerDependency):
+				Worker pool running background jobs.
 		"""
 		self.example_repository = example_repository
+		self.job_runner = job_runner
+		self._counts: dict[tuple[str, CountMode], int] = {}
+		self._modified: dict[UUID, datetime] = {}
+		self._page_tags: dict[str, str] = {}
+
+	async def get(self, id: UUID, fields: str | None = None) -> BaseSchema:
+		"""Retrieves an example, projected onto `fields` when given.
+
+		`updated_at` is always read, so `modified_at` can then answer
+		without another round trip.
+		"""
 
-	async def get(self, id: UUID4) -> ExampleResponse:
 		method_path: str = "ExampleUsecase.get"
+		selected: tuple[str, ...] | None = parse_fields(fields)
+		schema: type[BaseSchema] = (
+			project(ExampleResponse, selected) if selected else ExampleResponse
+		)
 		try:
 			example_model: ExampleModel | None = await self.example_repository.get(
-				filters={"id": id}
+				filters={"id": id},
+				fields=with_validators(selected, ("updated_at",)) if selected else None,
 			)  # type: ignore
 			if not example_model:
 				raise ObjectNotFound
-			return ExampleResponse.model_validate(example_model)
+			self._modified[id] = example_model.updated_at
+			return schema.model_validate(example_model)
 		except SQLAlchemyError as exc:
 			raise DBOperationError(
 				message=f"{_("SQLAlchemy error occurred")} in {method_path}: {exc}"
 			)
 
+	async def modified_at(self, id: UUID) -> datetime:
+		"""Returns when an example last changed, without loading it. After
+		`get` the value it read is returned, without a round trip."""
+
+		method_path: str = "ExampleUsecase.modified_at"
+		if id in self._modified:
+			return self._modified[id]
+		try:
+			updated_at: datetime | None = await self.example_repository.modified_at(
+				filters={"id": id}
+			)
+		except SQLAlchemyError as exc:
+			raise DBOperationError(
+				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
+			)
+		if updated_at is None:
+			raise ObjectNotFound
+		self._modified[id] = updated_at
+		return updated_at
+
+	async def get_many(self, ids: list[UUID]) -> BatchResponse[ExampleResponse]:
+		"""Retrieves several examples with a single query.
+
+		Results follow the order of `ids`, without repeats; unknown ids are
+		listed as missing instead of failing the whole batch.
+		"""
+
+		method_path: str = "ExampleUsecase.get_many"
+		requested: list[UUID] = list(dict.fromkeys(ids))
+		try:
+			example_models: list[ExampleModel] = await self.example_repository.get_many(
+				ids=requested
+			)
+		except SQLAlchemyError as exc:
+			raise DBOperationError(
+				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
+			)
+
+		found: dict[UUID, ExampleModel] = {model.id: model for model in example_models}
+		return BatchResponse[ExampleResponse](
+			results=ExampleCollectionOut.validate_python(
+				[found[id] for id in requested if id in found]
+			),
+			missing=[id for id in requested if id not in found],
+		)
+
 	async def query(
 		self, query_params: ExampleQueryParams, request: Request
-	) -> CollectionResponse[ExampleResponse]:
-		"""Executes a query to retrieve examples based on the provided parameters."""
+	) -> CollectionResponse[BaseSchema]:
+		"""Executes a query to retrieve examples based on the provided parameters.
+
+		With `fields`, only those columns are read and each result holds
+		just them, skipping the ORM for plain rows.
+		"""
 
 		method_path: str = "ExampleUsecase.query"
-		filter_params = query_params.model_dump(exclude_none=True)
+		filter_params, count_filters = self._query_filters(query_params, request)
+		fields: tuple[str, ...] | None = query_params.selected_fields()
+		schema: type[BaseSchema] = (
+			project(ExampleResponse, fields) if fields else ExampleResponse
+		)
 		try:
 			example_models: list[ExampleModel] = await self.example_repository.query(
 				filter_params=filter_params,
+				fields=with_validators(fields, PAGE_VALIDATORS) if fields else None,
 			)  # type: ignore
-			examples_response: list[ExampleResponse] = (
-				ExampleCollectionOut.validate_python(example_models)
+			count: int = await self._count(
+				filters=count_filters, mode=query_params.count_mode
+			)
+			self._page_tags[str(request.url)] = self._page_tag(
+				request, count, example_models
+			)
+			examples_response: list[BaseSchema] = (
+				[schema.model_validate(row) for row in example_models]
+				if fields
+				else ExampleCollectionOut.validate_python(example_models)
 			)
 		except SQLAlchemyError as exc:
 			raise DBOperationError(
 				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
 			)
-		return CollectionResponse[ExampleResponse].parse_collection(
+
+		previous_cursor: Cursor | None = None
+		next_cursor: Cursor | None = None
+		if query_params.pagination == PaginationMode.CURSOR:
+			current: Cursor | None = (
+				Cursor.decode(query_params.cursor) if query_params.cursor else None
+			)
+			previous_cursor, next_cursor = page_cursors(
+				rows=example_models,
+				limit=query_params.limit,
+				current=current,
+				order_by=query_params.order_by,
+			)
+
+		return CollectionResponse[schema].parse_collection(
 			request=request,
 			results=examples_response,
 			query_params=query_params,
-			count=len(examples_response),
+			count=count,
+			previous_cursor=previous_cursor,
+			next_cursor=next_cursor,
 		)
 
+	async def query_json(
+		self, query_params: ExampleQueryParams, request: Request
+	) -> bytes:
+		"""Same response body as `query`, serialized straight from driver rows.
+
+		Rows never become ORM instances or Pydantic models: they are read on
+		the raw connection and encoded by the collection's cached serializer.
+		"""
+
+		method_path: str = "ExampleUsecase.query_json"
+		filter_params, count_filters = self._query_filters(query_params, request)
+		fields: tuple[str, ...] | None = query_params.selected_fields()
+		schema: type[BaseSchema] = (
+			project(ExampleResponse, fields) if fields else ExampleResponse
+		)
+		try:
+			rows: list[dict[str, Any]] = await self.example_repository.query_raw(
+				filter_params=filter_params,
+				fields=list(with_validators(tuple(schema.model_fields), PAGE_VALIDATORS)),
+			)
+			count: int = await self._count(
+				filters=count_filters, mode=query_params.count_mode
+			)
+			self._page_tags[str(request.url)] = self._page_tag(request, count, rows)
+		except SQLAlchemyError as exc:
+			raise DBOperationError(
+				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
+			)
+
+		previous_cursor: Cursor | None = None
+		next_cursor: Cursor | None = None
+		if query_params.pagination == PaginationMode.CURSOR:
+			current: Cursor | None = (
+				Cursor.decode(query_params.cursor) if query_params.cursor else None
+			)
+			previous_cursor, next_cursor = page_cursors(
+				rows=rows,
+				limit=query_params.limit,
+				current=current,
+				order_by=query_params.order_by,
+			)
+
+		return CollectionResponse[schema].dump_rows(
+			request=request,
+			rows=rows,
+			query_params=query_params,
+			count=count,
+			previous_cursor=previous_cursor,
+			next_cursor=next_cursor,
+		)
+
+	async def page_tag(self, query_params: ExampleQueryParams, request: Request) -> str:
+		"""Returns the ETag of a collection page from the id and `updated_at`
+		of its rows and the collection count.
+
+		Rows added to, changed in or removed from the page, and any change of
+		the count, all yield a new tag. After `query` or `query_json` the tag
+		of the page they read is returned; otherwise only those two columns
+		of the page are read.
+		"""
+
+		method_path: str = "ExampleUsecase.page_tag"
+		if str(request.url) in self._page_tags:
+			return self._page_tags[str(request.url)]
+		filter_params, count_filters = self._query_filters(query_params, request)
+		try:
+			rows: list[Any] = await self.example_repository.query(
+				filter_params=filter_params, fields=PAGE_VALIDATORS
+			)
+			count: int = await self._count(
+				filters=count_filters, mode=query_params.count_mode
+			)
+		except SQLAlchemyError as exc:
+			raise DBOperationError(
+				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
+			)
+		self._page_tags[str(request.url)] = self._page_tag(request, count, rows)
+		return self._page_tags[str(request.url)]
+
+	@staticmethod
+	def _page_tag(request: Request, count: int, rows: Sequence[Any]) -> str:
+		validators: list[tuple[Any, ...]] = [
+			(row["id"], row["updated_at"].timestamp())
+			if isinstance(row, Mapping)
+			else (row.id, row.updated_at.timestamp())
+			for row in rows
+		]
+		return entity_tag(request.url, count, *validators)
+
+	async def _count(self, filters: dict[str, Any], mode: CountMode) -> int:
+		"""Counts once per request: validating a page and reading it need
+		the same count."""
+
+		key: tuple[str, CountMode] = (CountCache.make_key(filters), mode)
+		if key not in self._counts:
+			self._counts[key] = await self.example_repository.count(
+				filters=filters, mode=mode
+			)
+		return self._counts[key]
+
+	def export(
+		self, export_params: ExampleExportParams, request: Request
+	) -> AsyncIterator[bytes]:
+		"""Streams every example matching the filters as NDJSON or CSV.
+
+		The query is built, and filters and fields validated, before the
+		first byte is sent. NDJSON lines are encoded like the JSON API
+		resources; CSV comes straight from `COPY TO`, in Postgres' text
+		format for each column.
+		"""
+
+		fields: tuple[str, ...] | None = export_params.selected_fields()
+		schema: type[BaseSchema] = (
+			project(ExampleResponse, fields) if fields else ExampleResponse
+		)
+		filters: dict[str, Any] = {
+			**export_params.filters(),
+			**export_params.filter_expressions(request.query_params),
+		}
+		query: Select[Any] = self.example_repository.export_query(
+			filters=filters, fields=list(schema.model_fields)
+		)
+		if export_params.format == ExportFormat.CSV:
+			return self.example_repository.copy_to(query=query)
+		return self._ndjson(query=query, schema=schema)
+
+	async def _ndjson(
+		self, query: Select[Any], schema: type[BaseSchema]
+	) -> AsyncGenerator[bytes]:
+		encoder: TypeAdapter[Any] = row_encoder(schema)
+		async for rows in self.example_repository.stream(
+			query=query, batch_size=settings.EXPORT_BATCH_SIZE
+		):
+			yield b"".join(encoder.dump_json(row) + b"\n" for row in rows)
+
+	@staticmethod
+	def _query_filters(
+		query_params: ExampleQueryParams, request: Request
+	) -> tuple[dict[str, Any], dict[str, Any]]:
+		"""Returns the filters of a page query and those of its count.
+
+		Besides the declared fields, any `field__op=value` of the query
+		string is a filter.
+		"""
+		expressions: dict[str, str] = query_params.filter_expressions(
+			request.query_params
+		)
+		filter_params: dict[str, Any] = {
+			**query_params.model_dump(
+				exclude_none=True, exclude={"count_mode", "fields"}
+			),
+			**expressions,
+		}
+		return filter_params, {**query_params.filters(), **expressions}
+
 	async def create(self, data: ExampleCreate) -> ExampleResponse:
 		method_path: str = "ExampleUsecase.create"
 		try:
-			async with self.example_repository.transaction() as transaction:
-				example_model: ExampleModel = ExampleModel(**data.model_dump())
-				await self.example_repository.create(
-					orm_model=example_model,
-					transaction=transaction,  # type: ignore
-				)
-				await transaction.flush()
-				return ExampleResponse.model_validate(example_model)
+			row: dict[str, Any] = await self.example_repository.create_returning(
+				values=data.model_dump()
+			)
+			return ExampleResponse.model_validate(row)
 		except IntegrityError:
 			raise ObjectAlreadyExistError
 		except SQLAlchemyError as exc:
@@ -114,7 +420,7 @@ class ExampleUsecase:
 
 		try:
 			logger.info("Performing bulk insert...")
-			await self.example_repository.bulk_insert_copy(
+			stats: CopyStats = await self.example_repository.bulk_insert_copy(
 				table=self.example_repository.orm_model.__tablename__,
 				columns=columns,
 				data=prepared_data_iter,
@@ -123,9 +429,11 @@ class ExampleUsecase:
 			elapsed_time: float = end - start
 			logger.info(f"Bulk insert finished. Elapsed time: {elapsed_time}")
 
-			# FUTURE: to use a worker for scheduling this
-			# task and change response schema
-			return BulkInsertResponse(elapsed_time=elapsed_time)
+			return BulkInsertResponse(
+				inserted_rows=stats.rows,
+				elapsed_time=elapsed_time,
+				connections=stats.connections,
+			)
 		except (SQLAlchemyError, PostgresError) as exc:
 			error_type: str = (
 				"SQLAlchemy" if isinstance(exc, SQLAlchemyError) else "Postgres"
@@ -134,17 +442,161 @@ class ExampleUsecase:
 				message=f"{error_type} error occurred in {method_path}: {exc}"
 			)
 
-	async def partial_update(self, data: ExampleUpdate, id: UUID4) -> ExampleResponse:
+	async def bulk_insert_columnar(
+		self, data: BulkInsertColumnar[ExampleColumns]
+	) -> BulkInsertResponse:
+		"""Loads a column-oriented payload, already validated column by column."""
+
+		method_path: str = "ExampleUsecase.bulk_insert_columnar"
+
+		start: float = default_timer()
+		try:
+			logger.info("Performing columnar bulk insert...")
+			stats: CopyStats = await self.example_repository.bulk_insert_columns(
+				table=self.example_repository.orm_model.__tablename__,
+				columns=data.to_columns(),
+			)
+			elapsed_time: float = default_timer() - start
+			logger.info(f"Columnar bulk insert finished. Elapsed time: {elapsed_time}")
+			return BulkInsertResponse(
+				inserted_rows=stats.rows,
+				elapsed_time=elapsed_time,
+				connections=stats.connections,
+			)
+		except (SQLAlchemyError, PostgresError) as exc:
+			error_type: str = (
+				"SQLAlchemy" if isinstance(exc, SQLAlchemyError) else "Postgres"
+			)
+			raise DBOperationError(
+				message=f"{error_type} error occurred in {method_path}: {exc}"
+			)
+
+	async def bulk_merge(
+		self, data: BulkInsertCreate[ExampleUpsert], on_conflict: OnConflict
+	) -> BulkInsertResponse:
+		"""Merges rows by id: new ones are inserted, existing ones updated or
+		left alone depending on `on_conflict`."""
+
+		method_path: str = "ExampleUsecase.bulk_merge"
+
+		try:
+			logger.info("Performing bulk merge...")
+			stats: MergeStats = await self.example_repository.bulk_merge_copy(
+				columns=list(ExampleUpsert.model_fields),
+				data=(item.model_dump() for item in data.items),
+				key="id",
+				on_conflict=on_conflict,
+			)
+			logger.info(f"Bulk merge finished. Elapsed time: {stats.elapsed}")
+			return BulkInsertResponse(
+				inserted_rows=stats.inserted,
+				updated_rows=stats.updated,
+				skipped_rows=stats.skipped,
+				elapsed_time=stats.elapsed,
+			)
+		except (SQLAlchemyError, PostgresError) as exc:
+			error_type: str = (
+				"SQLAlchemy" if isinstance(exc, SQLAlchemyError) else "Postgres"
+			)
+			raise DBOperationError(
+				message=f"{error_type} error occurred in {method_path}: {exc}"
+			)
+
+	async def submit_bulk_insert(
+		self, data: BulkInsertCreate[ExampleCreate]
+	) -> JobResponse:
+		"""Schedules a bulk insert as a background job and returns it right away.
+
+		The job status, progress and errors are then polled on `/jobs/{id}`.
+		"""
+		items: list[ExampleCreate] = data.items
+
+		async def work(report: ProgressCallback) -> int:
+			stats: CopyStats = await self.example_repository.bulk_insert_copy(
+				table=self.example_repository.orm_model.__tablename__,
+				columns=list(ExampleCreate.model_fields),
+				data=(item.model_dump() for item in items),
+				on_batch=report,
+			)
+			return stats.rows
+
+		job: Job = await self.job_runner.submit(
+			kind="example.bulk_insert", total_rows=len(items), work=work
+		)
+		return JobResponse.model_validate(job)
+
+	async def bulk_insert_stream(
+		self, chunks: AsyncIterable[bytes], media_type: str
+	) -> BulkInsertResponse:
+		"""Loads rows while the request body is still arriving.
+
+		Rows are validated one at a time and copied in batches, so memory is
+		bounded by the batch size instead of the payload size. An invalid row
+		aborts the whole load.
+		"""
+		method_path: str = "ExampleUsecase.bulk_insert_stream"
+
+		try:
+			items: AsyncGenerator[Any] = iter_json_stream(chunks, media_type)
+		except ValueError:
+			raise UnsupportedMediaTypeError
+
+		async def validated_rows() -> AsyncGenerator[dict[str, Any]]:
+			row: int = 0
+			try:
+				async for item in items:
+					yield ExampleCreate.model_validate(item).model_dump()
+					row += 1
+			except ValidationError as exc:
+				errors = exc.errors(include_url=False, include_context=False)
+				raise InvalidPayloadError(errors=[{"row": row, **err} for err in errors])
+			except json.JSONDecodeError as exc:
+				raise InvalidPayloadError(message=f"{_('Malformed JSON')}: {exc}")
+
+		start: float = default_timer()
+		try:
+			logger.info("Performing streaming bulk insert...")
+			stats: CopyStats = await self.example_repository.bulk_insert_copy(
+				table=self.example_repository.orm_model.__tablename__,
+				columns=list(ExampleCreate.model_fields),
+				data=validated_rows(),
+			)
+			elapsed_time: float = default_timer() - start
+			logger.info(f"Streaming bulk insert finished. Elapsed time: {elapsed_time}")
+			return BulkInsertResponse(
+				inserted_rows=stats.rows,
+				elapsed_time=elapsed_time,
+				connections=stats.connections,
+			)
+		except (SQLAlchemyError, PostgresError) as exc:
+			error_type: str = (
+				"SQLAlchemy" if isinstance(exc, SQLAlchemyError) else "Postgres"
+			)
+			raise DBOperationError(
+				message=f"{error_type} error occurred in {method_path}: {exc}"
+			)
+
+	async def partial_update(self, data: ExampleUpdate, id: UUID) -> ExampleResponse:
+		"""Writes only the fields the client sent. When they already hold the
+		sent values nothing is written and `updated_at` is kept."""
+
 		method_path: str = "ExampleUsecase.partial_update"
+		changes: dict[str, Any] = data.model_dump(exclude_unset=True)
 		try:
 			async with self.example_repository.transaction() as transaction:
-				example_model: ExampleModel | None = (
-					await self.example_repository.partial_update(
+				example_model: ExampleModel | None = None
+				if changes:
+					example_model = await self.example_repository.partial_update(
 						filters={"id": id},
-						data=data.model_dump(),
+						data=changes,
 						transaction=transaction,
+						skip_unchanged=True,
+					)  # type: ignore
+				if not example_model:
+					# Nothing to change, or the record does not exist
+					example_model = await self.example_repository.get(
+						filters={"id": id}, transaction=transaction
 					)  # type: ignore
-				)
 				if not example_model:
 					raise ObjectNotFound
 				return ExampleResponse.model_validate(example_model)
@@ -153,19 +605,52 @@ class ExampleUsecase:
 				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
 			)
 
-	async def delete(self, id: UUID4) -> None:
+	async def bulk_partial_update(
+		self, data: BulkUpdate[ExampleBulkUpdate]
+	) -> BulkUpdateResponse:
+		"""Applies the changes of every item in one transaction, only the
+		fields each item sets are written."""
+
+		method_path: str = "ExampleUsecase.bulk_partial_update"
+		try:
+			async with self.example_repository.transaction() as transaction:
+				matched, changed = await self.example_repository.bulk_partial_update(
+					changes=[item.model_dump(exclude_unset=True) for item in data.items],
+					transaction=transaction,
+				)
+			return BulkUpdateResponse(matched_rows=matched, changed_rows=changed)
+		except SQLAlchemyError as exc:
+			raise DBOperationError(
+				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
+			)
+
+	async def delete(self, id: UUID) -> None:
 		method_path: str = "ExampleUsecase.delete"
 		try:
 			async with self.example_repository.transaction() as transaction:
-				example_model: ExampleModel | None = await self.example_repository.get(
+				deleted: list[Any] = await self.example_repository.delete(
 					filters={"id": id}, transaction=transaction
-				)  # type: ignore
-				if not example_model:
-					raise ObjectNotFound
-				await self.example_repository.delete(
-					orm_model=example_model,  # type: ignore
-					transaction=transaction,
 				)
+				if not deleted:
+					raise ObjectNotFound
+		except SQLAlchemyError as exc:
+			raise DBOperationError(
+				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
+			)
+
+	async def delete_by_filter(self, filters: ExampleFilterParams) -> BulkDeleteResponse:
+		"""Deletes every example matching filters, in batches of
+		DELETE_BATCH_SIZE rows committed one at a time."""
+
+		method_path: str = "ExampleUsecase.delete_by_filter"
+		filter_params: dict[str, Any] = filters.model_dump(exclude_none=True)
+		if not filter_params:
+			raise InvalidFilterError(message=_("At least one filter is required"))
+		try:
+			deleted_rows: int = await self.example_repository.delete_in_batches(
+				filters=filter_params, batch_size=settings.DELETE_BATCH_SIZE
+			)
+			return BulkDeleteResponse(deleted_rows=deleted_rows)
 		except SQLAlchemyError as exc:
 			raise DBOperationError(
 				message=f"SQLAlchemy error occurred in {method_path}: {exc}"
@@ -0,0 +1,27 @@
+"""app/domain/usecases/job.py"""
+
+from typing import Annotated
+
+from fastapi import Depends
+from pydantic import UUID4
+
+from app.core.exceptions.db import ObjectNotFound
+from app.domain.schemas.job import JobResponse
+from app.infra.jobs.runner import JobRunnerDependency
+from app.infra.jobs.store import Job
+
+
+class JobUsecase:
+	"""Handles the lookup of background jobs."""
+
+	def __init__(self, job_runner: JobRunnerDependency) -> None:
+		self.job_runner = job_runner
+
+	async def get(self, id: UUID4) -> JobResponse:
+		job: Job | None = await self.job_runner.get(id)
+		if not job:
+			raise ObjectNotFound
+		return JobResponse.model_validate(job)
+
+
+JobUsecaseDependency = Annotated[JobUsecase, Depends()]
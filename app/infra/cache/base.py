@@ -0,0 +1,100 @@
+"""app/infra/cache/base.py"""
+
+import secrets
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+from sqlalchemy import Table
+
+
+@dataclass(slots=True)
+class CacheStats:
+	"""Counters used to size a cache: a low hit ratio or many evictions
+	usually mean it is too small for the working set.
+	"""
+
+	hits: int = 0
+	misses: int = 0
+	evictions: int = 0
+	size: int = 0
+	# False when the backend could not be reached to refresh size/evictions
+	available: bool = True
+
+
+def counter_epoch() -> int:
+	"""Starting value of a new counter, leaving room for 2**62 increments
+	within a signed 64-bit integer."""
+	return secrets.randbits(62)
+
+
+@lru_cache
+def row_decoder(table: Table) -> Callable[[dict[str, Any]], dict[str, Any]]:
+	"""Restores the values a JSON backend hands back as strings (UUIDs,
+	datetimes...) to the Python type of their column. Keys keep their order
+	and values already typed, as stored in memory, are left alone."""
+	parsers: dict[str, Callable[[Any], Any]] = {}
+	for column in table.columns:
+		try:
+			python_type: type = column.type.python_type
+		except NotImplementedError:
+			continue
+		if python_type is not str:
+			parsers[column.key] = TypeAdapter(python_type).validate_python
+
+	def decode(row: dict[str, Any]) -> dict[str, Any]:
+		return {
+			key: parsers[key](value)
+			if isinstance(value, str) and key in parsers
+			else value
+			for key, value in row.items()
+		}
+
+	return decode
+
+
+class CacheBackend(ABC):
+	"""Key/value store with per-entry TTL used by the cache layers.
+
+	Values are JSON-compatible: backends storing them out of process may
+	hand UUIDs and datetimes back as strings, see `row_decoder`.
+	"""
+
+	name: str
+
+	def __init__(self) -> None:
+		self._stats = CacheStats()
+
+	@abstractmethod
+	async def get(self, key: str) -> Any | None: ...
+
+	@abstractmethod
+	async def set(self, key: str, value: Any, ttl: float | None = None) -> None: ...
+
+	@abstractmethod
+	async def delete(self, *keys: str) -> None: ...
+
+	@abstractmethod
+	async def clear(self, prefix: str) -> None:
+		"""Removes every entry whose key starts with `prefix`."""
+
+	@abstractmethod
+	async def incr(self, key: str) -> int:
+		"""Atomically increments the counter at `key` and returns it.
+
+		Counters carry no TTL and are kept apart from the entries, so they
+		are not evicted to make room. A missing counter starts from a random
+		epoch: one that is lost anyway (server restart, eviction) cannot come
+		back to a value it held before.
+		"""
+
+	@abstractmethod
+	async def counter(self, key: str) -> int:
+		"""Reads the counter at `key`, starting it from a random epoch when
+		it does not exist."""
+
+	async def stats(self) -> CacheStats:
+		return self._stats
@@ -0,0 +1,96 @@
+"""app/infra/cache/entity.py"""
+
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.infra.cache.base import CacheBackend
+from app.infra.cache.factory import create_backend
+from app.infra.cache.resp import RESP_ERRORS
+
+
+class EntityCache:
+	"""Read-through cache of single rows keyed by table and public id.
+
+	A reader that missed may store a row it read before a write committed,
+	after that write invalidated it. As in the query cache, every
+	invalidation first bumps a version counter of the table: a row is only
+	stored along with the version read before the database was, and a
+	reader finding that the version moved while it stored drops its row
+	again. Writes to other rows of the table only cost such a reader its
+	entry; cached rows are dropped by id.
+
+	A failing backend never fails the request: lookups degrade to misses
+	and the database stays the source of truth.
+	"""
+
+	def __init__(self, backend: CacheBackend) -> None:
+		self.backend = backend
+
+	@staticmethod
+	def namespace(table: str) -> str:
+		return f"entity:{table}:"
+
+	async def get(self, table: str, id: Any) -> dict[str, Any] | None:
+		try:
+			return await self.backend.get(f"{self.namespace(table)}{id}")
+		except RESP_ERRORS as exc:
+			logger.warning(f"Entity cache lookup failed: {exc}")
+			return None
+
+	@staticmethod
+	def version_key(table: str) -> str:
+		# Outside of the namespace, so clearing the table keeps it
+		return f"entity-version:{table}"
+
+	async def version(self, table: str) -> int:
+		"""Returns the current version of the table, to be read before the
+		row and passed back to `set` along with it; -1 when unavailable."""
+		try:
+			return await self.backend.counter(self.version_key(table))
+		except RESP_ERRORS as exc:
+			logger.warning(f"Entity cache lookup failed: {exc}")
+			return -1
+
+	async def set(self, table: str, id: Any, version: int, row: dict[str, Any]) -> None:
+		"""Stores a row read after `version`. Invalidations bump the version
+		before dropping rows, so when it moved by the time the row is stored,
+		the row may predate a write whose invalidation already ran and is
+		dropped here; otherwise that invalidation drops it itself."""
+		if version < 0:
+			return
+		key: str = f"{self.namespace(table)}{id}"
+		try:
+			await self.backend.set(key, row)
+			if await self.backend.counter(self.version_key(table)) != version:
+				await self.backend.delete(key)
+		except RESP_ERRORS as exc:
+			logger.warning(f"Entity cache store failed: {exc}")
+
+	async def invalidate(self, table: str, ids: Iterable[Any] | None = None) -> None:
+		"""Drops the given ids, or every cached row of the table when None,
+		once the version of the table is bumped (see `set`).
+
+		Runs after the write committed, so a failure is only logged and the
+		stale entries are left to expire with their TTL.
+		"""
+		try:
+			await self.backend.incr(self.version_key(table))
+			if ids is None:
+				await self.backend.clear(self.namespace(table))
+			else:
+				await self.backend.delete(*(f"{self.namespace(table)}{id}" for id in ids))
+		except RESP_ERRORS as exc:
+			logger.error(f"Entity cache invalidation failed for {table}: {exc}")
+
+
+@lru_cache
+def get_entity_cache() -> EntityCache | None:
+	backend: CacheBackend | None = create_backend(
+		kind=settings.ENTITY_CACHE_BACKEND,
+		max_size=settings.ENTITY_CACHE_MAX_SIZE,
+		ttl=settings.ENTITY_CACHE_TTL,
+	)
+	return EntityCache(backend=backend) if backend else None
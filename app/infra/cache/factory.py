@@ -0,0 +1,17 @@
+"""app/infra/cache/factory.py"""
+
+from app.infra.cache.base import CacheBackend
+from app.infra.cache.memory import MemoryCache
+from app.infra.cache.redis import RedisCache, get_resp_client
+
+
+def create_backend(kind: str, max_size: int, ttl: float | None) -> CacheBackend | None:
+	"""Builds the configured cache backend, or None when caching is disabled."""
+	if kind == "memory":
+		return MemoryCache(max_size=max_size, ttl=ttl)
+	elif kind == "redis":
+		return RedisCache(client=get_resp_client(), ttl=ttl)
+	elif kind == "none":
+		return None
+	else:
+		raise ValueError(f"Unsupported cache backend: {kind}")
@@ -0,0 +1,75 @@
+"""app/infra/cache/memory.py"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from time import monotonic
+from typing import Any
+
+from app.infra.cache.base import CacheBackend, CacheStats, counter_epoch
+
+
+class MemoryCache(CacheBackend):
+	"""In-process LRU cache with per-entry TTL.
+
+	Entries live in the worker that stored them, so invalidations are not
+	seen by other workers; keep the TTL short when running several.
+	"""
+
+	name: str = "memory"
+
+	def __init__(
+		self,
+		max_size: int,
+		ttl: float | None = None,
+		clock: Callable[[], float] = monotonic,
+	) -> None:
+		super().__init__()
+		self.max_size = max_size
+		self.ttl = ttl
+		self._clock = clock
+		self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+		self._counters: dict[str, int] = {}
+
+	async def get(self, key: str) -> Any | None:
+		entry: tuple[float | None, Any] | None = self._entries.get(key)
+		if entry is None:
+			self._stats.misses += 1
+			return None
+
+		expires_at, value = entry
+		if expires_at is not None and expires_at <= self._clock():
+			del self._entries[key]
+			self._stats.misses += 1
+			return None
+
+		self._entries.move_to_end(key)
+		self._stats.hits += 1
+		return value
+
+	async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+		ttl = ttl if ttl is not None else self.ttl
+		expires_at: float | None = self._clock() + ttl if ttl is not None else None
+		self._entries[key] = (expires_at, value)
+		self._entries.move_to_end(key)
+		while len(self._entries) > self.max_size:
+			self._entries.popitem(last=False)
+			self._stats.evictions += 1
+
+	async def delete(self, *keys: str) -> None:
+		for key in keys:
+			self._entries.pop(key, None)
+
+	async def clear(self, prefix: str) -> None:
+		for key in [key for key in self._entries if key.startswith(prefix)]:
+			del self._entries[key]
+
+	async def incr(self, key: str) -> int:
+		self._counters[key] = await self.counter(key) + 1
+		return self._counters[key]
+
+	async def counter(self, key: str) -> int:
+		return self._counters.setdefault(key, counter_epoch())
+
+	async def stats(self) -> CacheStats:
+		self._stats.size = len(self._entries)
+		return self._stats
@@ -0,0 +1,97 @@
+"""app/infra/cache/query.py"""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.infra.cache.base import CacheBackend
+from app.infra.cache.factory import create_backend
+from app.infra.cache.resp import RESP_ERRORS
+
+type Page = list[dict[str, Any]]
+
+
+class QueryCache:
+	"""Cache of collection pages keyed by table and normalized query params.
+
+	Every table has a version counter that each committed write bumps.
+	Pages are stored with the version read before they were queried and
+	only served while it is still current, so a write makes every page of
+	its table stale at once, without having to know which pages it touched.
+	A lost counter restarts from a random epoch, so pages stored under its
+	old values never become current again.
+
+	A failing backend never fails the request: lookups degrade to misses
+	and the database stays the source of truth.
+	"""
+
+	def __init__(self, backend: CacheBackend) -> None:
+		self.backend = backend
+
+	@staticmethod
+	def namespace(table: str) -> str:
+		return f"query:{table}:"
+
+	@staticmethod
+	def make_key(params: dict[str, Any], fields: Sequence[str] | None = None) -> str:
+		"""Normalizes the filters, pagination and sort of a page (and the
+		selected `fields`) so equivalent queries share one entry."""
+		normalized: str = json.dumps(
+			{"params": params, "fields": list(fields) if fields else None},
+			sort_keys=True,
+			default=str,
+		)
+		return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+	async def get(self, table: str, key: str) -> tuple[int, Page | None]:
+		"""Returns the current version of the table and the page stored
+		under `key`, None when missing or stored at an older version.
+
+		The version must be passed back to `set` along with the page read
+		from the database, so a write landing in between is not hidden.
+		"""
+		try:
+			version: int = await self.backend.counter(f"{self.namespace(table)}version")
+			entry: tuple[int, Page] | None = await self.backend.get(
+				f"{self.namespace(table)}{key}"
+			)
+		except RESP_ERRORS as exc:
+			logger.warning(f"Query cache lookup failed: {exc}")
+			return -1, None
+
+		if entry is None or entry[0] != version:
+			return version, None
+		return version, entry[1]
+
+	async def set(self, table: str, key: str, version: int, page: Page) -> None:
+		if version < 0:
+			return
+		try:
+			await self.backend.set(f"{self.namespace(table)}{key}", (version, page))
+		except RESP_ERRORS as exc:
+			logger.warning(f"Query cache store failed: {exc}")
+
+	async def invalidate(self, table: str) -> None:
+		"""Bumps the version of the table, making every stored page stale.
+
+		Runs after the write committed, so a failure is only logged and the
+		stale pages are left to expire with their TTL.
+		"""
+		try:
+			await self.backend.incr(f"{self.namespace(table)}version")
+		except RESP_ERRORS as exc:
+			logger.error(f"Query cache invalidation failed for {table}: {exc}")
+
+
+@lru_cache
+def get_query_cache() -> QueryCache | None:
+	backend: CacheBackend | None = create_backend(
+		kind=settings.QUERY_CACHE_BACKEND,
+		max_size=settings.QUERY_CACHE_MAX_SIZE,
+		ttl=settings.QUERY_CACHE_TTL,
+	)
+	return QueryCache(backend=backend) if backend else None
@@ -0,0 +1,106 @@
+"""app/infra/cache/redis.py"""
+
+import re
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.infra.cache.base import CacheBackend, CacheStats, counter_epoch
+from app.infra.cache.resp import RESP_ERRORS, RespClient
+
+GLOB_SPECIAL_CHARS: re.Pattern[str] = re.compile(r"([*?\[\]\\])")
+
+
+class RedisCache(CacheBackend):
+	"""Cache backend shared by every worker through a Redis-protocol server.
+
+	Values are stored as JSON, so whoever can write to the server can at
+	worst poison the cache, not run code in the app. A value that does not
+	decode is logged and counted as a miss. Size and evictions are the
+	server's own, which is what matters when sizing `maxmemory`. Counters
+	are stored without a TTL, so a `volatile-*` eviction policy never drops
+	them (see docker-compose.yml); should one be lost anyway, it restarts
+	from a new random epoch rather than from 0.
+	"""
+
+	name: str = "redis"
+
+	def __init__(self, client: RespClient, ttl: float | None = None) -> None:
+		super().__init__()
+		self.client = client
+		self.ttl = ttl
+
+	async def get(self, key: str) -> Any | None:
+		raw: Any = await self.client.execute("GET", key)
+		if raw is None:
+			self._stats.misses += 1
+			return None
+		try:
+			value: Any = from_json(raw)
+		except ValueError as exc:
+			logger.warning(f"Undecodable cache entry at {key}: {exc}")
+			self._stats.misses += 1
+			return None
+		self._stats.hits += 1
+		return value
+
+	async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+		ttl = ttl if ttl is not None else self.ttl
+		args: list[str | bytes | int] = ["SET", key, to_json(value)]
+		if ttl is not None:
+			args.extend(("PX", int(ttl * 1000)))
+		await self.client.execute(*args)
+
+	async def delete(self, *keys: str) -> None:
+		if keys:
+			await self.client.execute("DEL", *keys)
+
+	async def clear(self, prefix: str) -> None:
+		pattern: str = GLOB_SPECIAL_CHARS.sub(r"\\\1", prefix) + "*"
+		cursor: Any = "0"
+		while True:
+			cursor, keys = await self.client.execute(  # type: ignore
+				"SCAN", cursor, "MATCH", pattern, "COUNT", 500
+			)
+			if keys:
+				await self.client.execute("DEL", *keys)
+			if cursor in (b"0", "0"):
+				break
+
+	async def incr(self, key: str) -> int:
+		await self.client.execute("SET", key, counter_epoch(), "NX")
+		return int(await self.client.execute("INCR", key))  # type: ignore
+
+	async def counter(self, key: str) -> int:
+		raw: Any = await self.client.execute("GET", key)
+		if raw is None:
+			# NX: of two workers starting the counter, the first one wins
+			await self.client.execute("SET", key, counter_epoch(), "NX")
+			raw = await self.client.execute("GET", key)
+		return int(raw)
+
+	async def stats(self) -> CacheStats:
+		"""Reads size and evictions from the server. When it cannot be
+		reached, the counters seen by this worker are returned as they are,
+		flagged as unavailable."""
+		try:
+			info: Any = await self.client.execute("INFO", "stats")
+			size: Any = await self.client.execute("DBSIZE")
+		except RESP_ERRORS as exc:
+			logger.warning(f"Redis cache stats unavailable: {exc}")
+			return replace(self._stats, available=False)
+
+		for line in info.decode().splitlines():
+			if line.startswith("evicted_keys:"):
+				self._stats.evictions = int(line.split(":", 1)[1])
+		self._stats.size = int(size)
+		return self._stats
+
+
+@lru_cache
+def get_resp_client() -> RespClient:
+	return RespClient(url=settings.REDIS_URL, timeout=settings.REDIS_TIMEOUT)
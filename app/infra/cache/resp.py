@@ -0,0 +1,126 @@
+"""app/infra/cache/resp.py"""
+
+import asyncio
+from asyncio import StreamReader, StreamWriter
+from urllib.parse import unquote, urlparse
+
+type RespValue = str | int | bytes | list[RespValue] | None
+
+
+class RespError(Exception):
+	"""Error reply sent back by the server."""
+
+
+# What a cache layer treats as the server being unavailable: socket errors and
+# timeouts (TimeoutError is an OSError), a reply cut short (IncompleteReadError
+# is an EOFError) and error replies
+RESP_ERRORS: tuple[type[Exception], ...] = (OSError, EOFError, RespError)
+
+
+class RespClient:
+	"""Minimal asyncio client for the Redis serialization protocol (RESP2).
+
+	It speaks just enough of the protocol for the cache layers, so any
+	Redis-compatible server (Redis, Valkey, KeyDB or a local stand-in used
+	in tests) can back them without an extra dependency.
+
+	Each command, connecting included, must complete within `timeout`
+	seconds, so an unresponsive server fails fast instead of stalling
+	every request that reads through the cache.
+	"""
+
+	def __init__(
+		self, url: str, max_connections: int = 10, timeout: float | None = 1.0
+	) -> None:
+		parsed = urlparse(url)
+		self.host: str = parsed.hostname or "localhost"
+		self.port: int = parsed.port or 6379
+		self.username: str | None = unquote(parsed.username) if parsed.username else None
+		self.password: str | None = unquote(parsed.password) if parsed.password else None
+		self.db: int = int(parsed.path.lstrip("/") or 0)
+		self._idle: list[tuple[StreamReader, StreamWriter]] = []
+		self._slots = asyncio.Semaphore(max_connections)
+		self.timeout = timeout
+
+	async def execute(self, *args: str | bytes | int | float) -> RespValue:
+		"""Sends one command and returns its decoded reply.
+
+		Raises:
+		    RespError: If the server answers with an error reply.
+		    TimeoutError: If the command did not complete within `timeout`.
+		"""
+		async with self._slots, asyncio.timeout(self.timeout):
+			reader, writer = self._idle.pop() if self._idle else await self._connect()
+			try:
+				writer.write(self._encode(args))
+				await writer.drain()
+				reply: RespValue | RespError = await self._read(reader)
+			except BaseException:
+				writer.close()
+				raise
+			self._idle.append((reader, writer))
+
+		if isinstance(reply, RespError):
+			raise reply
+		return reply
+
+	async def close(self) -> None:
+		while self._idle:
+			_, writer = self._idle.pop()
+			writer.close()
+
+	async def _connect(self) -> tuple[StreamReader, StreamWriter]:
+		reader, writer = await asyncio.open_connection(self.host, self.port)
+		handshake: list[tuple[str | int, ...]] = []
+		if self.password:
+			credentials = (
+				(self.username, self.password) if self.username else (self.password,)
+			)
+			handshake.append(("AUTH", *credentials))
+		if self.db:
+			handshake.append(("SELECT", self.db))
+
+		try:
+			for command in handshake:
+				writer.write(self._encode(command))
+				await writer.drain()
+				reply = await self._read(reader)
+				if isinstance(reply, RespError):
+					raise reply
+		except BaseException:
+			writer.close()
+			raise
+		return reader, writer
+
+	@staticmethod
+	def _encode(args: tuple[str | bytes | int | float, ...]) -> bytes:
+		chunks: list[bytes] = [b"*%d\r\n" % len(args)]
+		for arg in args:
+			data: bytes = arg if isinstance(arg, bytes) else str(arg).encode()
+			chunks.append(b"$%d\r\n%s\r\n" % (len(data), data))
+		return b"".join(chunks)
+
+	async def _read(self, reader: StreamReader) -> RespValue | RespError:
+		line: bytes = await reader.readline()
+		if not line:
+			raise ConnectionError("Connection closed by the server")
+
+		kind, payload = line[:1], line[1:-2]
+		if kind == b"+":
+			return payload.decode()
+		elif kind == b"-":
+			return RespError(payload.decode())
+		elif kind == b":":
+			return int(payload)
+		elif kind == b"$":
+			length = int(payload)
+			if length < 0:
+				return None
+			return (await reader.readexactly(length + 2))[:-2]
+		elif kind == b"*":
+			length = int(payload)
+			if length < 0:
+				return None
+			return [await self._read(reader) for _ in range(length)]  # type: ignore
+		else:
+			raise ConnectionError(f"Unexpected reply from server: {line!r}")
@@ -0,0 +1,125 @@
+"""app/infra/db/coalescer.py"""
+
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from sqlalchemy import Table
+from sqlalchemy import insert as sql_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.domain.models.base import uuid7
+from app.infra.db.manager import DatabaseManager
+
+type PendingInsert = tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]
+
+
+class InsertCoalescer:
+	"""Groups concurrent single-row inserts into one multi-row INSERT.
+
+	Inserts arriving within `window` seconds of the first one (or until
+	`max_batch` of them are waiting) are written by a single autocommit
+	`INSERT ... RETURNING`, on one connection. Each row gets its `key`
+	generated here, which is how the returned rows find their caller again.
+
+	A failing statement fails every row in it, so the batch is then retried
+	row by row: callers only ever see the error of their own row.
+	"""
+
+	def __init__(
+		self,
+		table: Table,
+		window: float,
+		max_batch: int,
+		key: str = "id",
+		connect: Callable[
+			[], AbstractAsyncContextManager[AsyncConnection]
+		] = DatabaseManager.autocommit_connection,
+	) -> None:
+		self.table = table
+		self.window = window
+		self.max_batch = max_batch
+		self.key = key
+		self._connect = connect
+		self._pending: list[PendingInsert] = []
+		self._timer: asyncio.TimerHandle | None = None
+		self._tasks: set[asyncio.Task[None]] = set()
+
+	async def insert(self, values: dict[str, Any]) -> dict[str, Any]:
+		"""Queues a row and waits until the batch holding it is written."""
+		loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+		future: asyncio.Future[dict[str, Any]] = loop.create_future()
+		self._pending.append(({self.key: uuid7(), **values}, future))
+
+		if len(self._pending) >= self.max_batch:
+			self._flush()
+		elif self._timer is None:
+			self._timer = loop.call_later(self.window, self._flush)
+		return await future
+
+	def _flush(self) -> None:
+		if self._timer is not None:
+			self._timer.cancel()
+			self._timer = None
+		batch, self._pending = self._pending, []
+		if batch:
+			task: asyncio.Task[None] = asyncio.create_task(self._write(batch))
+			self._tasks.add(task)
+			task.add_done_callback(self._tasks.discard)
+
+	async def _write(self, batch: list[PendingInsert]) -> None:
+		try:
+			async with self._connect() as connection:
+				result = await connection.execute(
+					sql_insert(self.table).returning(*self.table.c),
+					[values for values, _ in batch],
+				)
+				rows: dict[Any, dict[str, Any]] = {
+					row[self.key]: dict(row) for row in result.mappings()
+				}
+		except Exception as exc:
+			if len(batch) == 1:
+				_, future = batch[0]
+				if not future.done():
+					future.set_exception(exc)
+				return
+			logger.warning(
+				f"Coalesced insert of {len(batch)} rows failed, retrying each: {exc}"
+			)
+			await asyncio.gather(*(self._write([pending]) for pending in batch))
+			return
+
+		for values, future in batch:
+			if not future.done():
+				future.set_result(rows[values[self.key]])
+
+	async def close(self) -> None:
+		"""Writes the rows still waiting for their window and awaits them."""
+		self._flush()
+		if self._tasks:
+			await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+_coalescers: dict[str, InsertCoalescer] = {}
+
+
+def get_insert_coalescer(table: Table) -> InsertCoalescer | None:
+	"""Returns the coalescer of `table`, None unless INSERT_COALESCING is on."""
+	if not settings.INSERT_COALESCING:
+		return None
+	if table.name not in _coalescers:
+		_coalescers[table.name] = InsertCoalescer(
+			table=table,
+			window=settings.INSERT_COALESCE_WINDOW_MS / 1000,
+			max_batch=settings.INSERT_COALESCE_MAX_BATCH,
+		)
+	return _coalescers[table.name]
+
+
+async def close_insert_coalescers() -> None:
+	for coalescer in _coalescers.values():
+		await coalescer.close()
+	_coalescers.clear()
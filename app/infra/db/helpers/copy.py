@@ -0,0 +1,295 @@
+"""app/infra/db/helpers/copy.py"""
+
+import asyncio
+from collections.abc import (
+	AsyncGenerator,
+	AsyncIterable,
+	Awaitable,
+	Callable,
+	Iterable,
+	Iterator,
+	Sequence,
+)
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, suppress
+from dataclasses import dataclass, field
+from itertools import islice
+from timeit import default_timer
+from typing import Any
+
+from asyncpg import Connection
+from asyncpg.transaction import Transaction
+from sqlalchemy import Table, column, func, literal_column, not_, select, table, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import ClauseElement
+
+type Record = tuple[Any, ...]
+type Batch = list[Record]
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+	"""Work done by one connection of a COPY."""
+
+	rows: int = 0
+	batches: int = 0
+	# Time spent inside COPY, waiting on the queue is not counted
+	seconds: float = 0.0
+
+	@property
+	def rows_per_second(self) -> float:
+		return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass(slots=True)
+class CopyStats:
+	"""Outcome of a COPY, `rows` is the total copied."""
+
+	rows: int = 0
+	elapsed: float = 0.0
+	connections: list[ConnectionStats] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class MergeStats:
+	"""Outcome of a merge, rows that were neither inserted nor updated are skipped."""
+
+	staged: int = 0
+	inserted: int = 0
+	updated: int = 0
+	elapsed: float = 0.0
+
+	@property
+	def skipped(self) -> int:
+		return self.staged - self.inserted - self.updated
+
+
+def as_records(
+	data: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]], columns: list[str]
+) -> Iterable[Record] | AsyncIterable[Record]:
+	"""Lays out mappings as COPY records, missing keys become NULL."""
+
+	if isinstance(data, AsyncIterable):
+		return (tuple(item.get(col) for col in columns) async for item in data)
+	return (tuple(item.get(col) for col in columns) for item in data)
+
+
+async def iter_batches(
+	records: Iterable[Record] | AsyncIterable[Record], size: int
+) -> AsyncGenerator[Batch]:
+	"""Generates batches of size `size` from any record stream."""
+
+	if isinstance(records, AsyncIterable):
+		batch: Batch = []
+		async for record in records:
+			batch.append(record)
+			if len(batch) == size:
+				yield batch
+				batch = []
+		if batch:
+			yield batch
+		return
+
+	it: Iterator[Record] = iter(records)
+	while True:
+		batch = list(islice(it, size))
+		if not batch:
+			break
+		yield batch
+
+
+async def parallel_copy(
+	connect: Callable[[], AbstractAsyncContextManager[Connection]],
+	table: str,
+	columns: list[str],
+	batches: AsyncIterable[Batch],
+	workers: int,
+	max_in_flight: int,
+	on_batch: Callable[[int], Awaitable[None]] | None = None,
+) -> CopyStats:
+	"""Spreads COPY batches across `workers` connections.
+
+	Batches go through a queue of at most `max_in_flight` entries, so a fast
+	producer waits for the connections instead of buffering the payload.
+	Every connection copies inside its own transaction: if any of them (or
+	the producer) fails, the others are cancelled and all transactions are
+	rolled back. The transactions are only committed once every batch has
+	been copied; a connection lost during those final commits is the one
+	window where part of the load can persist.
+	"""
+
+	queue: asyncio.Queue[Batch | None] = asyncio.Queue(maxsize=max_in_flight)
+	stats: CopyStats = CopyStats(connections=[ConnectionStats() for _ in range(workers)])
+	start: float = default_timer()
+
+	async def produce() -> None:
+		async for batch in batches:
+			await queue.put(batch)
+		for _ in range(workers):
+			await queue.put(None)
+
+	async def consume(connection: Connection, connection_stats: ConnectionStats) -> None:
+		while (batch := await queue.get()) is not None:
+			started: float = default_timer()
+			await connection.copy_records_to_table(
+				table_name=table,
+				records=batch,
+				columns=columns,
+			)
+			connection_stats.seconds += default_timer() - started
+			connection_stats.batches += 1
+			connection_stats.rows += len(batch)
+			stats.rows += len(batch)
+			if on_batch:
+				await on_batch(stats.rows)
+
+	async with AsyncExitStack() as stack:
+		connections: list[Connection] = [
+			await stack.enter_async_context(connect()) for _ in range(workers)
+		]
+		transactions: list[Transaction] = [conn.transaction() for conn in connections]
+		try:
+			for transaction in transactions:
+				await transaction.start()
+			try:
+				async with asyncio.TaskGroup() as group:
+					group.create_task(produce())
+					for connection, connection_stats in zip(
+						connections, stats.connections, strict=True
+					):
+						group.create_task(consume(connection, connection_stats))
+			except BaseExceptionGroup as exc_group:
+				raise exc_group.exceptions[0] from None
+		except BaseException:
+			# Transactions that never started just fail to roll back
+			await asyncio.gather(
+				*(transaction.rollback() for transaction in transactions),
+				return_exceptions=True,
+			)
+			raise
+		for transaction in transactions:
+			await transaction.commit()
+
+	stats.elapsed = default_timer() - start
+	return stats
+
+
+_dialect = postgresql.asyncpg.dialect()  # type: ignore
+
+
+def render(statement: ClauseElement) -> str:
+	"""Compiles a parameterless statement for a raw driver connection."""
+
+	return str(
+		statement.compile(dialect=_dialect, compile_kwargs={"literal_binds": True})
+	)
+
+
+async def merge_copy(
+	connection: Connection,
+	target: Table,
+	columns: list[str],
+	key: str,
+	batches: AsyncIterable[Batch],
+	update: bool,
+) -> MergeStats:
+	"""COPYs batches into a temp table, then merges them into `target`.
+
+	Must run inside a transaction: the staging table is dropped on commit.
+	Rows sharing a `key` collapse to the last one staged. On conflict the
+	existing row is either left alone or, with `update`, rewritten only when
+	a value changed (columns with an `onupdate`, like updated_at, are bumped
+	along).
+	"""
+
+	stats: MergeStats = MergeStats()
+	start: float = default_timer()
+	quote: Callable[[str], str] = _dialect.identifier_preparer.quote
+	staging_name: str = f"_stage_{target.name}"
+
+	await connection.execute(
+		f"CREATE TEMP TABLE {quote(staging_name)} ON COMMIT DROP AS "
+		f"SELECT {', '.join(map(quote, columns))} FROM {quote(target.name)} WITH NO DATA"
+	)
+	await connection.execute(
+		f"ALTER TABLE {quote(staging_name)} "
+		"ADD COLUMN _seq bigint GENERATED ALWAYS AS IDENTITY"
+	)
+	async for batch in batches:
+		await connection.copy_records_to_table(
+			table_name=staging_name, records=batch, columns=columns
+		)
+		stats.staged += len(batch)
+
+	staging = table(staging_name, *map(column, columns), column("_seq"))
+	# DISTINCT ON in the form of the locked SQLAlchemy 2.0
+	latest = (
+		select(*(staging.c[col] for col in columns))
+		.distinct(staging.c[key])
+		.order_by(staging.c[key], staging.c["_seq"].desc())
+	)
+	stmt = pg_insert(target).from_select(columns, latest)
+	values: list[str] = [col for col in columns if col != key]
+	if update and values:
+		touched: dict[str, Any] = {
+			col.name: col.onupdate.arg  # type: ignore
+			for col in target.c
+			if col.onupdate is not None and col.name not in columns
+		}
+		stmt = stmt.on_conflict_do_update(
+			index_elements=[key],
+			set_={col: stmt.excluded[col] for col in values} | touched,
+			where=tuple_(*(target.c[col] for col in values)).is_distinct_from(
+				tuple_(*(stmt.excluded[col] for col in values))
+			),
+		)
+	else:
+		stmt = stmt.on_conflict_do_nothing(index_elements=[key])
+	# xmax is only zero on rows this statement inserted
+	merged = stmt.returning(literal_column("xmax = 0").label("inserted")).cte("merged")
+	counts = select(
+		func.count().filter(merged.c.inserted),
+		func.count().filter(not_(merged.c.inserted)),
+	)
+	row = await connection.fetchrow(render(counts))
+	stats.inserted, stats.updated = row[0], row[1]  # type: ignore
+	stats.elapsed = default_timer() - start
+	return stats
+
+
+async def copy_out(
+	connection: Connection,
+	query: str,
+	args: Sequence[Any] = (),
+	format: str = "csv",
+	max_in_flight: int = 8,
+) -> AsyncGenerator[bytes]:
+	"""Streams `COPY (query) TO STDOUT` as the server sends it, with a header.
+
+	At most `max_in_flight` chunks wait for the consumer: past that the
+	COPY stops reading from the socket, so memory stays bounded whatever
+	the number of rows. Closing the generator early cancels the COPY.
+	"""
+
+	chunks: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(max_in_flight)
+
+	async def produce() -> None:
+		try:
+			await connection.copy_from_query(
+				query, *args, output=chunks.put, format=format, header=True
+			)
+		except Exception as exc:
+			await chunks.put(exc)
+		else:
+			await chunks.put(None)
+
+	task: asyncio.Task[None] = asyncio.create_task(produce())
+	try:
+		while (chunk := await chunks.get()) is not None:
+			if isinstance(chunk, Exception):
+				raise chunk
+			yield chunk
+	finally:
+		task.cancel()
+		with suppress(asyncio.CancelledError):
+			await task
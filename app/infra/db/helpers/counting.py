@@ -0,0 +1,101 @@
+"""app/infra/db/helpers/counting.py"""
+
+import json
+from collections.abc import Callable
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import BinaryExpression
+
+from app.core.config import settings
+from app.domain.models.base import DeclarativeBaseModel
+from app.infra.db.helpers.explain import Explain, load_plan
+
+
+class CountCache:
+	"""In-process TTL memo of collection counts.
+
+	Entries are grouped per table so that any committed write to a table
+	drops every count computed for it, whatever the filter.
+	"""
+
+	def __init__(self, ttl: float, clock: Callable[[], float] = monotonic) -> None:
+		self.ttl = ttl
+		self._clock = clock
+		self._entries: dict[str, dict[str, tuple[float, int]]] = {}
+
+	@staticmethod
+	def make_key(filters: dict[str, Any]) -> str:
+		"""Normalizes filters so equivalent queries share one entry."""
+		normalized: dict[str, Any] = {
+			field: sorted(map(str, value))
+			if isinstance(value, list | tuple | set)
+			else str(value)
+			for field, value in filters.items()
+		}
+		return json.dumps(normalized, sort_keys=True)
+
+	def get(self, table: str, key: str) -> int | None:
+		entry: tuple[float, int] | None = self._entries.get(table, {}).get(key)
+		if entry is None:
+			return None
+		expires_at, value = entry
+		if expires_at <= self._clock():
+			self._entries[table].pop(key, None)
+			return None
+		return value
+
+	def set(self, table: str, key: str, value: int) -> None:
+		self._entries.setdefault(table, {})[key] = (self._clock() + self.ttl, value)
+
+	def invalidate(self, table: str) -> None:
+		self._entries.pop(table, None)
+
+
+count_cache: CountCache = CountCache(ttl=settings.COUNT_CACHE_TTL)
+
+
+async def exact_count[OrmModelT: DeclarativeBaseModel](
+	session: AsyncSession,
+	orm_model: type[OrmModelT],
+	conditions: list[BinaryExpression[Any]],
+) -> int:
+	"""Runs a filtered `COUNT(*)`."""
+	query = select(func.count()).select_from(orm_model)
+	if conditions:
+		query = query.where(*conditions)
+	return (await session.execute(query)).scalar_one()
+
+
+async def estimated_count[OrmModelT: DeclarativeBaseModel](
+	session: AsyncSession,
+	orm_model: type[OrmModelT],
+	conditions: list[BinaryExpression[Any]],
+) -> int:
+	"""Estimates the row count without scanning the table.
+
+	Unfiltered counts come from `pg_class.reltuples`, filtered ones from
+	the planner row estimate. Estimates below `COUNT_EXACT_THRESHOLD` are
+	replaced by an exact count, since those are cheap and estimates on
+	small or never-analyzed tables are the least reliable.
+	"""
+	estimate: int
+	if conditions:
+		query = select(orm_model).where(*conditions)
+		raw: Any = (await session.execute(Explain(query))).scalar_one()
+		estimate = int(load_plan(raw)["Plan Rows"])
+	else:
+		reltuples: float | None = (
+			await session.execute(
+				text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+				{"table": orm_model.__tablename__},
+			)
+		).scalar_one_or_none()
+		# reltuples is -1 until the table is first vacuumed or analyzed
+		estimate = int(reltuples) if reltuples is not None and reltuples >= 0 else -1
+
+	if estimate < settings.COUNT_EXACT_THRESHOLD:
+		return await exact_count(session, orm_model, conditions)
+	return estimate
@@ -0,0 +1,110 @@
+"""app/infra/db/helpers/explain.py"""
+
+import json
+from typing import Any
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+	"""`EXPLAIN` wrapper that keeps the bind parameters of the wrapped statement."""
+
+	inherit_cache = False
+	# Read by the compiler once the wrapped statement is an UPDATE or INSERT
+	_inline = False
+
+	def __init__(self, statement: Executable, analyze: bool = False) -> None:
+		self.statement = statement
+		self.analyze = analyze
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kw: Any) -> str:
+	options: str = "ANALYZE, FORMAT JSON" if element.analyze else "FORMAT JSON"
+	return f"EXPLAIN ({options}) {compiler.process(element.statement, **kw)}"
+
+
+def load_plan(raw: Any) -> dict[str, Any]:
+	"""Returns the root plan node of an `EXPLAIN (FORMAT JSON)` result."""
+	document: list[dict[str, Any]] = json.loads(raw) if isinstance(raw, str) else raw
+	return document[0]["Plan"]
+
+
+def seq_scanned_relations(plan: dict[str, Any]) -> list[str]:
+	"""Returns the relations read by a `Seq Scan` anywhere in a plan tree."""
+	found: list[str] = (
+		[plan["Relation Name"]] if plan.get("Node Type") == "Seq Scan" else []
+	)
+	for child in plan.get("Plans", []):
+		found.extend(seq_scanned_relations(child))
+	return found
+
+
+INDEX_SCANS: set[str] = {"Index Scan", "Index Only Scan", "Bitmap Heap Scan"}
+
+
+def filter_scanned_relations(plan: dict[str, Any]) -> list[str]:
+	"""Returns the relations a plan filters without any index condition, by
+	reading all of their rows: a `Seq Scan` or a full index scan, both with
+	a `Filter`."""
+	node_type: str | None = plan.get("Node Type")
+	unbounded: bool = node_type == "Seq Scan" or (
+		node_type in INDEX_SCANS
+		and "Index Cond" not in plan
+		and "Recheck Cond" not in plan
+	)
+	found: list[str] = [plan["Relation Name"]] if unbounded and "Filter" in plan else []
+	for child in plan.get("Plans", []):
+		found.extend(filter_scanned_relations(child))
+	return found
+
+
+_RELATION_SIZES = text(
+	"SELECT relname, reltuples FROM pg_class WHERE relname = ANY(:names)"
+)
+
+
+async def unindexed_scans(
+	connection: AsyncConnection, statement: Executable, min_rows: float = 0
+) -> list[str]:
+	"""Plans `statement` with sequential scans disabled and returns the
+	tables no index serves it on, among those estimated to hold at least
+	`min_rows` rows.
+
+	A table is reported when it is still read sequentially, or when its
+	rows are filtered without any index condition. A sorted, limited page
+	would walk the index of its ORDER BY and filter along the way, so the
+	WHERE clause of a SELECT is planned on its own for the latter.
+
+	Tables never analyzed have no estimate and are always reported. Runs
+	in a transaction that is rolled back, nothing is executed.
+	"""
+	filtered: Executable = (
+		statement.order_by(None).limit(None).offset(None)
+		if isinstance(statement, Select)
+		else statement
+	)
+	async with connection.begin() as transaction:
+		await connection.execute(text("SET LOCAL enable_seqscan = off"))
+		plan: dict[str, Any] = await _plan(connection, statement)
+		relations: list[str] = seq_scanned_relations(plan)
+		if filtered is not statement:
+			plan = await _plan(connection, filtered)
+		relations = list(dict.fromkeys(relations + filter_scanned_relations(plan)))
+		sizes: dict[str, float] = dict(
+			(await connection.execute(_RELATION_SIZES, {"names": relations})).tuples()
+		)
+		await transaction.rollback()
+	return [
+		relation
+		for relation in relations
+		if sizes.get(relation, -1) < 0 or sizes[relation] >= min_rows
+	]
+
+
+async def _plan(connection: AsyncConnection, statement: Executable) -> dict[str, Any]:
+	return load_plan((await connection.execute(Explain(statement))).scalar_one())
@@ -1,60 +1,229 @@
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+from sqlalchemy import Column, ColumnElement, String, inspect, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.future import select
 from sqlalchemy.sql.elements import BinaryExpression
 from sqlalchemy.sql.selectable import Select
 
-from app.domain.models.base import DeclarativeBaseModel
+from app.core.exceptions.query import (
+	InvalidCursorError,
+	InvalidFieldsError,
+	InvalidFilterError,
+)
+from app.core.i18n.manager import _
+from app.domain.models.base import CreateBaseModel, DeclarativeBaseModel
+from app.domain.schemas.pagination import Cursor, CursorDirection
+
+type Condition = Callable[[Any], ColumnElement[bool]]
+type Operator = Callable[[Any, Any], ColumnElement[bool]]
+
+OPERATORS: dict[str, Operator] = {
+	"eq": lambda column, value: column == value,
+	"ne": lambda column, value: column != value,
+	"lt": lambda column, value: column < value,
+	"lte": lambda column, value: column <= value,
+	"gt": lambda column, value: column > value,
+	"gte": lambda column, value: column >= value,
+	"in": lambda column, value: column.in_(value),
+	"like": lambda column, value: column.like(value),
+	"ilike": lambda column, value: column.ilike(value),
+	"startswith": lambda column, value: column.startswith(value, autoescape=True),
+	"isnull": lambda column, value: column.is_(None) if value else column.is_not(None),
+	"between": lambda column, value: column.between(*value),
+	# On arrays: @>, <@ and &&. On strings `contains` is a LIKE '%value%'
+	"contains": lambda column, value: (
+		column.contains(value)
+		if isinstance(column.type, ARRAY)
+		else column.contains(value, autoescape=True)
+	),
+	"contained_by": lambda column, value: column.contained_by(value),
+	"overlap": lambda column, value: column.overlap(value),
+}
+ARRAY_OPERATORS: set[str] = {"contained_by", "overlap"}
+STRING_OPERATORS: set[str] = {"like", "ilike", "startswith"}
+LIST_OPERATORS: set[str] = {"in", "between", *ARRAY_OPERATORS}
+TRUE_STRINGS: set[str] = {"1", "true", "yes", "on"}
+
+
+def _parser(python_type: type) -> Callable[[str], Any]:
+	"""Returns how to read a query string value as `python_type`."""
+
+	if python_type is bool:
+		return lambda raw: raw.lower() in TRUE_STRINGS
+	if python_type is datetime:
+		return datetime.fromisoformat
+	return python_type
+
+
+@lru_cache(maxsize=1024)
+def compile_filter[OrmModelT: DeclarativeBaseModel](
+	orm_model: type[OrmModelT], key: str
+) -> Condition:
+	"""Resolves a `field__op` key once into a function of the filter value.
+
+	Values given as strings (e.g. straight from a query string) are parsed
+	to the column type; list operators take them comma separated.
+
+	Raises:
+	    InvalidFilterError: The field is not a column, or the operator is unknown
+	        or does not apply to its type (string operators on a number).
+	"""
+
+	col_name, _sep, op = key.partition("__")
+	op = op or "eq"
+	column: Column[Any] | None = inspect(orm_model).columns.get(col_name)
+	is_array: bool = column is not None and isinstance(column.type, ARRAY)
+	is_string: bool = column is not None and isinstance(column.type, String)
+	if (
+		column is None
+		or op not in OPERATORS
+		or (op in ARRAY_OPERATORS and not is_array)
+		or (op in STRING_OPERATORS and not is_string)
+		or (op == "contains" and not (is_array or is_string))
+	):
+		raise InvalidFilterError(message=f"{_('Invalid filter')}: {key}")
+
+	attribute: Any = getattr(orm_model, col_name)
+	operator: Operator = OPERATORS[op]
+	takes_list: bool = op in LIST_OPERATORS or (op == "contains" and is_array)
+	python_type: type = (
+		column.type.item_type.python_type if is_array else column.type.python_type  # type: ignore
+	)
+	parse: Callable[[str], Any] = _parser(bool if op == "isnull" else python_type)
+
+	def read(value: Any) -> Any:
+		if takes_list and isinstance(value, str):
+			return [parse(item) for item in value.split(",")]
+		if isinstance(value, str) and op not in {"like", "ilike", "startswith"}:
+			return parse(value)
+		return value
+
+	def condition(value: Any) -> ColumnElement[bool]:
+		try:
+			value = read(value)
+			if op == "between" and len(value) != 2:
+				raise ValueError("between takes two values")
+		except (TypeError, ValueError):
+			raise InvalidFilterError(message=f"{_('Invalid filter')}: {key}")
+		return operator(attribute, value)
+
+	return condition
+
+
+@lru_cache(maxsize=1024)
+def compile_filter_plan[OrmModelT: DeclarativeBaseModel](
+	orm_model: type[OrmModelT], keys: tuple[str, ...]
+) -> tuple[Condition, ...]:
+	"""Compiles the filters of a request signature, see `compile_filter`."""
+
+	return tuple(compile_filter(orm_model, key) for key in keys)
 
 
 def apply_operator[OrmModelT: DeclarativeBaseModel](
 	orm_model: type[OrmModelT], field: str, value: Any
-) -> BinaryExpression[Any]:
+) -> ColumnElement[bool]:
 	"""Return a SQLAlchemy condition for the given field
 	and value with operator support.
 	"""
 
-	if "__" in field:
-		col_name, op = field.split("__", 1)
-	else:
-		col_name, op = field, "eq"
-
-	column = getattr(orm_model, col_name)
-
-	if op == "eq":
-		return column == value
-	elif op == "ne":
-		return column != value
-	elif op == "lt":
-		return column < value
-	elif op == "lte":
-		return column <= value
-	elif op == "gt":
-		return column > value
-	elif op == "gte":
-		return column >= value
-	elif op == "in":
-		return column.in_(value)
-	else:
-		raise ValueError(f"Unsupported operator: {op}")
+	return compile_filter(orm_model, field)(value)
+
+
+@lru_cache(maxsize=256)
+def select_columns[OrmModelT: DeclarativeBaseModel](
+	orm_model: type[OrmModelT], names: tuple[str, ...]
+) -> tuple[Any, ...]:
+	"""Resolves column names of `orm_model` into its mapped attributes."""
+
+	mapped: Any = inspect(orm_model).columns
+	unknown: list[str] = [name for name in names if name not in mapped]
+	if unknown:
+		raise InvalidFieldsError(message=f"{_('Invalid fields')}: {', '.join(unknown)}")
+	return tuple(getattr(orm_model, name) for name in names)
 
 
 def build_query[OrmModelT: DeclarativeBaseModel](
 	orm_model: type[OrmModelT],
 	filter: dict[str, Any] | None = None,
 	return_conditions: bool = False,
+	columns: Sequence[str] | None = None,
 ) -> Select[tuple[OrmModelT]] | list[BinaryExpression[Any]]:
-	"""Build a SQLAlchemy SELECT query for a given model with optional filters."""
+	"""Build a SQLAlchemy SELECT query for a given model with optional filters.
+
+	With `columns` only those are selected, and rows come back as tuples
+	rather than ORM instances.
+
+	Raises:
+	    InvalidFieldsError: Some of the columns are not columns of the model.
+	"""
 
 	filters = filter or {}
+	plan: tuple[Condition, ...] = compile_filter_plan(orm_model, tuple(filters))
 	conditions: list[BinaryExpression[Any]] = [
-		apply_operator(orm_model, key, value) for key, value in filters.items()
+		condition(value)  # type: ignore
+		for condition, value in zip(plan, filters.values(), strict=True)
 	]
 	if return_conditions:
 		return conditions
 
-	query: Select[tuple[OrmModelT]] = select(orm_model)
+	query: Select[tuple[OrmModelT]] = (
+		select(*select_columns(orm_model, tuple(columns)))
+		if columns
+		else select(orm_model)
+	)  # type: ignore
 	if conditions:
 		query = query.where(*conditions)
 
 	return query
+
+
+def apply_keyset[OrmModelT: CreateBaseModel](
+	query: Select[tuple[OrmModelT]],
+	orm_model: type[OrmModelT],
+	cursor: Cursor | None = None,
+	order_by: str = "id",
+	descending: bool = False,
+) -> Select[tuple[OrmModelT]]:
+	"""Sorts on `(order_by, id)` and seeks past the cursor position on it
+	instead of skipping rows with OFFSET, so every page costs the same index
+	range scan. Ids are UUIDv7, so ordering by id alone is creation order.
+
+	Without a cursor this only sorts, which also keeps OFFSET pages stable.
+	Pages read backwards are returned in reverse order and must be reversed
+	by the caller.
+
+	Raises:
+	    InvalidCursorError: The cursor was issued for another sort column.
+	"""
+
+	keys: list[Any] = [orm_model.id]
+	position: list[Any] = [cursor.id] if cursor else []
+	if order_by != "id":
+		column: Any = getattr(orm_model, order_by)
+		keys.insert(0, column)
+		if cursor:
+			position.insert(0, _cursor_value(column, cursor.value))
+	if cursor and cursor.order_by != order_by:
+		raise InvalidCursorError
+
+	backwards: bool = cursor is not None and cursor.direction == CursorDirection.PREVIOUS
+	ascending: bool = descending == backwards
+	query = query.order_by(*(key.asc() if ascending else key.desc() for key in keys))
+	if cursor is None:
+		return query
+
+	key, seek = tuple_(*keys), tuple_(*position)
+	return query.where(key > seek if ascending else key < seek)
+
+
+def _cursor_value(column: Any, value: Any) -> Any:
+	try:
+		return (
+			_parser(column.type.python_type)(value) if isinstance(value, str) else value
+		)
+	except ValueError as exc:
+		raise InvalidCursorError from exc
@@ -0,0 +1,34 @@
+"""app/infra/db/helpers/raw.py"""
+
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.selectable import Select
+
+_dialect = asyncpg.dialect()
+
+
+def positional(statement: ClauseElement) -> tuple[str, list[Any]]:
+	"""Compiles a statement into `$n` SQL and its arguments, ready for
+	asyncpg's `fetch`. Expanding parameters (`IN` lists) are inlined as one
+	placeholder per item."""
+
+	compiled = statement.compile(
+		dialect=_dialect, compile_kwargs={"render_postcompile": True}
+	)
+	params: dict[str, Any] = compiled.construct_params()
+	processors: dict[str, Any] = compiled._bind_processors  # type: ignore
+	args: list[Any] = [
+		processors[name](params[name]) if name in processors else params[name]
+		for name in compiled.positiontup or []
+	]
+	return str(compiled), args
+
+
+async def fetch_dicts(connection: Any, query: Select[Any]) -> list[dict[str, Any]]:
+	"""Runs a SELECT on a raw asyncpg connection, rows as plain dicts in
+	column order."""
+
+	sql, args = positional(query)
+	return [dict(record) for record in await connection.fetch(sql, *args)]
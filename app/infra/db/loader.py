@@ -0,0 +1,100 @@
+"""app/infra/db/loader.py"""
+
+import asyncio
+from collections.abc import Callable, Hashable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+from sqlalchemy import Table, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.infra.db.manager import DatabaseManager
+
+type Waiters = list[asyncio.Future[dict[str, Any] | None]]
+
+
+class RowLoader:
+	"""Gathers the lookups by key made in the same event loop tick into one
+	`SELECT ... WHERE key = ANY($1)`, DataLoader style.
+
+	Every caller gets the row of its own key, or None when there is none.
+	Lookups of the same key within a tick share one array slot. A failing
+	query fails every lookup of its batch.
+	"""
+
+	def __init__(
+		self,
+		table: Table,
+		max_batch: int,
+		key: str = "id",
+		connect: Callable[
+			[], AbstractAsyncContextManager[AsyncConnection]
+		] = DatabaseManager.autocommit_connection,
+	) -> None:
+		self.table = table
+		self.max_batch = max_batch
+		self.key = key
+		self._connect = connect
+		self._pending: dict[Hashable, Waiters] = {}
+		self._scheduled: bool = False
+		self._tasks: set[asyncio.Task[None]] = set()
+		column = table.c[key]
+		self._query = select(table).where(
+			column == any_(bindparam("keys", type_=ARRAY(column.type)))
+		)
+
+	async def load(self, key: Hashable) -> dict[str, Any] | None:
+		"""Queues a lookup and waits for the batch holding it."""
+		loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+		future: asyncio.Future[dict[str, Any] | None] = loop.create_future()
+		self._pending.setdefault(key, []).append(future)
+
+		if len(self._pending) >= self.max_batch:
+			self._dispatch()
+		elif not self._scheduled:
+			self._scheduled = True
+			loop.call_soon(self._dispatch)
+		return await future
+
+	def _dispatch(self) -> None:
+		self._scheduled = False
+		batch, self._pending = self._pending, {}
+		if batch:
+			task: asyncio.Task[None] = asyncio.create_task(self._read(batch))
+			self._tasks.add(task)
+			task.add_done_callback(self._tasks.discard)
+
+	async def _read(self, batch: dict[Hashable, Waiters]) -> None:
+		try:
+			async with self._connect() as connection:
+				result = await connection.execute(self._query, {"keys": list(batch)})
+				rows: dict[Any, dict[str, Any]] = {
+					row[self.key]: dict(row) for row in result.mappings()
+				}
+		except Exception as exc:
+			for waiters in batch.values():
+				for future in waiters:
+					if not future.done():
+						future.set_exception(exc)
+			return
+
+		for key, waiters in batch.items():
+			for future in waiters:
+				if not future.done():
+					future.set_result(rows.get(key))
+
+
+_loaders: dict[str, RowLoader] = {}
+
+
+def get_row_loader(table: Table) -> RowLoader | None:
+	"""Returns the loader of `table`, None unless GET_COALESCING is on."""
+	if not settings.GET_COALESCING:
+		return None
+	if table.name not in _loaders:
+		_loaders[table.name] = RowLoader(
+			table=table, max_batch=settings.GET_COALESCE_MAX_BATCH
+		)
+	return _loaders[table.name]
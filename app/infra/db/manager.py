@@ -1,12 +1,14 @@
 """app/infra/db/manager.py"""
 
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from typing import Annotated
 
-from asyncpg import Pool, create_pool
+from asyncpg import Connection
 from fastapi import Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
+	AsyncConnection,
 	AsyncEngine,
 	AsyncSession,
 	async_sessionmaker,
@@ -14,27 +16,74 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import settings
+from app.infra.db.routing import ReplicaSet, RoutingSession
 
 
 class DatabaseManager:
 	_engine: AsyncEngine | None = None
+	_replica_engines: list[AsyncEngine] | None = None
+	_replicas: ReplicaSet | None = None
 	_sessionmaker: async_sessionmaker[AsyncSession] | None = None
-	_pool: Pool | None = None
+
+	@staticmethod
+	def pool_limits(replica: bool = False) -> tuple[int, int]:
+		"""Returns `(pool_size, max_overflow)` of one engine, clamped to its
+		share of the per-worker budget.
+
+		The budget bounds every connection a worker may open, ORM sessions and
+		raw driver connections alike, on the primary and the replicas, so the
+		total is at most `DB_WORKER_CONNECTION_BUDGET * workers`. It is split
+		evenly between the primary and each replica, the primary getting the
+		remainder; every engine keeps at least one connection.
+		"""
+		pool_size: int = settings.DB_POOL_SIZE
+		max_overflow: int = settings.DB_MAX_OVERFLOW
+		budget: int = settings.DB_WORKER_CONNECTION_BUDGET
+		if budget > 0:
+			engines: int = 1 + len(settings.DATABASE_REPLICA_URLS)
+			share: int = budget // engines
+			if not replica:
+				share = budget - share * (engines - 1)
+			share = max(share, 1)
+			pool_size = min(pool_size, share)
+			max_overflow = min(max_overflow, share - pool_size)
+		return pool_size, max_overflow
+
+	@classmethod
+	def _create_engine(cls, url: str, replica: bool = False) -> AsyncEngine:
+		pool_size, max_overflow = cls.pool_limits(replica=replica)
+		return create_async_engine(
+			url,
+			echo=False,
+			pool_pre_ping=True,
+			pool_size=pool_size,
+			max_overflow=max_overflow,
+			pool_timeout=settings.DB_POOL_TIMEOUT,
+			pool_recycle=1800,
+			future=True,
+		)
 
 	@classmethod
 	def get_engine(cls) -> AsyncEngine:
+		"""Returns the engine of the primary database."""
 		if cls._engine is None:
-			cls._engine = create_async_engine(
-				settings.DATABASE_URL,
-				echo=False,
-				pool_pre_ping=True,
-				pool_size=20,
-				max_overflow=40,
-				pool_recycle=1800,
-				future=True,
-			)
+			cls._engine = cls._create_engine(settings.DATABASE_URL)
 		return cls._engine
 
+	@classmethod
+	def get_replicas(cls) -> ReplicaSet | None:
+		"""Returns the configured read replicas, None when there are none."""
+		if cls._replicas is None and settings.DATABASE_REPLICA_URLS:
+			cls._replica_engines = [
+				cls._create_engine(url, replica=True)
+				for url in settings.DATABASE_REPLICA_URLS
+			]
+			cls._replicas = ReplicaSet(
+				engines=[engine.sync_engine for engine in cls._replica_engines],
+				strategy=settings.REPLICA_STRATEGY,
+			)
+		return cls._replicas
+
 	@classmethod
 	def get_sessionmaker(cls) -> async_sessionmaker[AsyncSession]:
 		if cls._sessionmaker is None:
@@ -42,6 +91,8 @@ class DatabaseManager:
 				bind=cls.get_engine(),
 				expire_on_commit=False,
 				class_=AsyncSession,
+				sync_session_class=RoutingSession,
+				replicas=cls.get_replicas(),
 			)
 		return cls._sessionmaker
 
@@ -53,12 +104,30 @@ class DatabaseManager:
 			yield session
 
 	@classmethod
-	async def get_asyncpg_pool(cls) -> Pool:
-		if cls._pool is None:
-			dsn: str = settings.DATABASE_URL.replace("+asyncpg", "")
-			cls._pool = await create_pool(dsn=dsn, min_size=5, max_size=20)
-			# increase to min_size=10, max_size=50 if it's to insert millions
-		return cls._pool
+	@asynccontextmanager
+	async def raw_connection(cls) -> AsyncGenerator[Connection]:
+		"""Checks out a raw asyncpg connection from the engine pool.
+
+		Used for driver-level operations such as COPY, which then share the
+		same bounded pool as ORM traffic. The connection goes back to the pool
+		(and is reset) when the context exits.
+		"""
+		async with cls.get_engine().connect() as connection:
+			pooled = await connection.get_raw_connection()
+			yield pooled.driver_connection  # type: ignore
+
+	@classmethod
+	@asynccontextmanager
+	async def autocommit_connection(cls) -> AsyncGenerator[AsyncConnection]:
+		"""Checks out a pooled connection in autocommit mode.
+
+		Every statement commits on its own, without the BEGIN/COMMIT round
+		trips of a transaction, which suits single-statement writes. The
+		isolation level is restored when the connection goes back to the pool.
+		"""
+		async with cls.get_engine().connect() as connection:
+			await connection.execution_options(isolation_level="AUTOCOMMIT")
+			yield connection
 
 	@classmethod
 	async def test_connection(cls) -> bool:
@@ -69,5 +138,16 @@ class DatabaseManager:
 			await session.execute(text("SELECT 1"))
 			return True
 
+	@classmethod
+	async def dispose(cls) -> None:
+		"""Closes every pooled connection."""
+		for engine in [cls._engine, *(cls._replica_engines or [])]:
+			if engine is not None:
+				await engine.dispose()
+		cls._engine = None
+		cls._replica_engines = None
+		cls._replicas = None
+		cls._sessionmaker = None
+
 
 DatabaseDependency = Annotated[AsyncSession, Depends(DatabaseManager.get_session)]
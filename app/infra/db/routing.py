@@ -0,0 +1,76 @@
+"""app/infra/db/routing.py"""
+
+from collections.abc import Sequence
+from itertools import cycle
+from typing import Any, Literal
+
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.selectable import Select
+
+from app.infra.db.helpers.explain import Explain
+
+PIN_PRIMARY: str = "pin_primary"
+REPLICA: str = "replica"
+
+
+class ReplicaSet:
+	"""Picks the replica engine that serves a session's reads."""
+
+	def __init__(
+		self,
+		engines: Sequence[Engine],
+		strategy: Literal["round_robin", "least_busy"] = "round_robin",
+	) -> None:
+		self.engines = engines
+		self.strategy = strategy
+		self._round_robin = cycle(engines)
+
+	def pick(self) -> Engine:
+		if self.strategy == "least_busy":
+			return min(self.engines, key=lambda engine: engine.pool.checkedout())  # type: ignore
+		return next(self._round_robin)
+
+
+def is_read_only(clause: ClauseElement | None) -> bool:
+	"""Tells whether a statement can be served by a replica."""
+	if isinstance(clause, Explain):
+		return not clause.analyze and is_read_only(clause.statement)  # type: ignore
+	return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+def pin_primary(session: AsyncSession | Session) -> None:
+	"""Routes every following statement of the session to the primary."""
+	session.info[PIN_PRIMARY] = True
+
+
+class RoutingSession(Session):
+	"""Session that sends plain reads to a replica and the rest to the primary.
+
+	A session sticks to the primary after its first write, flush or
+	`Transaction`, so a request always reads its own writes. Writes made on
+	other connections (autocommit, COPY) are not seen here: whoever makes
+	them pins the session with `pin_primary`, as repositories do. Reads
+	before that all go to the same replica, picked once per session.
+	"""
+
+	def __init__(self, *args: Any, replicas: ReplicaSet | None = None, **kw: Any) -> None:
+		super().__init__(*args, **kw)
+		self.replicas = replicas
+
+	def get_bind(
+		self, mapper: Any = None, *, clause: ClauseElement | None = None, **kw: Any
+	) -> Engine | Connection:
+		primary: Engine | Connection = super().get_bind(mapper, clause=clause, **kw)
+		if not self.replicas or self.info.get(PIN_PRIMARY) or self._flushing:
+			return primary
+
+		if not is_read_only(clause):
+			pin_primary(self)
+			return primary
+
+		if REPLICA not in self.info:
+			self.info[REPLICA] = self.replicas.pick()
+		return self.info[REPLICA]
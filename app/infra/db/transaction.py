@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from types import TracebackType
 from typing import Self
 
@@ -7,22 +7,27 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import logger
 from app.domain.models.base import DeclarativeBaseModel
+from app.infra.db.routing import pin_primary
 
 
 class Transaction[OrmModelT: DeclarativeBaseModel]:
 	"""Transaction manager with automatic commit/rollback."""
 
-	__slots__ = ("session", "_should_commit")
+	__slots__ = ("session", "_should_commit", "_on_commit")
 
 	def __init__(self, session: AsyncSession) -> None:
 		self.session = session
 		self._should_commit = False
+		self._on_commit: list[Callable[[], Awaitable[None]]] = []
 
 	async def __aenter__(self) -> Self:
-		"""Marks that this context should manage the transaction."""
+		"""Marks that this context should manage the transaction and pins
+		the session to the primary database.
+		"""
 		# SQLAlchemy AsyncSession automatically starts a transaction
 		# on the first database operation. No need to call begin() manually.
 		self._should_commit = True
+		pin_primary(self.session)
 		logger.debug("Transaction context entered")
 		return self
 
@@ -45,6 +50,8 @@ class Transaction[OrmModelT: DeclarativeBaseModel]:
 				logger.info("Committing transaction.")
 				await self.session.commit()
 				logger.info("Transaction commited.")
+				for callback in self._on_commit:
+					await callback()
 
 		except SQLAlchemyError as exc:
 			logger.error(f"Error during commit/rollback: {exc}")
@@ -52,6 +59,15 @@ class Transaction[OrmModelT: DeclarativeBaseModel]:
 			raise
 		finally:
 			self._should_commit = False
+			self._on_commit.clear()
+
+	def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+		"""Registers a callback to run once this transaction commits.
+
+		Callbacks are discarded on rollback, which makes this the place to
+		invalidate anything derived from the data being written.
+		"""
+		self._on_commit.append(callback)
 
 	def insert(self, orm_model: OrmModelT) -> OrmModelT:
 		"""Adds an ORM model to the session for insertion."""
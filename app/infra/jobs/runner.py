@@ -0,0 +1,166 @@
+"""app/infra/jobs/runner.py"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.domain.schemas.job import JobStatus
+from app.infra.jobs.store import (
+	UNFINISHED,
+	Job,
+	JobStore,
+	MemoryJobStore,
+	PostgresJobStore,
+)
+
+type ProgressCallback = Callable[[int], Awaitable[None]]
+type JobWork = Callable[[ProgressCallback], Awaitable[int]]
+
+
+class JobRunner:
+	"""In-process async worker pool for long running jobs.
+
+	At most `concurrency` jobs run at once; the others wait as `pending`.
+	Unfinished jobs are touched every `heartbeat_interval` seconds. One not
+	touched for `stale_after` seconds was left behind by a worker that died,
+	and is failed when it is read or when a worker starts.
+	"""
+
+	def __init__(
+		self,
+		store: JobStore,
+		concurrency: int,
+		heartbeat_interval: float = 10.0,
+		stale_after: float = 60.0,
+		shutdown_timeout: float | None = None,
+	) -> None:
+		self.store = store
+		self.heartbeat_interval = heartbeat_interval
+		self.stale_after = stale_after
+		self.shutdown_timeout = shutdown_timeout
+		self._slots = asyncio.Semaphore(concurrency)
+		self._tasks: set[asyncio.Task[None]] = set()
+
+	async def submit(self, kind: str, total_rows: int, work: JobWork) -> Job:
+		"""Registers a job and schedules `work` to run in the background.
+
+		`work` receives a callback to report the rows processed so far and
+		returns the final number of rows processed.
+		"""
+		job: Job = await self.store.create(Job(kind=kind, total_rows=total_rows))
+		task: asyncio.Task[None] = asyncio.create_task(self._run(job.id, work))
+		self._tasks.add(task)
+		task.add_done_callback(self._tasks.discard)
+		return job
+
+	async def get(self, id: UUID) -> Job | None:
+		"""Reads a job, failing it first when its worker is gone."""
+		job: Job | None = await self.store.get(id)
+		if job and job.status in UNFINISHED and job.updated_at < self._stale_before():
+			await self.fail_stale(id)
+			job = await self.store.get(id)
+		return job
+
+	async def fail_stale(self, id: UUID | None = None) -> None:
+		"""Fails the jobs whose worker is gone, see `JobStore.fail_stale`."""
+		await self.store.fail_stale(
+			before=self._stale_before(),
+			error="Interrupted: the worker running the job stopped",
+			id=id,
+		)
+
+	def _stale_before(self) -> datetime:
+		return datetime.now(UTC) - timedelta(seconds=self.stale_after)
+
+	async def _heartbeat(self, id: UUID) -> None:
+		while True:
+			await asyncio.sleep(self.heartbeat_interval)
+			try:
+				await self.store.update(id, updated_at=datetime.now(UTC))
+			except Exception as exc:
+				logger.warning(f"Job {id} heartbeat failed: {exc}")
+
+	async def _run(self, id: UUID, work: JobWork) -> None:
+		heartbeat: asyncio.Task[None] = asyncio.create_task(self._heartbeat(id))
+		try:
+			await self._run_work(id, work)
+		except asyncio.CancelledError:
+			logger.error(f"Job {id} cancelled")
+			await self.store.update(
+				id,
+				status=JobStatus.FAILED,
+				errors=["Interrupted: the worker shut down"],
+				finished_at=datetime.now(UTC),
+			)
+			raise
+		finally:
+			heartbeat.cancel()
+
+	async def _run_work(self, id: UUID, work: JobWork) -> None:
+		async with self._slots:
+			await self.store.update(
+				id, status=JobStatus.RUNNING, started_at=datetime.now(UTC)
+			)
+
+			async def report(inserted_rows: int) -> None:
+				await self.store.update(id, inserted_rows=inserted_rows)
+
+			try:
+				inserted_rows: int = await work(report)
+			except Exception as exc:
+				logger.error(f"Job {id} failed: [{type(exc).__name__}]: {exc}")
+				await self.store.update(
+					id,
+					status=JobStatus.FAILED,
+					errors=[f"{type(exc).__name__}: {exc}"],
+					finished_at=datetime.now(UTC),
+				)
+				return
+
+			await self.store.update(
+				id,
+				status=JobStatus.SUCCEEDED,
+				inserted_rows=inserted_rows,
+				finished_at=datetime.now(UTC),
+			)
+			logger.info(f"Job {id} finished: {inserted_rows} rows")
+
+	async def shutdown(self) -> None:
+		"""Waits up to `shutdown_timeout` seconds for the jobs in flight so
+		they are not cut off mid-load, then cancels the others: their load is
+		rolled back and they are marked failed."""
+		if not self._tasks:
+			return
+		logger.info(f"Waiting for {len(self._tasks)} background job(s)...")
+		_, pending = await asyncio.wait(self._tasks, timeout=self.shutdown_timeout)
+		if pending:
+			logger.warning(f"Cancelling {len(pending)} unfinished background job(s)")
+			for task in pending:
+				task.cancel()
+			await asyncio.gather(*pending, return_exceptions=True)
+
+
+@lru_cache
+def get_job_runner() -> JobRunner:
+	store: JobStore = (
+		PostgresJobStore()
+		if settings.JOBS_STORE == "postgres"
+		else MemoryJobStore(max_jobs=settings.JOBS_MEMORY_MAX)
+	)
+	return JobRunner(
+		store=store,
+		concurrency=settings.JOBS_CONCURRENCY,
+		heartbeat_interval=settings.JOBS_HEARTBEAT_INTERVAL,
+		stale_after=settings.JOBS_STALE_AFTER,
+		shutdown_timeout=settings.JOBS_SHUTDOWN_TIMEOUT,
+	)
+
+
+JobRunnerDependency = Annotated[JobRunner, Depends(get_job_runner)]
@@ -0,0 +1,156 @@
+"""app/infra/jobs/store.py"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, replace
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from app.domain.models.job import JobModel
+from app.domain.schemas.job import JobStatus
+from app.infra.db.manager import DatabaseManager
+from app.infra.repositories.job import JobRepository
+
+
+@dataclass(slots=True)
+class Job:
+	kind: str
+	total_rows: int = 0
+	id: UUID = field(default_factory=uuid4)
+	status: JobStatus = JobStatus.PENDING
+	inserted_rows: int = 0
+	errors: list[str] = field(default_factory=list)
+	created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+	started_at: datetime | None = None
+	finished_at: datetime | None = None
+	# Bumped by every update, heartbeats included
+	updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+	@property
+	def progress(self) -> float:
+		if not self.total_rows:
+			return 1.0 if self.status == JobStatus.SUCCEEDED else 0.0
+		return min(self.inserted_rows / self.total_rows, 1.0)
+
+
+JOB_FIELDS: tuple[str, ...] = tuple(job_field.name for job_field in fields(Job))
+UNFINISHED: tuple[JobStatus, ...] = (JobStatus.PENDING, JobStatus.RUNNING)
+
+
+class JobStore(ABC):
+	"""Persists job state so it can be polled while the job runs."""
+
+	@abstractmethod
+	async def create(self, job: Job) -> Job: ...
+
+	@abstractmethod
+	async def get(self, id: UUID) -> Job | None: ...
+
+	@abstractmethod
+	async def update(self, id: UUID, **changes: Any) -> None: ...
+
+	@abstractmethod
+	async def fail_stale(
+		self, before: datetime, error: str, id: UUID | None = None
+	) -> None:
+		"""Fails the unfinished jobs (only `id`, when given) not updated since
+		`before`: the worker running them is gone."""
+
+
+class MemoryJobStore(JobStore):
+	"""Keeps jobs in the worker process, only the latest `max_jobs` are kept.
+
+	Jobs can only be polled on the worker that runs them.
+	"""
+
+	def __init__(self, max_jobs: int = 1000) -> None:
+		self.max_jobs = max_jobs
+		self._jobs: OrderedDict[UUID, Job] = OrderedDict()
+
+	async def create(self, job: Job) -> Job:
+		self._jobs[job.id] = job
+		while len(self._jobs) > self.max_jobs:
+			self._jobs.popitem(last=False)
+		return job
+
+	async def get(self, id: UUID) -> Job | None:
+		job: Job | None = self._jobs.get(id)
+		# Callers get a snapshot, not the instance the runner keeps updating
+		return replace(job) if job else None
+
+	async def update(self, id: UUID, **changes: Any) -> None:
+		job: Job | None = self._jobs.get(id)
+		if job:
+			job.updated_at = datetime.now(UTC)
+			for name, value in changes.items():
+				setattr(job, name, value)
+
+	async def fail_stale(
+		self, before: datetime, error: str, id: UUID | None = None
+	) -> None:
+		jobs: list[Job] = list(self._jobs.values())
+		if id is not None:
+			jobs = [job for job in jobs if job.id == id]
+		for job in jobs:
+			if job.status in UNFINISHED and job.updated_at < before:
+				await self.update(
+					job.id,
+					status=JobStatus.FAILED,
+					errors=[error],
+					finished_at=datetime.now(UTC),
+				)
+
+
+class PostgresJobStore(JobStore):
+	"""Keeps jobs in the `job` table, so any worker can report them."""
+
+	async def create(self, job: Job) -> Job:
+		async with DatabaseManager.get_sessionmaker()() as session:
+			repository = JobRepository(session=session)
+			async with repository.transaction() as transaction:
+				values: dict[str, Any] = {name: getattr(job, name) for name in JOB_FIELDS}
+				await repository.create(JobModel(**values), transaction=transaction)
+		return job
+
+	async def get(self, id: UUID) -> Job | None:
+		async with DatabaseManager.get_sessionmaker()() as session:
+			job_model: JobModel | None = await JobRepository(session=session).get(
+				filters={"id": id}
+			)
+		if job_model is None:
+			return None
+		values: dict[str, Any] = {name: getattr(job_model, name) for name in JOB_FIELDS}
+		return Job(**{**values, "status": JobStatus(job_model.status)})
+
+	async def update(self, id: UUID, **changes: Any) -> None:
+		async with DatabaseManager.get_sessionmaker()() as session:
+			repository = JobRepository(session=session)
+			async with repository.transaction() as transaction:
+				await repository.partial_update(
+					filters={"id": id}, data=changes, transaction=transaction
+				)
+
+	async def fail_stale(
+		self, before: datetime, error: str, id: UUID | None = None
+	) -> None:
+		"""Fails them with one UPDATE, which only matches jobs still stale
+		when it runs."""
+		filters: dict[str, Any] = {
+			"status__in": list(UNFINISHED),
+			"updated_at__lt": before,
+		}
+		if id is not None:
+			filters["id"] = id
+		async with DatabaseManager.get_sessionmaker()() as session:
+			repository = JobRepository(session=session)
+			async with repository.transaction() as transaction:
+				await repository.partial_update(
+					filters=filters,
+					data={
+						"status": JobStatus.FAILED,
+						"errors": [error],
+						"finished_at": datetime.now(UTC),
+					},
+					transaction=transaction,
+				)
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
+from sqlalchemy.engine import Row
+
 from app.domain.models.base import DeclarativeBaseModel
+from app.domain.schemas.pagination import CountMode
 from app.infra.db.transaction import Transaction
 
 
@@ -11,16 +15,32 @@ class Repository[OrmModelT: DeclarativeBaseModel](ABC):
 		self, orm_model: OrmModelT, transaction: Transaction[OrmModelT]
 	) -> OrmModelT: ...
 
+	@abstractmethod
+	async def create_returning(
+		self, values: dict[str, Any], transaction: Transaction[OrmModelT] | None
+	) -> dict[str, Any]: ...
+
 	@abstractmethod
 	async def get(
-		self, filters: dict[str, Any], transaction: Transaction[OrmModelT]
-	) -> OrmModelT | None: ...
+		self,
+		filters: dict[str, Any],
+		transaction: Transaction[OrmModelT],
+		fields: Sequence[str] | None,
+	) -> OrmModelT | Row[Any] | None: ...
 
 	@abstractmethod
 	async def query(
 		self,
 		filter_params: dict[str, Any],
-	) -> list[OrmModelT]: ...
+		fields: Sequence[str] | None,
+	) -> list[OrmModelT] | list[Row[Any]]: ...
+
+	@abstractmethod
+	async def count(
+		self,
+		filters: dict[str, Any],
+		mode: CountMode,
+	) -> int: ...
 
 	@abstractmethod
 	async def partial_update(
@@ -32,5 +52,5 @@ class Repository[OrmModelT: DeclarativeBaseModel](ABC):
 
 	@abstractmethod
 	async def delete(
-		self, orm_model: OrmModelT, transaction: Transaction[OrmModelT]
-	) -> None: ...
+		self, filters: dict[str, Any], transaction: Transaction[OrmModelT]
+	) -> list[Any]: ...
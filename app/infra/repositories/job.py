@@ -0,0 +1,6 @@
+from app.domain.models.job import JobModel
+from app.infra.repositories.postgres.base import PostgresRepository
+
+
+class JobRepository(PostgresRepository[JobModel]):
+	orm_model: type[JobModel] = JobModel
@@ -1,17 +1,73 @@
-from collections.abc import AsyncGenerator, Generator, Iterable, Iterator, Sequence
-from itertools import islice
+from collections.abc import (
+	AsyncGenerator,
+	AsyncIterable,
+	Awaitable,
+	Callable,
+	Iterable,
+	Mapping,
+	Sequence,
+)
+from datetime import datetime
 from typing import Any
 
-from asyncpg import Pool
+from sqlalchemy import (
+	Boolean,
+	Table,
+	case,
+	cast,
+	column,
+	func,
+	inspect,
+	literal,
+	select,
+	tuple_,
+)
+from sqlalchemy import delete as sql_delete
+from sqlalchemy import insert as sql_insert
 from sqlalchemy import update as sql_update
+from sqlalchemy import values as sql_values
+from sqlalchemy.engine import Row, RowMapping
 from sqlalchemy.engine.result import Result
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncResult, AsyncSession
+from sqlalchemy.sql.dml import ReturningInsert
 from sqlalchemy.sql.elements import BinaryExpression
 from sqlalchemy.sql.selectable import Select
 
+from app.core.config import settings
 from app.domain.models.base import DeclarativeBaseModel
-from app.infra.db.helpers.query_builder import build_query
+from app.domain.schemas.bulk_insert import OnConflict
+from app.domain.schemas.pagination import (
+	CountMode,
+	Cursor,
+	CursorDirection,
+	PaginationMode,
+	SortDirection,
+)
+from app.infra.cache.base import row_decoder
+from app.infra.cache.entity import EntityCache, get_entity_cache
+from app.infra.cache.query import QueryCache, get_query_cache
+from app.infra.db.coalescer import InsertCoalescer, get_insert_coalescer
+from app.infra.db.helpers.copy import (
+	CopyStats,
+	MergeStats,
+	Record,
+	as_records,
+	copy_out,
+	iter_batches,
+	merge_copy,
+	parallel_copy,
+)
+from app.infra.db.helpers.counting import (
+	CountCache,
+	count_cache,
+	estimated_count,
+	exact_count,
+)
+from app.infra.db.helpers.query_builder import apply_keyset, build_query
+from app.infra.db.helpers.raw import fetch_dicts, positional
+from app.infra.db.loader import RowLoader, get_row_loader
 from app.infra.db.manager import DatabaseManager
+from app.infra.db.routing import pin_primary
 from app.infra.db.transaction import Transaction
 from app.infra.repositories.interfaces.postgres import Repository
 
@@ -31,14 +87,92 @@ class PostgresRepository[OrmModelT: DeclarativeBaseModel](Repository[OrmModelT])
 
 		return Transaction[OrmModelT](session=self.session)
 
+	async def _after_write(
+		self,
+		transaction: Transaction[OrmModelT] | None = None,
+		ids: Iterable[Any] | None = None,
+	) -> None:
+		"""Drops data derived from this table once a write is durable.
+
+		`ids` are the public ids of the rows touched; None means they are
+		unknown and every cached row of the table is dropped. Inside a
+		transaction this waits for the commit, so a rollback leaves derived
+		data untouched.
+
+		The session is pinned to the primary as well: writes made on other
+		connections (autocommit, coalesced inserts, COPY) do not go through
+		it, and its following reads must not hit a replica that has not
+		replayed them yet.
+		"""
+
+		pin_primary(self.session)
+		table: str = self.orm_model.__tablename__
+		touched: list[Any] | None = list(ids) if ids is not None else None
+
+		async def invalidate() -> None:
+			count_cache.invalidate(table)
+			entity_cache: EntityCache | None = get_entity_cache()
+			if entity_cache and touched != []:
+				await entity_cache.invalidate(table, touched)
+			query_cache: QueryCache | None = get_query_cache()
+			if query_cache:
+				await query_cache.invalidate(table)
+
+		if transaction:
+			transaction.on_commit(invalidate)
+		else:
+			await invalidate()
+
+	def _decode(self, row: dict[str, Any]) -> dict[str, Any]:
+		"""Types back the values of a row read from a cache, see `row_decoder`."""
+
+		return row_decoder(self.orm_model.__table__)(row)  # type: ignore
+
+	def _row_values(self, orm_model: OrmModelT) -> dict[str, Any]:
+		"""Snapshots the column values of a loaded ORM instance."""
+
+		return {
+			attr.key: getattr(orm_model, attr.key)
+			for attr in inspect(self.orm_model).column_attrs
+		}
+
 	async def create(
 		self, orm_model: OrmModelT, transaction: Transaction[OrmModelT]
 	) -> OrmModelT:
 		"""Creates a new record in the database."""
 
 		transaction.insert(orm_model=orm_model)
+		await self._after_write(transaction, ids=[])
 		return orm_model
 
+	async def create_returning(
+		self, values: dict[str, Any], transaction: Transaction[OrmModelT] | None = None
+	) -> dict[str, Any]:
+		"""Inserts one row with a single `INSERT ... RETURNING` and returns it.
+
+		Bypasses the unit of work: server defaults (id, timestamps) come back
+		with the insert itself. Outside a transaction the statement runs in
+		autocommit mode, so it is its own commit, and with INSERT_COALESCING
+		it is grouped with the concurrent creates of the same table.
+		"""
+
+		table: Table = self.orm_model.__table__  # type: ignore
+		stmt: ReturningInsert[Any] = (
+			sql_insert(table).values(**values).returning(*table.c)
+		)
+		coalescer: InsertCoalescer | None = get_insert_coalescer(table)
+		if transaction:
+			row: RowMapping = (await transaction.session.execute(stmt)).mappings().one()
+		elif coalescer:
+			created: dict[str, Any] = await coalescer.insert(values)
+			await self._after_write(ids=[])
+			return created
+		else:
+			async with DatabaseManager.autocommit_connection() as connection:
+				row = (await connection.execute(stmt)).mappings().one()
+		await self._after_write(transaction, ids=[])
+		return dict(row)
+
 	async def create_all(
 		self, orm_models: list[OrmModelT], transaction: Transaction[OrmModelT]
 	) -> None:
@@ -46,88 +180,445 @@ class PostgresRepository[OrmModelT: DeclarativeBaseModel](Repository[OrmModelT])
 
 		transaction.insert_all(orm_models=orm_models)
 		await transaction.session.flush()
+		await self._after_write(transaction, ids=[])
 
 	async def bulk_insert_copy(
 		self,
 		table: str,
 		columns: list[str],
-		data: Iterable[dict[str, Any]],
+		data: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
 		batch_size: int = 5000,
-	) -> None:
-		async def get_batches(
-			iterable: Iterable[dict[str, Any]], size: int
-		) -> AsyncGenerator[list[dict[str, Any]]]:
-			"""Generates batches of size `size` from any iterable."""
+		on_batch: Callable[[int], Awaitable[None]] | None = None,
+		workers: int | None = None,
+		max_in_flight: int | None = None,
+	) -> CopyStats:
+		"""Loads records with COPY in batches of `batch_size`, all or nothing.
 
-			it: Iterator[dict[str, Any]] = iter(iterable)
-			while True:
-				batch: list[dict[str, Any]] = list(islice(it, size))
-				if not batch:
-					break
-				yield batch
+		`data` may be an async iterable (e.g. rows parsed from a request body
+		that is still arriving): only the queued batches are held in memory,
+		and an error raised by the iterable rolls back everything copied.
+		`on_batch` is awaited after every batch with the rows copied so far.
 
-		pool: Pool = await DatabaseManager.get_asyncpg_pool()
+		Batches are spread across `workers` pool connections (COPY_WORKERS by
+		default, capped by the pool size) with at most `max_in_flight` queued.
 
-		async with pool.acquire() as connection:
-			async for batch in get_batches(iterable=data, size=batch_size):
-				records_gen: Generator[tuple[Any | None, ...]] = (
-					tuple(record.get(col, None) for col in columns) for record in batch
-				)
-				await connection.copy_records_to_table(
-					table_name=table,
-					records=records_gen,
+		Returns:
+		    CopyStats: Rows copied, elapsed time and per-connection throughput.
+		"""
+
+		return await self._copy(
+			table=table,
+			columns=columns,
+			records=as_records(data=data, columns=columns),
+			batch_size=batch_size,
+			on_batch=on_batch,
+			workers=workers,
+			max_in_flight=max_in_flight,
+		)
+
+	async def bulk_insert_columns(
+		self,
+		table: str,
+		columns: Mapping[str, Sequence[Any]],
+		batch_size: int = 5000,
+		on_batch: Callable[[int], Awaitable[None]] | None = None,
+		workers: int | None = None,
+		max_in_flight: int | None = None,
+	) -> CopyStats:
+		"""Loads equally long columns with COPY, see `bulk_insert_copy`.
+
+		Records are built by zipping the columns, without a mapping per row.
+		"""
+
+		return await self._copy(
+			table=table,
+			columns=list(columns),
+			records=zip(*columns.values(), strict=True),
+			batch_size=batch_size,
+			on_batch=on_batch,
+			workers=workers,
+			max_in_flight=max_in_flight,
+		)
+
+	async def bulk_merge_copy(
+		self,
+		columns: list[str],
+		data: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+		key: str = "id",
+		on_conflict: OnConflict = OnConflict.UPDATE,
+		batch_size: int = 5000,
+	) -> MergeStats:
+		"""Loads records with COPY into a staging table, then merges them.
+
+		The merge is an `INSERT ... SELECT ... ON CONFLICT (key)`, so loading
+		the same rows twice is idempotent and a row that already exists does
+		not abort the load. It runs on a single connection, the staging table
+		being private to it, and in one transaction.
+
+		Returns:
+		    MergeStats: Rows staged, inserted and updated.
+		"""
+
+		async with DatabaseManager.raw_connection() as connection:
+			async with connection.transaction():
+				stats: MergeStats = await merge_copy(
+					connection=connection,
+					target=self.orm_model.__table__,  # type: ignore
 					columns=columns,
+					key=key,
+					batches=iter_batches(
+						records=as_records(data=data, columns=columns), size=batch_size
+					),
+					update=on_conflict == OnConflict.UPDATE,
 				)
+		await self._after_write(ids=None if stats.updated else [])
+		return stats
+
+	async def _copy(
+		self,
+		table: str,
+		columns: list[str],
+		records: Iterable[Record] | AsyncIterable[Record],
+		batch_size: int,
+		on_batch: Callable[[int], Awaitable[None]] | None,
+		workers: int | None,
+		max_in_flight: int | None,
+	) -> CopyStats:
+		pool_size, max_overflow = DatabaseManager.pool_limits()
+		workers = max(1, min(workers or settings.COPY_WORKERS, pool_size + max_overflow))
+		max_in_flight = max_in_flight or settings.COPY_MAX_IN_FLIGHT or 2 * workers
+
+		stats: CopyStats = await parallel_copy(
+			connect=DatabaseManager.raw_connection,
+			table=table,
+			columns=columns,
+			batches=iter_batches(records=records, size=batch_size),
+			workers=workers,
+			max_in_flight=max_in_flight,
+			on_batch=on_batch,
+		)
+		await self._after_write(ids=[])
+		return stats
 
 	async def get(
-		self, filters: dict[str, Any], transaction: Transaction[OrmModelT] | None = None
-	) -> OrmModelT | None:
-		"""Retrieves a single record based on the provided filters."""
+		self,
+		filters: dict[str, Any],
+		transaction: Transaction[OrmModelT] | None = None,
+		fields: Sequence[str] | None = None,
+	) -> OrmModelT | Row[Any] | None:
+		"""Retrieves a single record based on the provided filters.
+
+		Lookups by id alone, outside a transaction, are served from the
+		entity cache when one is configured, and otherwise read together
+		with the concurrent ones when GET_COALESCING is on. Rows from either
+		come back as transient instances, not attached to the session.
+
+		With `fields`, a cache miss selects only those columns and returns
+		a plain row, which is not cached.
+		"""
+
+		entity_cache: EntityCache | None = (
+			get_entity_cache()
+			if transaction is None and filters.keys() == {"id"}
+			else None
+		)
+		table: str = self.orm_model.__tablename__
+		if entity_cache:
+			row: dict[str, Any] | None = await entity_cache.get(table, filters["id"])
+			if row is not None:
+				return self.orm_model(**self._decode(row))
+			version: int = await entity_cache.version(table)
 
 		session: AsyncSession = transaction.session if transaction else self.session
+		if fields:
+			projection: Select[Any] = build_query(
+				orm_model=self.orm_model, filter=filters, columns=fields
+			)  # type: ignore
+			return (await session.execute(projection)).first()
+
+		loader: RowLoader | None = (
+			get_row_loader(self.orm_model.__table__)  # type: ignore
+			if transaction is None and filters.keys() == {"id"}
+			else None
+		)
+		if loader:
+			loaded: dict[str, Any] | None = await loader.load(filters["id"])
+			if entity_cache and loaded is not None:
+				await entity_cache.set(table, filters["id"], version, loaded)
+			return self.orm_model(**loaded) if loaded is not None else None
+
 		query: Select[tuple[OrmModelT]] = build_query(
 			orm_model=self.orm_model, filter=filters
 		)  # type: ignore
 		data: OrmModelT | None = (await session.execute(query)).scalars().first()
+
+		if entity_cache and data is not None:
+			await entity_cache.set(table, filters["id"], version, self._row_values(data))
 		return data
 
+	async def modified_at(
+		self, filters: dict[str, Any], transaction: Transaction[OrmModelT] | None = None
+	) -> datetime | None:
+		"""Returns the `updated_at` of the record matching filters, None when
+		there is none, to validate a copy without reading the whole row.
+
+		Lookups by id alone are answered by the entity cache when it holds
+		the row; otherwise only that column is selected.
+		"""
+
+		entity_cache: EntityCache | None = (
+			get_entity_cache()
+			if transaction is None and filters.keys() == {"id"}
+			else None
+		)
+		if entity_cache:
+			row: dict[str, Any] | None = await entity_cache.get(
+				self.orm_model.__tablename__, filters["id"]
+			)
+			if row is not None:
+				return self._decode(row)["updated_at"]
+
+		session: AsyncSession = transaction.session if transaction else self.session
+		query: Select[tuple[datetime]] = build_query(
+			orm_model=self.orm_model, filter=filters, columns=["updated_at"]
+		)  # type: ignore
+		return (await session.execute(query)).scalars().first()
+
+	async def get_many(
+		self, ids: Sequence[Any], transaction: Transaction[OrmModelT] | None = None
+	) -> list[OrmModelT]:
+		"""Retrieves the records of `ids` with one `id IN (...)` query, in no
+		particular order. Unknown ids are left out."""
+
+		session: AsyncSession = transaction.session if transaction else self.session
+		query: Select[tuple[OrmModelT]] = build_query(
+			orm_model=self.orm_model, filter={"id__in": list(ids)}
+		)  # type: ignore
+		return list((await session.execute(query)).scalars().all())
+
 	async def query(
 		self,
 		filter_params: dict[str, Any],
 		transaction: Transaction[OrmModelT] | None = None,
-	) -> list[OrmModelT]:
+		fields: Sequence[str] | None = None,
+	) -> list[OrmModelT] | list[Row[Any]]:
 		"""Retrieves a list of records based on query parameters.
 
 		Uses the session's automatic transaction management.
 		No explicit transaction needed for simple reads.
+
+		Rows are sorted on `(order_by, id)` in the requested direction, in
+		both modes. In cursor mode the page is located by seeking on that
+		key instead of OFFSET, and comes back in that order whichever way it
+		was read.
+
+		With `fields`, only those columns (plus the keyset in cursor mode)
+		are selected and plain rows are returned instead of ORM instances.
+
+		Full pages read outside a transaction are served from the query
+		cache when one is configured, as transient instances not attached
+		to the session.
 		"""
 
+		query_cache: QueryCache | None = (
+			get_query_cache() if transaction is None and not fields else None
+		)
+		table: str = self.orm_model.__tablename__
+		if query_cache:
+			key: str = QueryCache.make_key(filter_params)
+			version, page = await query_cache.get(table, key)
+			if page is not None:
+				return [self.orm_model(**self._decode(row)) for row in page]
+
 		session: AsyncSession = transaction.session if transaction else self.session
+		query, cursor = self.page_query(filter_params, fields)
+		result: Result[Any] = await session.execute(query)
+		data: list[Any] = list(result.all() if fields else result.scalars().all())
+
+		if cursor and cursor.direction == CursorDirection.PREVIOUS:
+			data.reverse()
+		if query_cache:
+			await query_cache.set(
+				table, key, version, [self._row_values(row) for row in data]
+			)
+		return data
+
+	async def query_raw(
+		self,
+		filter_params: dict[str, Any],
+		fields: Sequence[str],
+		transaction: Transaction[OrmModelT] | None = None,
+	) -> list[dict[str, Any]]:
+		"""Same page as `query`, read on the driver connection underneath the
+		session and returned as plain dicts holding `fields` in that order.
+
+		Nothing goes through the ORM: no identity map, no instances, no
+		attribute instrumentation. The session still picks the connection,
+		so replica routing and an open transaction apply as usual. Outside a
+		transaction pages go through the query cache like those of `query`.
+		"""
+
+		query_cache: QueryCache | None = (
+			get_query_cache() if transaction is None else None
+		)
+		table: str = self.orm_model.__tablename__
+		if query_cache:
+			key: str = QueryCache.make_key(filter_params, fields)
+			version, page = await query_cache.get(table, key)
+			if page is not None:
+				return [self._decode(row) for row in page]
+
+		query, cursor = self.page_query(filter_params, fields)
+		driver: Any = await self._driver_connection(query, transaction)
+		data: list[dict[str, Any]] = await fetch_dicts(driver, query)
+
+		if cursor and cursor.direction == CursorDirection.PREVIOUS:
+			data.reverse()
+		if query_cache:
+			await query_cache.set(table, key, version, data)
+		return data
+
+	def export_query(self, filters: dict[str, Any], fields: Sequence[str]) -> Select[Any]:
+		"""Builds the SELECT of an export: `fields` of every row matching
+		`filters`, in keyset order. Invalid filters raise here, before any
+		row is streamed."""
+
+		query: Select[Any] = build_query(
+			orm_model=self.orm_model, filter=filters, columns=fields
+		)  # type: ignore
+		return apply_keyset(query=query, orm_model=self.orm_model)  # type: ignore
+
+	async def stream(
+		self,
+		query: Select[Any],
+		batch_size: int = 1000,
+		transaction: Transaction[OrmModelT] | None = None,
+	) -> AsyncGenerator[list[dict[str, Any]]]:
+		"""Yields the rows of `query` in batches from a server-side cursor,
+		holding one batch in memory at a time."""
+
+		session: AsyncSession = transaction.session if transaction else self.session
+		result: AsyncResult[Any] = await session.stream(
+			query.execution_options(yield_per=batch_size)
+		)
+		async for rows in result.mappings().partitions():
+			yield [dict(row) for row in rows]
+
+	async def copy_to(
+		self,
+		query: Select[Any],
+		format: str = "csv",
+		transaction: Transaction[OrmModelT] | None = None,
+	) -> AsyncGenerator[bytes]:
+		"""Streams `query` through `COPY ... TO STDOUT`, see `copy_out`."""
+
+		driver: Any = await self._driver_connection(query, transaction)
+		sql, args = positional(query)
+		async for chunk in copy_out(driver, sql, args, format=format):
+			yield chunk
+
+	async def _driver_connection(
+		self, query: Select[Any], transaction: Transaction[OrmModelT] | None
+	) -> Any:
+		"""Returns the asyncpg connection the session would run `query` on."""
+
+		session: AsyncSession = transaction.session if transaction else self.session
+		connection: AsyncConnection = await session.connection(
+			bind_arguments={"clause": query}
+		)
+		pooled = await connection.get_raw_connection()
+		return pooled.driver_connection
+
+	def page_query(
+		self, filter_params: dict[str, Any], fields: Sequence[str] | None
+	) -> tuple[Select[Any], Cursor | None]:
+		"""Builds the SELECT of one page, see `query`, along with the cursor it
+		seeks past. Pagination and sort params are popped from `filter_params`."""
+
 		limit: int = filter_params.pop("limit", 10)
 		offset: int = filter_params.pop("offset", 0)
-		query: Select[tuple[OrmModelT]] = build_query(
-			orm_model=self.orm_model, filter=filter_params
+		pagination: PaginationMode = filter_params.pop(
+			"pagination", PaginationMode.OFFSET
+		)
+		token: str | None = filter_params.pop("cursor", None)
+		order_by: str = filter_params.pop("order_by", "id")
+		direction: SortDirection = filter_params.pop("direction", SortDirection.ASC)
+		if fields and pagination == PaginationMode.CURSOR:
+			fields = list(dict.fromkeys([*fields, order_by, "id"]))
+		query: Select[Any] = build_query(
+			orm_model=self.orm_model, filter=filter_params, columns=fields
 		)  # type: ignore
+
+		cursor: Cursor | None = None
+		if pagination == PaginationMode.CURSOR and token:
+			cursor = Cursor.decode(token)
+		query = apply_keyset(
+			query=query,
+			orm_model=self.orm_model,  # type: ignore
+			cursor=cursor,
+			order_by=order_by,
+			descending=direction == SortDirection.DESC,
+		)
+		if pagination == PaginationMode.OFFSET and offset is not None:
+			query = query.offset(offset)
 		if limit is not None:
 			query = query.limit(limit)
-		if offset is not None:
-			query = query.offset(offset)
+		return query, cursor
+
+	async def count(
+		self,
+		filters: dict[str, Any],
+		mode: CountMode = CountMode.EXACT,
+		transaction: Transaction[OrmModelT] | None = None,
+	) -> int:
+		"""Counts the records matching filters.
+
+		`exact` runs a filtered COUNT, `estimated` trusts the planner and
+		`cached` memoizes exact counts per filter until the TTL expires or
+		the table is written to.
+		"""
+
+		session: AsyncSession = transaction.session if transaction else self.session
+		conditions: list[BinaryExpression[Any]] = build_query(
+			orm_model=self.orm_model, filter=filters, return_conditions=True
+		)  # type: ignore
 
-		data: Sequence[OrmModelT] = (await session.execute(query)).scalars().all()
+		if mode == CountMode.ESTIMATED:
+			return await estimated_count(session, self.orm_model, conditions)
+		if mode == CountMode.EXACT:
+			return await exact_count(session, self.orm_model, conditions)
 
-		return list(data)
+		table: str = self.orm_model.__tablename__
+		key: str = CountCache.make_key(filters)
+		cached: int | None = count_cache.get(table, key)
+		if cached is None:
+			cached = await exact_count(session, self.orm_model, conditions)
+			count_cache.set(table, key, cached)
+		return cached
 
 	async def partial_update(
 		self,
 		filters: dict[str, Any],
 		data: dict[str, Any],
 		transaction: Transaction[OrmModelT],
+		skip_unchanged: bool = False,
 	) -> OrmModelT | None:
-		"""Partially update records matching filters with the provided data."""
+		"""Partially update records matching filters with the provided data.
+
+		With `skip_unchanged`, rows already holding these values are left
+		alone (no new row version, `updated_at` kept) and, like rows that do
+		not match, are not returned.
+		"""
 
 		conditions: list[BinaryExpression[Any]] = build_query(
 			orm_model=self.orm_model, filter=filters, return_conditions=True
 		)  # type: ignore
+		if skip_unchanged:
+			columns: list[Any] = [getattr(self.orm_model, name) for name in data]
+			values: list[Any] = [
+				literal(value, col.type) for col, value in zip(columns, data.values())
+			]
+			conditions.append(tuple_(*columns).is_distinct_from(tuple_(*values)))  # type: ignore
 
 		stmt = (
 			sql_update(self.orm_model)
@@ -138,9 +629,146 @@ class PostgresRepository[OrmModelT: DeclarativeBaseModel](Repository[OrmModelT])
 		)
 
 		result: Result[tuple[OrmModelT]] = await transaction.session.execute(stmt)
-		return result.scalars().first()
+		updated: Sequence[OrmModelT] = result.scalars().all()
+		await self._after_write(transaction, ids=[row.id for row in updated])  # type: ignore
+		return updated[0] if updated else None
+
+	async def bulk_partial_update(
+		self,
+		changes: Sequence[dict[str, Any]],
+		transaction: Transaction[OrmModelT],
+		key: str = "id",
+		batch_size: int = 1000,
+	) -> tuple[int, int]:
+		"""Applies per-row partial updates by joining the table to a VALUES list.
+
+		Each change holds `key` plus only the columns to set, the others keep
+		their value. A row is only rewritten (and its `onupdate` columns, like
+		updated_at, bumped) when one of its values actually changes. Changes
+		are sent `batch_size` rows per statement, within `transaction`.
+
+		Returns:
+		    tuple[int, int]: Rows matched by key, and rows actually changed.
+		"""
+
+		table: Table = self.orm_model.__table__  # type: ignore
+		sent: set[str] = {name for change in changes for name in change} - {key}
+		fields: list[str] = [col.name for col in table.c if col.name in sent]
+		touched: dict[str, Any] = {
+			col.name: col.onupdate.arg  # type: ignore
+			for col in table.c
+			if col.onupdate is not None and col.name not in sent
+		}
+
+		matched: int = 0
+		changed_ids: list[Any] = []
+		for start in range(0, len(changes), batch_size):
+			batch: Sequence[dict[str, Any]] = changes[start : start + batch_size]
+			rows = sql_values(
+				column(key, table.c[key].type),
+				*(column(name, table.c[name].type) for name in fields),
+				*(column(f"set_{name}", Boolean) for name in fields),
+				name="v",
+			).data(
+				[
+					(
+						change[key],
+						*(change.get(name) for name in fields),
+						*(name in change for name in fields),
+					)
+					for change in batch
+				]
+			)
+			source = select(rows).cte("changes")
+			new_values: dict[str, Any] = {
+				name: case(
+					(source.c[f"set_{name}"], cast(source.c[name], table.c[name].type)),
+					else_=table.c[name],
+				)
+				for name in fields
+			}
+			matched_rows = (
+				select(func.count())
+				.select_from(table.join(source, table.c[key] == source.c[key]))
+				.scalar_subquery()
+			)
+			if not fields:
+				matched += (
+					await transaction.session.execute(select(matched_rows))
+				).scalar_one()
+				continue
+
+			updated = (
+				sql_update(table)
+				.values(**new_values, **touched)
+				.where(
+					table.c[key] == source.c[key],
+					tuple_(*(table.c[name] for name in fields)).is_distinct_from(
+						tuple_(*new_values.values())
+					),
+				)
+				.returning(table.c[key])
+				.cte("changed")
+			)
+			stmt = select(
+				matched_rows, select(func.array_agg(updated.c[key])).scalar_subquery()
+			)
+			result: Row[Any] = (await transaction.session.execute(stmt)).one()
+			matched += result[0]
+			changed_ids.extend(result[1] or [])
+
+		await self._after_write(transaction, ids=changed_ids)
+		return matched, len(changed_ids)
 
 	async def delete(
-		self, orm_model: OrmModelT, transaction: Transaction[OrmModelT]
-	) -> None:
-		await transaction.session.delete(orm_model)
+		self, filters: dict[str, Any], transaction: Transaction[OrmModelT]
+	) -> list[Any]:
+		"""Deletes the records matching filters with one `DELETE ... RETURNING`.
+
+		Returns:
+		    list[Any]: Public ids of the deleted records.
+		"""
+
+		conditions: list[BinaryExpression[Any]] = build_query(
+			orm_model=self.orm_model, filter=filters, return_conditions=True
+		)  # type: ignore
+		stmt = (
+			sql_delete(self.orm_model)
+			.where(*conditions)
+			.execution_options(synchronize_session=False)
+			.returning(self.orm_model.id)  # type: ignore
+		)
+		ids: list[Any] = list((await transaction.session.execute(stmt)).scalars().all())
+		await self._after_write(transaction, ids=ids)
+		return ids
+
+	async def delete_in_batches(self, filters: dict[str, Any], batch_size: int) -> int:
+		"""Deletes the records matching filters, `batch_size` rows at a time.
+
+		Each batch is its own autocommit statement, so locks are held briefly
+		and vacuum can reclaim the space between batches. A failure leaves the
+		batches already deleted in place.
+
+		Returns:
+		    int: Number of records deleted.
+		"""
+
+		table: Table = self.orm_model.__table__  # type: ignore
+		conditions: list[BinaryExpression[Any]] = build_query(
+			orm_model=self.orm_model, filter=filters, return_conditions=True
+		)  # type: ignore
+		batch = select(table.c.pk_id).where(*conditions).limit(batch_size)
+		stmt = (
+			sql_delete(table)
+			.where(table.c.pk_id.in_(batch.scalar_subquery()))
+			.returning(table.c.id)
+		)
+
+		deleted: int = 0
+		async with DatabaseManager.autocommit_connection() as connection:
+			while True:
+				ids: Sequence[Any] = (await connection.execute(stmt)).scalars().all()
+				deleted += len(ids)
+				await self._after_write(ids=ids)
+				if len(ids) < batch_size:
+					return deleted
@@ -7,13 +7,17 @@ from typing import Any
 import uvicorn
 from fastapi import FastAPI
 
+from app.api.v1.routers.cache import router as cache_router
 from app.api.v1.routers.example import router as example_router
+from app.api.v1.routers.jobs import router as jobs_router
 from app.core.config import settings
 from app.core.exceptions.db import DatabaseConnectionError
 from app.core.exceptions.handlers import register_exception_handlers
 from app.core.logging import LOGGING_CONFIG, logger
 from app.core.middlewares.language import LanguageMiddleware
+from app.infra.db.coalescer import close_insert_coalescers
 from app.infra.db.manager import DatabaseManager
+from app.infra.jobs.runner import get_job_runner
 
 
 @asynccontextmanager
@@ -24,9 +28,14 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None]:
 	except Exception as exc:
 		raise DatabaseConnectionError(message=f"Unable to connect to the database: {exc}")
 	logger.info("Database healthy")
+	await get_job_runner().fail_stale()
 
 	yield
 
+	await get_job_runner().shutdown()
+	await close_insert_coalescers()
+	await DatabaseManager.dispose()
+
 
 class App(FastAPI):
 	"""Custom FastAPI application class"""
@@ -58,6 +67,8 @@ class App(FastAPI):
 	def __include_routers(self) -> None:
 		"""Includes all predefined API routers into the application"""
 		self.include_router(example_router)
+		self.include_router(jobs_router)
+		self.include_router(cache_router)
 
 
 app: FastAPI = App()
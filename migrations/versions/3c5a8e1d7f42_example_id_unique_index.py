@@ -0,0 +1,43 @@
+"""example id unique index
+
+Revision ID: 3c5a8e1d7f42
+Revises: b7e2a9c41f05
+Create Date: 2026-10-18 14:37:05.118264
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c5a8e1d7f42"
+down_revision: str | Sequence[str] | None = "b7e2a9c41f05"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+	"""Upgrade schema."""
+	# CONCURRENTLY can't run inside the migration transaction. If it fails
+	# (e.g. duplicated ids) it leaves an INVALID index: drop it before retrying
+	with op.get_context().autocommit_block():
+		op.create_index(
+			"ix_example_id",
+			"example",
+			["id"],
+			unique=True,
+			postgresql_concurrently=True,
+			if_not_exists=True,
+		)
+
+
+def downgrade() -> None:
+	"""Downgrade schema."""
+	with op.get_context().autocommit_block():
+		op.drop_index(
+			"ix_example_id",
+			table_name="example",
+			postgresql_concurrently=True,
+			if_exists=True,
+		)
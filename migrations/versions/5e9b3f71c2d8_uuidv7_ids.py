@@ -0,0 +1,64 @@
+"""uuidv7 ids
+
+Revision ID: 5e9b3f71c2d8
+Revises: 3c5a8e1d7f42
+Create Date: 2026-10-18 16:02:41.530917
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e9b3f71c2d8"
+down_revision: str | Sequence[str] | None = "3c5a8e1d7f42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES: tuple[str, ...] = ("example", "job")
+
+# Postgres 18 has uuidv7() built in; this one runs on any version with
+# gen_random_uuid(): the first 48 bits become the Unix time in milliseconds
+# and the version nibble turns from 4 into 7
+UUID_GENERATE_V7: str = """
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+	SELECT encode(
+		set_bit(
+			set_bit(
+				overlay(
+					uuid_send(gen_random_uuid())
+					PLACING substring(
+						int8send(
+							floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint
+						)
+						FROM 3
+					)
+					FROM 1 FOR 6
+				),
+				52, 1
+			),
+			53, 1
+		),
+		'hex'
+	)::uuid
+$$ LANGUAGE sql VOLATILE PARALLEL SAFE
+"""
+
+
+def upgrade() -> None:
+	"""Upgrade schema."""
+	# Existing rows keep their v4 ids, which clients may hold on to. They stay
+	# unique and keep sorting in a stable (if not chronological) order, so id
+	# keyset pagination is still consistent across both kinds of ids
+	op.execute(UUID_GENERATE_V7)
+	for table in TABLES:
+		op.alter_column(table, "id", server_default=sa.text("uuid_generate_v7()"))
+
+
+def downgrade() -> None:
+	"""Downgrade schema."""
+	for table in TABLES:
+		op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+	op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
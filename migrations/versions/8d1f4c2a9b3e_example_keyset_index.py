@@ -0,0 +1,42 @@
+"""example keyset index
+
+Revision ID: 8d1f4c2a9b3e
+Revises: 527cdfa6b976
+Create Date: 2026-10-18 09:12:41.203518
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d1f4c2a9b3e"
+down_revision: str | Sequence[str] | None = "527cdfa6b976"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+	"""Upgrade schema."""
+	# CONCURRENTLY can't run inside the migration transaction
+	with op.get_context().autocommit_block():
+		op.create_index(
+			"ix_example_created_at_pk_id",
+			"example",
+			["created_at", "pk_id"],
+			unique=False,
+			postgresql_concurrently=True,
+			if_not_exists=True,
+		)
+
+
+def downgrade() -> None:
+	"""Downgrade schema."""
+	with op.get_context().autocommit_block():
+		op.drop_index(
+			"ix_example_created_at_pk_id",
+			table_name="example",
+			postgresql_concurrently=True,
+			if_exists=True,
+		)
@@ -0,0 +1,62 @@
+"""created_at id index
+
+Revision ID: 9a4c6e2b8f13
+Revises: 5e9b3f71c2d8
+Create Date: 2026-10-18 17:48:12.604381
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4c6e2b8f13"
+down_revision: str | Sequence[str] | None = "5e9b3f71c2d8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES: tuple[str, ...] = ("example", "job")
+
+
+def upgrade() -> None:
+	"""Upgrade schema."""
+	# Sorting by created_at breaks ties on id now, which this index covers
+	# whole. The new one is built before the old one goes away so sorts are
+	# never left without an index; CONCURRENTLY can't run in a transaction
+	with op.get_context().autocommit_block():
+		for table in TABLES:
+			op.create_index(
+				f"ix_{table}_created_at_id",
+				table,
+				["created_at", "id"],
+				unique=False,
+				postgresql_concurrently=True,
+				if_not_exists=True,
+			)
+			op.drop_index(
+				f"ix_{table}_created_at_pk_id",
+				table_name=table,
+				postgresql_concurrently=True,
+				if_exists=True,
+			)
+
+
+def downgrade() -> None:
+	"""Downgrade schema."""
+	with op.get_context().autocommit_block():
+		for table in TABLES:
+			op.create_index(
+				f"ix_{table}_created_at_pk_id",
+				table,
+				["created_at", "pk_id"],
+				unique=False,
+				postgresql_concurrently=True,
+				if_not_exists=True,
+			)
+			op.drop_index(
+				f"ix_{table}_created_at_id",
+				table_name=table,
+				postgresql_concurrently=True,
+				if_exists=True,
+			)
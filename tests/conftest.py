@@ -1,12 +1,17 @@
+import asyncio
 from contextlib import contextmanager
 from datetime import UTC, datetime
+from fnmatch import fnmatchcase
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
+from app.domain.models.example import ExampleModel
 from app.domain.usecases.example import ExampleUsecase
+from app.infra.jobs.runner import JobRunner
+from app.infra.jobs.store import MemoryJobStore
 from app.main import app
 
 
@@ -23,11 +28,21 @@ def mock_usecase(mocker):
 	"""Mock for ExampleUsecase using pytest-mock."""
 	mock = mocker.MagicMock()
 	mock.get = mocker.AsyncMock()
+	mock.modified_at = mocker.AsyncMock(return_value=datetime(2025, 11, 6, tzinfo=UTC))
+	mock.get_many = mocker.AsyncMock()
 	mock.query = mocker.AsyncMock()
+	mock.query_json = mocker.AsyncMock()
+	mock.page_tag = mocker.AsyncMock(return_value='W/"page"')
 	mock.create = mocker.AsyncMock()
 	mock.delete = mocker.AsyncMock()
+	mock.delete_by_filter = mocker.AsyncMock()
 	mock.bulk_insert = mocker.AsyncMock()
+	mock.bulk_insert_stream = mocker.AsyncMock()
+	mock.submit_bulk_insert = mocker.AsyncMock()
+	mock.bulk_insert_columnar = mocker.AsyncMock()
+	mock.bulk_merge = mocker.AsyncMock()
 	mock.partial_update = mocker.AsyncMock()
+	mock.bulk_partial_update = mocker.AsyncMock()
 	return mock
 
 
@@ -53,6 +68,42 @@ def mock_example_usecase(mock_usecase):
 		yield mock_usecase
 
 
+@pytest.fixture
+def mock_example_repository(mocker):
+	"""Mock for ExampleRepository with the real ORM model."""
+	mock = mocker.MagicMock()
+	mock.orm_model = ExampleModel
+	mock.get = mocker.AsyncMock()
+	mock.modified_at = mocker.AsyncMock()
+	mock.get_many = mocker.AsyncMock()
+	mock.create_returning = mocker.AsyncMock()
+	mock.query = mocker.AsyncMock()
+	mock.query_raw = mocker.AsyncMock()
+	mock.count = mocker.AsyncMock()
+	mock.bulk_insert_copy = mocker.AsyncMock()
+	mock.bulk_insert_columns = mocker.AsyncMock()
+	mock.bulk_merge_copy = mocker.AsyncMock()
+	mock.partial_update = mocker.AsyncMock()
+	mock.bulk_partial_update = mocker.AsyncMock()
+	mock.delete = mocker.AsyncMock()
+	mock.delete_in_batches = mocker.AsyncMock()
+	return mock
+
+
+@pytest.fixture
+def job_runner():
+	"""Job runner backed by an in-memory store."""
+	return JobRunner(store=MemoryJobStore(), concurrency=1)
+
+
+@pytest.fixture
+def example_usecase(mock_example_repository, job_runner):
+	"""ExampleUsecase wired to the mocked repository."""
+	return ExampleUsecase(
+		example_repository=mock_example_repository, job_runner=job_runner
+	)
+
+
 @pytest.fixture
 def single_examaple_response_fac():
 	def _factory(**overrides):
@@ -67,3 +118,82 @@ def single_examaple_response_fac():
 		return {**base, **overrides}
 
 	return _factory
+
+
+class RespStandIn:
+	"""Tiny in-process Redis-protocol server for the commands the app uses."""
+
+	def __init__(self):
+		self.data = {}
+		self.server = None
+
+	@property
+	def url(self):
+		host, port = self.server.sockets[0].getsockname()[:2]
+		return f"redis://{host}:{port}/0"
+
+	async def start(self):
+		self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+	async def stop(self):
+		self.server.close()
+		await self.server.wait_closed()
+
+	async def _handle(self, reader, writer):
+		try:
+			while line := await reader.readline():
+				args = []
+				for _ in range(int(line[1:-2])):
+					length = int((await reader.readline())[1:-2])
+					args.append((await reader.readexactly(length + 2))[:-2])
+				writer.write(self._reply(self._dispatch(args)))
+				await writer.drain()
+		finally:
+			writer.close()
+
+	def _dispatch(self, args):
+		command, *rest = args
+		command = command.upper()
+		if command == b"GET":
+			return self.data.get(rest[0])
+		elif command == b"SET":
+			if b"NX" in rest[2:] and rest[0] in self.data:
+				return None
+			self.data[rest[0]] = rest[1]
+			return "OK"
+		elif command == b"DEL":
+			return sum(self.data.pop(key, None) is not None for key in rest)
+		elif command == b"INCR":
+			self.data[rest[0]] = str(int(self.data.get(rest[0], 0)) + 1).encode()
+			return int(self.data[rest[0]])
+		elif command == b"SCAN":
+			pattern = rest[rest.index(b"MATCH") + 1].decode().replace("\\", "")
+			keys = [key for key in self.data if fnmatchcase(key.decode(), pattern)]
+			return [b"0", keys]
+		elif command == b"INFO":
+			return b"# Stats\r\nevicted_keys:0\r\n"
+		elif command == b"DBSIZE":
+			return len(self.data)
+		return Exception(f"ERR unknown command {command.decode()}")
+
+	def _reply(self, value):
+		if value is None:
+			return b"$-1\r\n"
+		if isinstance(value, Exception):
+			return f"-{value}\r\n".encode()
+		if isinstance(value, str):
+			return f"+{value}\r\n".encode()
+		if isinstance(value, int):
+			return f":{value}\r\n".encode()
+		if isinstance(value, list):
+			return b"*%d\r\n" % len(value) + b"".join(map(self._reply, value))
+		return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+@pytest_asyncio.fixture
+async def resp_server():
+	"""Redis-protocol stand-in listening on a random local port."""
+	server = RespStandIn()
+	await server.start()
+	yield server
+	await server.stop()
@@ -0,0 +1,46 @@
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import Request
+
+from app.core.conditional import entity_tag, http_date, is_fresh
+
+
+def _request(**headers):
+	return Request(
+		{
+			"type": "http",
+			"method": "GET",
+			"headers": [
+				(key.replace("_", "-").encode(), value.encode())
+				for key, value in headers.items()
+			],
+		}
+	)
+
+
+UPDATED_AT = datetime(2025, 11, 6, 2, 13, 28, 907473, tzinfo=UTC)
+ETAG = entity_tag("http://test/example/1", UPDATED_AT)
+
+
+def test_entity_tag_changes_with_its_parts():
+	assert ETAG == entity_tag("http://test/example/1", UPDATED_AT)
+	assert ETAG != entity_tag("http://test/example/1", datetime.now(UTC))
+	assert ETAG.startswith('W/"')
+
+
+@pytest.mark.parametrize(
+	("headers", "fresh"),
+	[
+		({}, False),
+		({"if_none_match": ETAG}, True),
+		({"if_none_match": f'"other", {ETAG.removeprefix("W/")}'}, True),
+		({"if_none_match": "*"}, True),
+		({"if_none_match": '"other"', "if_modified_since": http_date(UPDATED_AT)}, False),
+		({"if_modified_since": http_date(UPDATED_AT)}, True),
+		({"if_modified_since": "Wed, 05 Nov 2025 00:00:00 GMT"}, False),
+		({"if_modified_since": "yesterday"}, False),
+	],
+)
+def test_is_fresh_follows_precedence_of_validators(headers, fresh):
+	assert is_fresh(_request(**headers), ETAG, UPDATED_AT) is fresh
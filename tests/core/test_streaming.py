@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from app.core.streaming import iter_json_array, iter_json_stream, iter_ndjson
+
+
+async def _chunks(data, size):
+	for start in range(0, len(data), size):
+		yield data[start : start + size]
+
+
+async def _collect(items):
+	return [item async for item in items]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 3, 64])
+async def test_iter_json_array_yields_elements_across_chunk_boundaries(size):
+	payload = [{"name": "joão ]", "age": 19}, {"nested": [1, {"x": ","}]}, 123, None]
+	data = json.dumps(payload).encode()
+
+	assert await _collect(iter_json_array(_chunks(data, size))) == payload
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	"data",
+	[
+		b'{"a": 1}',
+		b"[1, 2",
+		b'[{"a": }]',
+		b"[1 2 3]",
+		b"[,,1,,]",
+		b"[1,]",
+		b"[1]garbage",
+		b"[1] []",
+		b"[1}",
+		b"",
+	],
+)
+async def test_iter_json_array_rejects_malformed_documents(data):
+	with pytest.raises(json.JSONDecodeError):
+		await _collect(iter_json_array(_chunks(data, 2)))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 4])
+async def test_iter_json_array_handles_tokens_split_across_chunks(size):
+	data = b' [ 1.5e3 , "a\\\\\\"]" , true, [] ,{"b": -2} ]\n '
+
+	assert await _collect(iter_json_array(_chunks(data, size))) == [
+		1.5e3,
+		'a\\"]',
+		True,
+		[],
+		{"b": -2},
+	]
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_rejects_a_bad_element_without_reading_on():
+	async def chunks():
+		yield b'[{"a": 1}, {"a": nope}, '
+		while True:
+			yield b'{"a": 1}, '
+
+	with pytest.raises(json.JSONDecodeError):
+		await _collect(iter_json_array(chunks()))
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_skips_blank_lines_and_reads_last_line():
+	data = b'{"a": 1}\n\n{"a": 2}'
+
+	assert await _collect(iter_ndjson(_chunks(data, 3))) == [{"a": 1}, {"a": 2}]
+
+
+def test_iter_json_stream_rejects_unknown_media_type():
+	with pytest.raises(ValueError):
+		iter_json_stream(_chunks(b"", 1), "text/csv")
@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+
+from app.domain.schemas.bulk_insert import BulkInsertColumnar
+from app.domain.schemas.example import ExampleColumns
+
+
+def test_columnar_payload_fills_omitted_columns_with_null():
+	data = BulkInsertColumnar[ExampleColumns](columns={"name": ["felipe", "gustavo"]})
+
+	assert data.to_columns() == {"name": ["felipe", "gustavo"], "age": [None, None]}
+
+
+def test_columnar_payload_validates_each_column_with_field_constraints():
+	with pytest.raises(ValidationError) as exc_info:
+		BulkInsertColumnar[ExampleColumns](
+			columns={"name": ["felipe", "gu"], "age": [19, 500]}
+		)
+
+	locs = {err["loc"] for err in exc_info.value.errors()}
+	assert locs == {("columns", "name", 1), ("columns", "age", 1)}
+
+
+@pytest.mark.parametrize(
+	"columns",
+	[{"name": ["felipe"], "age": [19, 20]}, {"name": []}, {}],
+)
+def test_columnar_payload_rejects_uneven_or_empty_columns(columns):
+	with pytest.raises(ValidationError):
+		BulkInsertColumnar[ExampleColumns](columns=columns)
@@ -0,0 +1,357 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from fastapi import Request
+from pydantic import TypeAdapter
+
+from app.core.exceptions.db import ObjectNotFound
+from app.core.exceptions.payload import InvalidPayloadError, UnsupportedMediaTypeError
+from app.core.exceptions.query import InvalidFieldsError, InvalidFilterError
+from app.domain.schemas.bulk_insert import BulkInsertCreate
+from app.domain.schemas.collection_reponse import CollectionResponse
+from app.domain.schemas.example import (
+	ExampleCreate,
+	ExampleExportParams,
+	ExampleFilterParams,
+	ExampleQueryParams,
+	ExampleResponse,
+	ExampleUpdate,
+)
+from app.domain.schemas.job import JobStatus
+from app.domain.schemas.pagination import PaginationMode
+from app.infra.db.helpers.copy import CopyStats
+
+
+async def _chunks(*parts):
+	for part in parts:
+		yield part
+
+
+async def _consume_copy(table, columns, data, **kwargs):
+	return CopyStats(rows=len([row async for row in data]))
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_stream_validates_and_copies_rows(
+	example_usecase, mock_example_repository
+):
+	copied = []
+
+	async def copy(table, columns, data, **kwargs):
+		copied.extend([row async for row in data])
+		return CopyStats(rows=len(copied))
+
+	mock_example_repository.bulk_insert_copy.side_effect = copy
+	await example_usecase.bulk_insert_stream(
+		chunks=_chunks(b'{"name": "felipe", "age": 19}\n{"name": "gus', b'tavo"}\n'),
+		media_type="application/x-ndjson",
+	)
+
+	assert copied == [{"name": "felipe", "age": 19}, {"name": "gustavo", "age": None}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_stream_reports_invalid_row(
+	example_usecase, mock_example_repository
+):
+	mock_example_repository.bulk_insert_copy.side_effect = _consume_copy
+	with pytest.raises(InvalidPayloadError) as exc_info:
+		await example_usecase.bulk_insert_stream(
+			chunks=_chunks(b'[{"name": "felipe"}, {"age": 500}]'),
+			media_type="application/json",
+		)
+
+	assert exc_info.value.errors[0]["row"] == 1
+	assert exc_info.value.errors[0]["loc"] == ("age",)
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_stream_rejects_unknown_media_type(example_usecase):
+	with pytest.raises(UnsupportedMediaTypeError):
+		await example_usecase.bulk_insert_stream(
+			chunks=_chunks(b""), media_type="text/csv"
+		)
+
+
+@pytest.mark.asyncio
+async def test_submit_bulk_insert_returns_pending_job_and_runs_copy(
+	example_usecase, mock_example_repository, job_runner
+):
+	async def copy(table, columns, data, on_batch, **kwargs):
+		rows = list(data)
+		await on_batch(len(rows))
+		return CopyStats(rows=len(rows))
+
+	mock_example_repository.bulk_insert_copy.side_effect = copy
+	data = BulkInsertCreate[ExampleCreate](
+		items=[ExampleCreate(name="felipe", age=19), ExampleCreate(name="gustavo")]
+	)
+
+	job = await example_usecase.submit_bulk_insert(data=data)
+	assert job.status == JobStatus.PENDING
+	assert job.total_rows == 2
+
+	await job_runner.shutdown()
+	finished = await job_runner.store.get(job.id)
+	assert finished.status == JobStatus.SUCCEEDED
+	assert finished.inserted_rows == 2
+	assert finished.progress == 1.0
+
+
+@pytest.mark.asyncio
+async def test_create_maps_returned_row_to_response(
+	example_usecase, mock_example_repository
+):
+	now = datetime.now(UTC)
+	row = {"pk_id": 1, "id": uuid4(), "name": "felipe", "age": 19}
+	mock_example_repository.create_returning.return_value = {
+		**row,
+		"created_at": now,
+		"updated_at": now,
+	}
+
+	response = await example_usecase.create(data=ExampleCreate(name="felipe", age=19))
+
+	assert response.id == row["id"]
+	assert response.created_at == now
+	mock_example_repository.create_returning.assert_awaited_once_with(
+		values={"name": "felipe", "age": 19}
+	)
+
+
+@pytest.mark.asyncio
+async def test_get_with_fields_returns_only_those_fields(
+	example_usecase, mock_example_repository
+):
+	id = uuid4()
+	now = datetime.now(UTC)
+	mock_example_repository.get.return_value = SimpleNamespace(
+		id=id, name="felipe", updated_at=now
+	)
+
+	response = await example_usecase.get(id=id, fields="id, name,id")
+
+	assert response.model_dump() == {"id": id, "name": "felipe"}
+	mock_example_repository.get.assert_awaited_once_with(
+		filters={"id": id}, fields=("id", "name", "updated_at")
+	)
+	assert await example_usecase.modified_at(id=id) == now
+	mock_example_repository.modified_at.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_many_keeps_request_order_and_lists_missing_ids(
+	example_usecase, mock_example_repository
+):
+	now = datetime.now(UTC)
+	ids = [uuid4() for _ in range(3)]
+	mock_example_repository.get_many.return_value = [
+		SimpleNamespace(id=id, created_at=now, updated_at=now, name=None, age=None)
+		for id in reversed(ids[:2])
+	]
+
+	response = await example_usecase.get_many(ids=[ids[1], ids[2], ids[0], ids[1]])
+
+	assert [example.id for example in response.results] == [ids[1], ids[0]]
+	assert response.missing == [ids[2]]
+	mock_example_repository.get_many.assert_awaited_once_with(
+		ids=[ids[1], ids[2], ids[0]]
+	)
+
+
+@pytest.mark.asyncio
+async def test_get_rejects_unknown_fields(example_usecase, mock_example_repository):
+	with pytest.raises(InvalidFieldsError):
+		await example_usecase.get(id=uuid4(), fields="name,pk_id")
+
+	mock_example_repository.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_query_json_matches_the_validated_response_byte_for_byte(
+	example_usecase, mock_example_repository
+):
+	now = datetime.now(UTC)
+	rows = [
+		{
+			"id": uuid4(),
+			"created_at": now,
+			"updated_at": now,
+			"name": "joão",
+			"age": age,
+			"pk_id": age,
+		}
+		for age in (19, 20)
+	]
+	mock_example_repository.query.return_value = [SimpleNamespace(**row) for row in rows]
+	mock_example_repository.query_raw.return_value = rows
+	mock_example_repository.count.return_value = 7
+	request = Request(
+		{
+			"type": "http",
+			"method": "GET",
+			"scheme": "http",
+			"server": ("test", 80),
+			"path": "/example/",
+			"query_string": b"limit=2&pagination=cursor",
+			"headers": [],
+		}
+	)
+	query_params = ExampleQueryParams(limit=2, pagination=PaginationMode.CURSOR)
+
+	validated = await example_usecase.query(query_params=query_params, request=request)
+	raw = await example_usecase.query_json(query_params=query_params, request=request)
+
+	assert validated.next is not None
+	assert raw == TypeAdapter(CollectionResponse[ExampleResponse]).dump_json(validated)
+	assert mock_example_repository.query_raw.await_args.kwargs["fields"] == [
+		"id",
+		"created_at",
+		"updated_at",
+		"name",
+		"age",
+	]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_encodes_each_row_like_the_api(
+	example_usecase, mock_example_repository
+):
+	now = datetime.now(UTC)
+	rows = [
+		{"id": uuid4(), "created_at": now, "updated_at": now, "name": "felipe", "age": 19}
+	]
+
+	async def stream(query, batch_size):
+		yield rows
+		yield rows
+
+	mock_example_repository.export_query = Mock(return_value="query")
+	mock_example_repository.stream = stream
+	request = Request({"type": "http", "query_string": b"age__gte=18", "headers": []})
+
+	content = example_usecase.export(
+		export_params=ExampleExportParams(name="felipe"), request=request
+	)
+	lines = b"".join([chunk async for chunk in content]).splitlines()
+
+	assert (
+		lines == [ExampleResponse.model_validate(rows[0]).model_dump_json().encode()] * 2
+	)
+	mock_example_repository.export_query.assert_called_once_with(
+		filters={"name": "felipe", "age__gte": "18"},
+		fields=["id", "created_at", "updated_at", "name", "age"],
+	)
+
+
+@pytest.mark.asyncio
+async def test_delete_raises_not_found_when_nothing_deleted(
+	example_usecase, mock_example_repository
+):
+	mock_example_repository.delete.return_value = []
+
+	with pytest.raises(ObjectNotFound):
+		await example_usecase.delete(id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_delete_by_filter_requires_a_filter(
+	example_usecase, mock_example_repository
+):
+	with pytest.raises(InvalidFilterError):
+		await example_usecase.delete_by_filter(filters=ExampleFilterParams())
+
+	mock_example_repository.delete_in_batches.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_partial_update_writes_only_fields_sent(
+	example_usecase, mock_example_repository, single_examaple_response_fac
+):
+	mock_example_repository.partial_update.return_value = single_examaple_response_fac()
+	id = uuid4()
+
+	await example_usecase.partial_update(data=ExampleUpdate(age=20), id=id)
+
+	mock_example_repository.partial_update.assert_awaited_once()
+	kwargs = mock_example_repository.partial_update.call_args.kwargs
+	assert kwargs["data"] == {"age": 20}
+	assert kwargs["skip_unchanged"] is True
+	mock_example_repository.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_partial_update_without_changes_returns_current_record(
+	example_usecase, mock_example_repository, single_examaple_response_fac
+):
+	current = single_examaple_response_fac()
+	mock_example_repository.get.return_value = current
+
+	response = await example_usecase.partial_update(data=ExampleUpdate(), id=uuid4())
+
+	assert str(response.id) == current["id"]
+	mock_example_repository.partial_update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_partial_update_raises_not_found_for_unknown_id(
+	example_usecase, mock_example_repository
+):
+	mock_example_repository.partial_update.return_value = None
+	mock_example_repository.get.return_value = None
+
+	with pytest.raises(ObjectNotFound):
+		await example_usecase.partial_update(data=ExampleUpdate(age=20), id=uuid4())
+
+
+@pytest.mark.asyncio
+async def test_page_tag_reads_only_the_validators_and_shares_the_count(
+	example_usecase, mock_example_repository
+):
+	now = datetime.now(UTC)
+	row = SimpleNamespace(id=uuid4(), created_at=now, updated_at=now, name="joão", age=19)
+	mock_example_repository.query.return_value = [row]
+	mock_example_repository.count.return_value = 1
+	request = Request(
+		{
+			"type": "http",
+			"method": "GET",
+			"scheme": "http",
+			"server": ("test", 80),
+			"path": "/example/",
+			"query_string": b"",
+			"headers": [],
+		}
+	)
+	query_params = ExampleQueryParams()
+
+	tag = await example_usecase.page_tag(query_params=query_params, request=request)
+	await example_usecase.query(query_params=query_params, request=request)
+
+	assert mock_example_repository.query.await_args_list[0].kwargs["fields"] == (
+		"id",
+		"updated_at",
+	)
+	mock_example_repository.count.assert_awaited_once()
+
+	# The page that was read is what the tag now stands for: a row changed
+	# in between gives the client a new tag, without another read
+	row.updated_at = datetime.now(UTC)
+	await example_usecase.query(query_params=query_params, request=request)
+	assert (
+		await example_usecase.page_tag(query_params=query_params, request=request) != tag
+	)
+	assert mock_example_repository.query.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_modified_at_raises_not_found_for_unknown_id(
+	example_usecase, mock_example_repository
+):
+	mock_example_repository.modified_at.return_value = None
+
+	with pytest.raises(ObjectNotFound):
+		await example_usecase.modified_at(id=uuid4())
@@ -0,0 +1,68 @@
+import time
+from types import SimpleNamespace
+from uuid import RFC_4122, UUID
+
+import pytest
+
+from app.core.exceptions.query import InvalidCursorError
+from app.domain.models.base import uuid7
+from app.domain.schemas.pagination import Cursor, CursorDirection, page_cursors
+
+
+def _rows(count):
+	return [SimpleNamespace(id=UUID(int=i)) for i in range(1, count + 1)]
+
+
+def test_cursor_round_trips_through_token():
+	cursor = Cursor(id=uuid7(), direction=CursorDirection.PREVIOUS)
+
+	assert Cursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "e30", ""])
+def test_cursor_decode_rejects_malformed_tokens(token):
+	with pytest.raises(InvalidCursorError):
+		Cursor.decode(token)
+
+
+def test_page_cursors_first_full_page_only_has_next():
+	previous_cursor, next_cursor = page_cursors(rows=_rows(10), limit=10, current=None)
+
+	assert previous_cursor is None
+	assert next_cursor.id == UUID(int=10)
+	assert next_cursor.direction == CursorDirection.NEXT
+
+
+def test_page_cursors_last_page_only_has_previous():
+	current = Cursor(id=UUID(int=0))
+	previous_cursor, next_cursor = page_cursors(rows=_rows(3), limit=10, current=current)
+
+	assert previous_cursor.id == UUID(int=1)
+	assert previous_cursor.direction == CursorDirection.PREVIOUS
+	assert next_cursor is None
+
+
+def test_page_cursors_reading_backwards_always_has_next():
+	current = Cursor(id=UUID(int=99), direction=CursorDirection.PREVIOUS)
+	previous_cursor, next_cursor = page_cursors(rows=_rows(3), limit=10, current=current)
+
+	assert previous_cursor is None
+	assert next_cursor.id == UUID(int=3)
+
+
+def test_uuid7_ids_are_time_ordered():
+	first = uuid7()
+	time.sleep(0.002)
+	second = uuid7()
+
+	assert (first.version, first.variant) == (7, RFC_4122)
+	assert first < second
+
+
+def test_cursor_at_keeps_the_sort_value_of_the_row():
+	row = {"id": UUID(int=1), "created_at": "2025-11-06T02:13:28Z"}
+
+	cursor = Cursor.at(row, CursorDirection.NEXT, order_by="created_at")
+
+	assert (cursor.id, cursor.value) == (UUID(int=1), "2025-11-06T02:13:28Z")
+	assert Cursor.decode(cursor.encode()) == cursor
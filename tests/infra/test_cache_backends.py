@@ -0,0 +1,240 @@
+import asyncio
+import pickle
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.domain.models.example import ExampleModel
+from app.domain.usecases.cache import CacheUsecase
+from app.infra.cache.base import row_decoder
+from app.infra.cache.entity import EntityCache
+from app.infra.cache.memory import MemoryCache
+from app.infra.cache.query import QueryCache
+from app.infra.cache.redis import RedisCache
+from app.infra.cache.resp import RespClient, RespError
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used_entry():
+	cache = MemoryCache(max_size=2)
+	await cache.set("a", 1)
+	await cache.set("b", 2)
+	await cache.get("a")
+	await cache.set("c", 3)
+
+	assert await cache.get("b") is None
+	assert await cache.get("a") == 1
+	assert await cache.get("c") == 3
+	stats = await cache.stats()
+	assert (stats.hits, stats.misses, stats.evictions, stats.size) == (3, 1, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_entries_after_ttl():
+	clock = FakeClock()
+	cache = MemoryCache(max_size=10, ttl=5, clock=clock)
+	await cache.set("a", 1)
+
+	clock.now = 5
+	assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_round_trips_values_over_resp(resp_server):
+	client = RespClient(url=resp_server.url)
+	cache = RedisCache(client=client, ttl=30)
+	row = {"id": uuid4(), "name": "felipe", "age": 19}
+	# Stored as JSON, uuids come back as strings (see row_decoder)
+	stored = {**row, "id": str(row["id"])}
+
+	await cache.set("entity:example:1", row)
+	await cache.set("entity:example:2", row)
+	await cache.set("entity:other:1", row)
+
+	assert await cache.get("entity:example:1") == stored
+	await cache.clear("entity:example:")
+	assert await cache.get("entity:example:2") is None
+	assert await cache.get("entity:other:1") == stored
+
+	stats = await cache.stats()
+	assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+	await client.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_treats_undecodable_values_as_misses(resp_server):
+	client = RespClient(url=resp_server.url)
+	cache = RedisCache(client=client)
+	await client.execute("SET", "entity:example:1", pickle.dumps({"name": "felipe"}))
+
+	assert await cache.get("entity:example:1") is None
+	assert (await cache.stats()).misses == 1
+	await client.close()
+
+
+def test_row_decoder_types_back_values_stored_as_json():
+	id, now = uuid4(), datetime.now(UTC)
+	decode = row_decoder(ExampleModel.__table__)
+
+	assert decode({"updated_at": now.isoformat(), "name": "joão", "id": str(id)}) == {
+		"updated_at": now,
+		"name": "joão",
+		"id": id,
+	}
+	assert decode({"id": id, "age": None}) == {"id": id, "age": None}
+
+
+@pytest.mark.asyncio
+async def test_resp_client_raises_error_replies(resp_server):
+	client = RespClient(url=resp_server.url)
+
+	with pytest.raises(RespError):
+		await client.execute("FLUSHALL")
+	assert await client.execute("DBSIZE") == 0
+	await client.close()
+
+
+@pytest.mark.asyncio
+async def test_entity_cache_invalidates_single_ids_or_whole_table():
+	cache = EntityCache(backend=MemoryCache(max_size=10))
+	version = await cache.version("example")
+	await cache.set("example", 1, version, {"name": "a"})
+	await cache.set("example", 2, version, {"name": "b"})
+
+	await cache.invalidate("example", [1])
+	assert await cache.get("example", 1) is None
+	assert await cache.get("example", 2) == {"name": "b"}
+
+	await cache.invalidate("example")
+	assert await cache.get("example", 2) is None
+
+
+@pytest.mark.asyncio
+async def test_entity_cache_never_keeps_a_row_read_before_a_write():
+	cache = EntityCache(backend=MemoryCache(max_size=10))
+
+	# Missed, then read the row while a write to it committed and invalidated
+	version = await cache.version("example")
+	await cache.invalidate("example", [1])
+	await cache.set("example", 1, version, {"name": "stale"})
+	assert await cache.get("example", 1) is None
+
+	# Stored the row just before the invalidation of the write ran
+	version = await cache.version("example")
+	await cache.set("example", 1, version, {"name": "stale"})
+	await cache.invalidate("example", [1])
+	assert await cache.get("example", 1) is None
+
+	version = await cache.version("example")
+	await cache.set("example", 1, version, {"name": "fresh"})
+	assert await cache.get("example", 1) == {"name": "fresh"}
+
+
+@pytest.mark.asyncio
+async def test_entity_cache_degrades_to_miss_when_backend_is_down():
+	client = RespClient(url="redis://127.0.0.1:1/0")
+	cache = EntityCache(backend=RedisCache(client=client))
+
+	assert await cache.get("example", 1) is None
+
+
+@pytest_asyncio.fixture
+async def broken_server():
+	"""Server that hangs on the first command and cuts the reply of the next."""
+	requests = 0
+
+	async def handle(reader, writer):
+		nonlocal requests
+		await reader.readline()
+		requests += 1
+		if requests > 1:
+			writer.write(b"$10\r\nab")
+			await writer.drain()
+			writer.close()
+			return
+		await asyncio.sleep(10)
+
+	server = await asyncio.start_server(handle, "127.0.0.1", 0)
+	host, port = server.sockets[0].getsockname()[:2]
+	yield f"redis://{host}:{port}/0"
+	server.close()
+
+
+@pytest.mark.asyncio
+async def test_entity_cache_degrades_to_miss_on_hung_or_truncated_replies(
+	broken_server,
+):
+	client = RespClient(url=broken_server, timeout=0.05)
+	cache = EntityCache(backend=RedisCache(client=client))
+
+	assert await cache.get("example", 1) is None
+	assert await cache.get("example", 1) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_flags_an_unreachable_backend():
+	cache = RedisCache(client=RespClient(url="redis://127.0.0.1:1/0"))
+
+	stats = await CacheUsecase._stats_out(cache)
+
+	assert stats.available is False
+	assert (stats.hits, stats.misses) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_query_cache_serves_pages_until_the_table_version_moves():
+	cache = QueryCache(backend=MemoryCache(max_size=10))
+	key = QueryCache.make_key({"limit": 10, "offset": 0, "name": "felipe"})
+	assert key == QueryCache.make_key({"name": "felipe", "offset": 0, "limit": 10})
+
+	version, page = await cache.get("example", key)
+	await cache.set("example", key, version, [{"name": "felipe"}])
+	assert await cache.get("example", key) == (version, [{"name": "felipe"}])
+
+	await cache.invalidate("example")
+	assert await cache.get("example", key) == (version + 1, None)
+
+
+@pytest.mark.asyncio
+async def test_query_cache_drops_pages_read_before_a_concurrent_write():
+	cache = QueryCache(backend=MemoryCache(max_size=10))
+	version, _ = await cache.get("example", "key")
+
+	await cache.invalidate("example")
+	await cache.set("example", "key", version, [{"name": "stale"}])
+
+	assert (await cache.get("example", "key"))[1] is None
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_counters_are_read_back_as_ints(resp_server):
+	cache = RedisCache(client=RespClient(url=resp_server.url))
+
+	epoch = await cache.counter("query:example:version")
+	assert await cache.counter("query:example:version") == epoch
+	assert await cache.incr("query:example:version") == epoch + 1
+	assert await cache.counter("query:example:version") == epoch + 1
+
+
+@pytest.mark.asyncio
+async def test_query_cache_never_serves_pages_of_a_lost_counter(resp_server):
+	client = RespClient(url=resp_server.url)
+	cache = QueryCache(backend=RedisCache(client=client))
+	version, _ = await cache.get("example", "key")
+	await cache.set("example", "key", version, [{"name": "stale"}])
+
+	# Evicted or lost with a server restart: it restarts from a new epoch
+	await client.execute("DEL", "query:example:version")
+	await cache.invalidate("example")
+
+	assert (await cache.get("example", "key"))[1] is None
@@ -0,0 +1,77 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.domain.models.example import ExampleModel
+from app.infra.db.coalescer import InsertCoalescer
+
+
+class FakeResult:
+	def __init__(self, rows):
+		self.rows = rows
+
+	def mappings(self):
+		return self.rows
+
+
+class FakeConnection:
+	def __init__(self, reject=None):
+		self.reject = reject
+		self.statements = []
+
+	async def execute(self, statement, rows):
+		self.statements.append(len(rows))
+		if any(row["name"] == self.reject for row in rows):
+			raise RuntimeError(f"bad row {self.reject}")
+		return FakeResult([{**row, "pk_id": i} for i, row in enumerate(rows)])
+
+
+def _coalescer(connection, **kwargs):
+	@asynccontextmanager
+	async def connect():
+		yield connection
+
+	return InsertCoalescer(table=ExampleModel.__table__, connect=connect, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_coalescer_writes_concurrent_inserts_in_one_statement():
+	connection = FakeConnection()
+	coalescer = _coalescer(connection, window=0.01, max_batch=100)
+
+	rows = await asyncio.gather(
+		*(coalescer.insert({"name": name}) for name in ["felipe", "gustavo", "ana"])
+	)
+
+	assert connection.statements == [3]
+	assert [row["name"] for row in rows] == ["felipe", "gustavo", "ana"]
+	assert len({row["id"] for row in rows}) == 3
+
+
+@pytest.mark.asyncio
+async def test_coalescer_flushes_when_batch_is_full():
+	connection = FakeConnection()
+	coalescer = _coalescer(connection, window=60, max_batch=2)
+
+	await asyncio.gather(
+		coalescer.insert({"name": "felipe"}), coalescer.insert({"name": "ana"})
+	)
+
+	assert connection.statements == [2]
+
+
+@pytest.mark.asyncio
+async def test_coalescer_only_fails_the_caller_of_the_bad_row():
+	connection = FakeConnection(reject="bad")
+	coalescer = _coalescer(connection, window=0.01, max_batch=100)
+
+	good, bad = await asyncio.gather(
+		coalescer.insert({"name": "felipe"}),
+		coalescer.insert({"name": "bad"}),
+		return_exceptions=True,
+	)
+
+	assert good["name"] == "felipe"
+	assert isinstance(bad, RuntimeError)
+	assert sorted(connection.statements) == [1, 1, 2]
@@ -0,0 +1,207 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.domain.models.example import ExampleModel
+from app.infra.db.helpers.copy import (
+	as_records,
+	copy_out,
+	iter_batches,
+	merge_copy,
+	parallel_copy,
+)
+
+
+class FakeTransaction:
+	def __init__(self, connection):
+		self.connection = connection
+
+	async def start(self):
+		self.connection.state = "started"
+
+	async def commit(self):
+		self.connection.state = "committed"
+
+	async def rollback(self):
+		self.connection.state = "rolled back"
+
+
+class FakeConnection:
+	def __init__(self, fail_on=None):
+		self.fail_on = fail_on
+		self.state = None
+		self.copied = []
+
+	def transaction(self):
+		return FakeTransaction(self)
+
+	async def copy_records_to_table(self, table_name, records, columns):
+		records = list(records)
+		await asyncio.sleep(0)
+		if self.fail_on in records:
+			raise RuntimeError("copy failed")
+		self.copied.extend(records)
+
+
+def _connector(connections):
+	pool = iter(connections)
+
+	@asynccontextmanager
+	async def connect():
+		yield next(pool)
+
+	return connect
+
+
+@pytest.mark.asyncio
+async def test_parallel_copy_spreads_batches_and_commits_every_connection():
+	connections = [FakeConnection(), FakeConnection()]
+	rows = [{"name": str(i), "age": i} for i in range(10)]
+	records = as_records(rows, columns=["name", "age"])
+	progress = []
+
+	async def on_batch(copied):
+		progress.append(copied)
+
+	stats = await parallel_copy(
+		connect=_connector(connections),
+		table="example",
+		columns=["name", "age"],
+		batches=iter_batches(records, size=2),
+		workers=2,
+		max_in_flight=1,
+		on_batch=on_batch,
+	)
+
+	assert stats.rows == 10
+	assert sum(conn.batches for conn in stats.connections) == 5
+	assert progress == [2, 4, 6, 8, 10]
+	assert sorted(r for conn in connections for r in conn.copied) == sorted(
+		(row["name"], row["age"]) for row in rows
+	)
+	assert [conn.state for conn in connections] == ["committed", "committed"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_copy_rolls_back_every_connection_on_failure():
+	connections = [FakeConnection(fail_on=("3", 3)), FakeConnection(fail_on=("3", 3))]
+	records = [(str(i), i) for i in range(6)]
+
+	with pytest.raises(RuntimeError, match="copy failed"):
+		await parallel_copy(
+			connect=_connector(connections),
+			table="example",
+			columns=["name", "age"],
+			batches=iter_batches(records, size=1),
+			workers=2,
+			max_in_flight=2,
+		)
+
+	assert [conn.state for conn in connections] == ["rolled back", "rolled back"]
+
+
+@pytest.mark.asyncio
+async def test_as_records_fills_missing_keys_with_null():
+	async def rows():
+		yield {"name": "felipe"}
+
+	records = as_records(rows(), columns=["name", "age"])
+
+	assert [batch async for batch in iter_batches(records, size=5)] == [
+		[("felipe", None)]
+	]
+
+
+class MergeConnection(FakeConnection):
+	def __init__(self, counts):
+		super().__init__()
+		self.counts = counts
+		self.statements = []
+
+	async def execute(self, sql):
+		self.statements.append(sql)
+
+	async def fetchrow(self, sql):
+		self.statements.append(sql)
+		return self.counts
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("update", [True, False])
+async def test_merge_copy_stages_rows_and_merges_on_key(update):
+	connection = MergeConnection(counts=(1, 1))
+	records = [(str(i), "felipe", i) for i in range(4)]
+
+	stats = await merge_copy(
+		connection=connection,
+		target=ExampleModel.__table__,
+		columns=["id", "name", "age"],
+		key="id",
+		batches=iter_batches(records, size=3),
+		update=update,
+	)
+
+	assert connection.copied == records
+	assert (stats.staged, stats.inserted, stats.updated, stats.skipped) == (4, 1, 1, 2)
+	create, _, merge = connection.statements
+	assert create.startswith("CREATE TEMP TABLE _stage_example ON COMMIT DROP")
+	assert "DISTINCT ON (_stage_example.id)" in merge
+	if update:
+		assert "ON CONFLICT (id) DO UPDATE" in merge
+		assert "updated_at = now()" in merge
+		assert "IS DISTINCT FROM (excluded.name, excluded.age)" in merge
+	else:
+		assert "ON CONFLICT (id) DO NOTHING" in merge
+
+
+class CopyOutConnection:
+	def __init__(self, chunks, fail=False):
+		self.chunks = chunks
+		self.fail = fail
+		self.sent = 0
+		self.calls = []
+
+	async def copy_from_query(self, query, *args, output, **options):
+		self.calls.append((query, args, options))
+		for chunk in self.chunks:
+			await output(chunk)
+			self.sent += 1
+		if self.fail:
+			raise RuntimeError("connection lost")
+
+
+@pytest.mark.asyncio
+async def test_copy_out_streams_chunks_with_a_header():
+	connection = CopyOutConnection([b"id,name\n", b"1,felipe\n"])
+
+	chunks = [
+		chunk async for chunk in copy_out(connection, "SELECT $1", [1], format="csv")
+	]
+
+	assert chunks == [b"id,name\n", b"1,felipe\n"]
+	assert connection.calls == [("SELECT $1", (1,), {"format": "csv", "header": True})]
+
+
+@pytest.mark.asyncio
+async def test_copy_out_raises_the_copy_error_after_sent_chunks():
+	connection = CopyOutConnection([b"id\n"], fail=True)
+	received = []
+
+	with pytest.raises(RuntimeError, match="connection lost"):
+		async for chunk in copy_out(connection, "SELECT 1"):
+			received.append(chunk)
+
+	assert received == [b"id\n"]
+
+
+@pytest.mark.asyncio
+async def test_copy_out_holds_back_the_copy_while_the_consumer_lags():
+	connection = CopyOutConnection([b"%d\n" % i for i in range(100)])
+
+	stream = copy_out(connection, "SELECT 1", max_in_flight=2)
+	assert await anext(stream) == b"0\n"
+	await asyncio.sleep(0.01)
+
+	assert connection.sent <= 4
+	await stream.aclose()
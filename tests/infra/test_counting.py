@@ -0,0 +1,40 @@
+from app.infra.db.helpers.counting import CountCache
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+
+def test_count_cache_key_ignores_filter_and_value_order():
+	first = CountCache.make_key({"name": "felipe", "age__in": [20, 19]})
+	second = CountCache.make_key({"age__in": [19, 20], "name": "felipe"})
+
+	assert first == second
+
+
+def test_count_cache_expires_entries_after_ttl():
+	clock = FakeClock()
+	cache = CountCache(ttl=10, clock=clock)
+	cache.set("example", "key", 5)
+
+	clock.now = 9.9
+	assert cache.get("example", "key") == 5
+	clock.now = 10
+	assert cache.get("example", "key") is None
+
+
+def test_count_cache_invalidate_drops_every_filter_of_the_table():
+	cache = CountCache(ttl=10)
+	cache.set("example", "a", 1)
+	cache.set("example", "b", 2)
+	cache.set("other", "a", 3)
+
+	cache.invalidate("example")
+
+	assert cache.get("example", "a") is None
+	assert cache.get("example", "b") is None
+	assert cache.get("other", "a") == 3
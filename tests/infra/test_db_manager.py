@@ -0,0 +1,39 @@
+import pytest
+
+from app.core.config import settings
+from app.infra.db.manager import DatabaseManager
+
+
+@pytest.mark.parametrize(
+	("pool_size", "max_overflow", "budget", "expected"),
+	[
+		(10, 10, 0, (10, 10)),
+		(10, 10, 15, (10, 5)),
+		(10, 10, 4, (4, 0)),
+	],
+)
+def test_pool_limits_clamp_to_worker_budget(
+	monkeypatch, pool_size, max_overflow, budget, expected
+):
+	monkeypatch.setattr(settings, "DB_POOL_SIZE", pool_size)
+	monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", max_overflow)
+	monkeypatch.setattr(settings, "DB_WORKER_CONNECTION_BUDGET", budget)
+
+	assert DatabaseManager.pool_limits() == expected
+
+
+@pytest.mark.parametrize(
+	("budget", "replica", "expected"),
+	[
+		(20, False, (8, 0)),
+		(20, True, (6, 0)),
+		(2, True, (1, 0)),
+	],
+)
+def test_pool_limits_split_budget_with_replicas(monkeypatch, budget, replica, expected):
+	monkeypatch.setattr(settings, "DB_POOL_SIZE", 10)
+	monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 10)
+	monkeypatch.setattr(settings, "DB_WORKER_CONNECTION_BUDGET", budget)
+	monkeypatch.setattr(settings, "DATABASE_REPLICA_URLS", ["replica-1", "replica-2"])
+
+	assert DatabaseManager.pool_limits(replica=replica) == expected
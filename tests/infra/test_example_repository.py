@@ -0,0 +1,198 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.models.example import ExampleModel
+from app.domain.schemas.pagination import PaginationMode
+from app.infra.cache.entity import EntityCache
+from app.infra.cache.memory import MemoryCache
+from app.infra.cache.query import QueryCache
+from app.infra.db.helpers.copy import CopyStats
+from app.infra.db.manager import DatabaseManager
+from app.infra.db.routing import PIN_PRIMARY
+from app.infra.db.transaction import Transaction
+from app.infra.repositories.example import ExampleRepository
+from app.infra.repositories.postgres import base
+
+
+class FakeResult:
+	def __init__(self, row):
+		self.row = row
+
+	def scalars(self):
+		return self
+
+	def all(self):
+		return self.row
+
+	def one(self):
+		return self.row
+
+	def scalar_one(self):
+		return self.row[0]
+
+
+class FakeSession:
+	def __init__(self, *rows):
+		self.rows = list(rows)
+		self.statements = []
+		self.info = {}
+
+	async def execute(self, statement):
+		self.statements.append(
+			str(statement.compile(dialect=postgresql.asyncpg.dialect()))
+		)
+		return FakeResult(self.rows.pop(0))
+
+
+@pytest.mark.asyncio
+async def test_query_with_fields_selects_only_those_columns_and_the_keyset():
+	rows = [SimpleNamespace(name="felipe", id=uuid4())]
+	session = FakeSession(rows)
+	repository = ExampleRepository(session=session)
+
+	data = await repository.query(
+		filter_params={"pagination": PaginationMode.CURSOR, "limit": 5},
+		fields=["name"],
+	)
+
+	assert data == rows
+	assert session.statements[0].startswith(
+		"SELECT example.name, example.id \nFROM example"
+	)
+
+
+@pytest.mark.asyncio
+async def test_query_pages_are_cached_until_a_write_to_the_table(monkeypatch):
+	cache = QueryCache(backend=MemoryCache(max_size=10))
+	monkeypatch.setattr(base, "get_query_cache", lambda: cache)
+	monkeypatch.setattr(base, "get_entity_cache", lambda: None)
+	row = ExampleModel(id=uuid4(), name="felipe", age=19)
+	session = FakeSession([row], [row])
+	repository = ExampleRepository(session=session)
+
+	first = await repository.query(filter_params={"limit": 5})
+	second = await repository.query(filter_params={"limit": 5})
+	assert len(session.statements) == 1
+	assert second[0].id == first[0].id
+	assert second[0] is not first[0]
+
+	await repository._after_write(ids=[row.id])
+	await repository.query(filter_params={"limit": 5})
+	assert len(session.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_copy_keeps_cached_rows(monkeypatch):
+	entity_cache = EntityCache(backend=MemoryCache(max_size=10))
+	query_cache = QueryCache(backend=MemoryCache(max_size=10))
+	monkeypatch.setattr(base, "get_entity_cache", lambda: entity_cache)
+	monkeypatch.setattr(base, "get_query_cache", lambda: query_cache)
+
+	async def parallel_copy(**kwargs):
+		return CopyStats(rows=1)
+
+	monkeypatch.setattr(base, "parallel_copy", parallel_copy)
+	await entity_cache.set(
+		"example", 1, await entity_cache.version("example"), {"name": "felipe"}
+	)
+	version, _ = await query_cache.get("example", "key")
+	repository = ExampleRepository(session=FakeSession())
+
+	await repository.bulk_insert_copy(
+		table="example", columns=["name"], data=[{"name": "gustavo"}]
+	)
+
+	assert await entity_cache.get("example", 1) == {"name": "felipe"}
+	assert (await query_cache.get("example", "key"))[0] != version
+	# The rows were written on other connections: the session must read them
+	# from the primary, not from a replica that may lag behind
+	assert repository.session.info[PIN_PRIMARY] is True
+
+
+@pytest.mark.asyncio
+async def test_bulk_partial_update_joins_values_and_writes_sent_fields_only():
+	ids = [uuid4() for _ in range(3)]
+	session = FakeSession((2, [ids[0]]), (1, None))
+	repository = ExampleRepository(session=session)
+
+	matched, changed = await repository.bulk_partial_update(
+		changes=[{"id": ids[0], "age": 20}, {"id": ids[1]}, {"id": ids[2], "age": None}],
+		transaction=Transaction(session=session),
+		batch_size=2,
+	)
+
+	assert (matched, changed) == (3, 1)
+	first, second = session.statements
+	assert "FROM (VALUES" in first
+	assert "SET age=CASE WHEN changes.set_age" in first
+	assert "updated_at=now()" in first
+	assert "IS DISTINCT FROM" in first
+	assert "name=" not in first
+	assert len(session.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_partial_update_without_fields_only_counts_matches():
+	session = FakeSession((1,))
+	repository = ExampleRepository(session=session)
+
+	matched, changed = await repository.bulk_partial_update(
+		changes=[{"id": uuid4()}], transaction=Transaction(session=session)
+	)
+
+	assert (matched, changed) == (1, 0)
+	assert "UPDATE" not in session.statements[0]
+
+
+@pytest.mark.asyncio
+async def test_delete_returns_ids_in_one_statement():
+	id = uuid4()
+	session = FakeSession([id])
+	repository = ExampleRepository(session=session)
+
+	deleted = await repository.delete(
+		filters={"id": id}, transaction=Transaction(session=session)
+	)
+
+	assert deleted == [id]
+	assert session.statements[0].startswith("DELETE FROM example WHERE example.id = $1")
+	assert session.statements[0].endswith("RETURNING example.id")
+
+
+@pytest.mark.asyncio
+async def test_delete_in_batches_stops_after_a_short_batch(monkeypatch):
+	connection = FakeSession([uuid4(), uuid4()], [uuid4(), uuid4()], [uuid4()])
+
+	@asynccontextmanager
+	async def autocommit_connection():
+		yield connection
+
+	monkeypatch.setattr(DatabaseManager, "autocommit_connection", autocommit_connection)
+	repository = ExampleRepository(session=FakeSession())
+
+	deleted = await repository.delete_in_batches(filters={"age": 19}, batch_size=2)
+
+	assert deleted == 5
+	assert len(connection.statements) == 3
+	assert "LIMIT $" in connection.statements[0]
+
+
+@pytest.mark.asyncio
+async def test_partial_update_can_skip_rows_already_holding_the_values():
+	session = FakeSession([])
+	repository = ExampleRepository(session=session)
+
+	updated = await repository.partial_update(
+		filters={"id": uuid4()},
+		data={"age": 20},
+		transaction=Transaction(session=session),
+		skip_unchanged=True,
+	)
+
+	assert updated is None
+	assert "SET age=$1::INTEGER, updated_at=now()" in session.statements[0]
+	assert "(example.age) IS DISTINCT FROM ($3::INTEGER)" in session.statements[0]
@@ -0,0 +1,118 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.domain.schemas.job import JobStatus
+from app.infra.jobs.runner import JobRunner
+from app.infra.jobs.store import Job, MemoryJobStore
+
+
+@pytest.mark.asyncio
+async def test_failed_job_records_error():
+	runner = JobRunner(store=MemoryJobStore(), concurrency=1)
+
+	async def work(report):
+		await report(10)
+		raise RuntimeError("copy aborted")
+
+	job = await runner.submit(kind="test", total_rows=20, work=work)
+	await runner.shutdown()
+	failed = await runner.store.get(job.id)
+
+	assert failed.status == JobStatus.FAILED
+	assert failed.errors == ["RuntimeError: copy aborted"]
+	assert failed.inserted_rows == 10
+	assert failed.progress == 0.5
+	assert failed.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_runner_bounds_concurrent_jobs():
+	runner = JobRunner(store=MemoryJobStore(), concurrency=2)
+	running = 0
+	peak = 0
+
+	async def work(report):
+		nonlocal running, peak
+		running += 1
+		peak = max(peak, running)
+		await asyncio.sleep(0.01)
+		running -= 1
+		return 1
+
+	for _ in range(5):
+		await runner.submit(kind="test", total_rows=1, work=work)
+	await runner.shutdown()
+
+	assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_store_keeps_only_latest_jobs():
+	store = MemoryJobStore(max_jobs=1)
+	runner = JobRunner(store=store, concurrency=1)
+
+	async def work(report):
+		return 0
+
+	first = await runner.submit(kind="test", total_rows=0, work=work)
+	second = await runner.submit(kind="test", total_rows=0, work=work)
+	await runner.shutdown()
+
+	assert await store.get(first.id) is None
+	assert (await store.get(second.id)).status == JobStatus.SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_jobs_past_the_timeout_and_fails_them():
+	runner = JobRunner(store=MemoryJobStore(), concurrency=1, shutdown_timeout=0.01)
+
+	async def work(report):
+		await asyncio.sleep(10)
+
+	running = await runner.submit(kind="test", total_rows=1, work=work)
+	waiting = await runner.submit(kind="test", total_rows=1, work=work)
+	await runner.shutdown()
+
+	for job in (running, waiting):
+		failed = await runner.store.get(job.id)
+		assert failed.status == JobStatus.FAILED
+		assert failed.errors == ["Interrupted: the worker shut down"]
+
+
+@pytest.mark.asyncio
+async def test_jobs_left_behind_by_a_dead_worker_fail_when_read():
+	store = MemoryJobStore()
+	runner = JobRunner(store=store, concurrency=1, stale_after=60)
+	an_hour_ago = datetime.now(UTC) - timedelta(hours=1)
+	orphan = await store.create(
+		Job(kind="test", status=JobStatus.RUNNING, updated_at=an_hour_ago)
+	)
+	alive = await store.create(Job(kind="test", status=JobStatus.RUNNING))
+	done = await store.create(
+		Job(kind="test", status=JobStatus.SUCCEEDED, updated_at=an_hour_ago)
+	)
+
+	assert (await runner.get(orphan.id)).status == JobStatus.FAILED
+	assert (await runner.get(alive.id)).status == JobStatus.RUNNING
+	assert (await runner.get(done.id)).status == JobStatus.SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_heartbeats_keep_a_long_job_fresh():
+	runner = JobRunner(store=MemoryJobStore(), concurrency=1, heartbeat_interval=0.01)
+	started = asyncio.Event()
+
+	async def work(report):
+		started.set()
+		await asyncio.sleep(0.05)
+		return 1
+
+	job = await runner.submit(kind="test", total_rows=1, work=work)
+	await started.wait()
+	before = (await runner.store.get(job.id)).updated_at
+	await asyncio.sleep(0.03)
+
+	assert (await runner.store.get(job.id)).updated_at > before
+	await runner.shutdown()
@@ -0,0 +1,75 @@
+import asyncio
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.models.example import ExampleModel
+from app.infra.db.loader import RowLoader
+
+
+class FakeResult:
+	def __init__(self, rows):
+		self.rows = rows
+
+	def mappings(self):
+		return self.rows
+
+
+class FakeConnection:
+	def __init__(self, rows=(), fail=False):
+		self.rows = {row["id"]: row for row in rows}
+		self.fail = fail
+		self.statements = []
+
+	async def execute(self, statement, params):
+		self.statements.append(
+			(str(statement.compile(dialect=postgresql.asyncpg.dialect())), params)
+		)
+		if self.fail:
+			raise RuntimeError("connection lost")
+		return FakeResult([self.rows[key] for key in params["keys"] if key in self.rows])
+
+
+def _loader(connection, max_batch=100):
+	@asynccontextmanager
+	async def connect():
+		yield connection
+
+	return RowLoader(table=ExampleModel.__table__, max_batch=max_batch, connect=connect)
+
+
+@pytest.mark.asyncio
+async def test_loader_reads_lookups_of_one_tick_with_one_query():
+	ids = [uuid4() for _ in range(3)]
+	connection = FakeConnection(rows=[{"id": id, "name": str(id)} for id in ids[:2]])
+	loader = _loader(connection)
+
+	rows = await asyncio.gather(*(loader.load(id) for id in [*ids, ids[0]]))
+
+	assert [row and row["id"] for row in rows] == [ids[0], ids[1], None, ids[0]]
+	((sql, params),) = connection.statements
+	assert "WHERE example.id = ANY ($1::UUID[])" in sql
+	assert params == {"keys": ids}
+
+
+@pytest.mark.asyncio
+async def test_loader_splits_batches_at_max_batch():
+	connection = FakeConnection()
+	loader = _loader(connection, max_batch=2)
+
+	await asyncio.gather(*(loader.load(uuid4()) for _ in range(5)))
+
+	assert [len(params["keys"]) for _, params in connection.statements] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_loader_fails_every_lookup_of_a_failed_batch():
+	loader = _loader(FakeConnection(fail=True))
+
+	results = await asyncio.gather(
+		loader.load(uuid4()), loader.load(uuid4()), return_exceptions=True
+	)
+
+	assert all(isinstance(result, RuntimeError) for result in results)
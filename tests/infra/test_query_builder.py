@@ -0,0 +1,121 @@
+from datetime import UTC, datetime
+from typing import get_args
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions.query import InvalidCursorError, InvalidFilterError
+from app.domain.models.base import uuid7
+from app.domain.models.example import ExampleModel
+from app.domain.schemas.example import ExampleQueryParams
+from app.domain.schemas.pagination import Cursor
+from app.infra.db.helpers.query_builder import (
+	apply_keyset,
+	build_query,
+	compile_filter_plan,
+)
+
+
+def _where(filters):
+	compiled = build_query(ExampleModel, filters).compile(
+		dialect=postgresql.asyncpg.dialect()
+	)
+	return str(compiled).split("WHERE ")[1], compiled.params
+
+
+@pytest.mark.parametrize(
+	("filters", "sql", "params"),
+	[
+		({"age": "19"}, "example.age = $1::INTEGER", {"age_1": 19}),
+		(
+			{"age__between": "18,30"},
+			"example.age BETWEEN $1::INTEGER AND $2::INTEGER",
+			{"age_1": 18, "age_2": 30},
+		),
+		(
+			{"age__in": [1, 2]},
+			"example.age IN (__[POSTCOMPILE_age_1])",
+			{"age_1": [1, 2]},
+		),
+		({"name__isnull": "false"}, "example.name IS NOT NULL", {}),
+		({"name__ilike": "%fel%"}, "example.name ILIKE $1::VARCHAR", None),
+		(
+			{"name__startswith": "fe_"},
+			"LIKE $1::VARCHAR || '%' ESCAPE '/'",
+			{"name_1": "fe/_"},
+		),
+		(
+			{"name__contains": "50%"},
+			"LIKE '%' || $1::VARCHAR || '%' ESCAPE '/'",
+			{"name_1": "50/%"},
+		),
+	],
+)
+def test_build_query_applies_operators_and_parses_query_string_values(
+	filters, sql, params
+):
+	where, bound = _where(filters)
+
+	assert sql in where
+	if params is not None:
+		assert bound == params
+
+
+@pytest.mark.parametrize(
+	"filters",
+	[
+		{"unknown": 1},
+		{"age__near": 1},
+		{"age__overlap": "1,2"},
+		{"age": "abc"},
+		{"age__like": "1"},
+		{"age__startswith": "1"},
+		{"age__contains": "1"},
+	],
+)
+def test_build_query_rejects_invalid_filters(filters):
+	with pytest.raises(InvalidFilterError):
+		build_query(ExampleModel, filters)
+
+
+def test_filter_plans_are_compiled_once_per_signature():
+	compile_filter_plan.cache_clear()
+	build_query(ExampleModel, {"age__gt": 1, "name": "felipe"})
+	build_query(ExampleModel, {"age__gt": 30, "name": "gustavo"})
+
+	assert compile_filter_plan.cache_info().hits == 1
+
+
+def test_apply_keyset_seeks_on_sort_column_then_id():
+	now = datetime.now(UTC)
+	cursor = Cursor(id=uuid7(), order_by="created_at", value=now.isoformat())
+
+	compiled = apply_keyset(
+		build_query(ExampleModel),
+		ExampleModel,
+		cursor=cursor,
+		order_by="created_at",
+		descending=True,
+	).compile(dialect=postgresql.asyncpg.dialect())
+
+	sql = str(compiled)
+	assert "WHERE (example.created_at, example.id) < ($1::TIMESTAMP WITH TIME ZONE" in sql
+	assert sql.endswith("ORDER BY example.created_at DESC, example.id DESC")
+	assert compiled.params["param_1"] == now
+
+
+def test_apply_keyset_rejects_cursor_of_another_sort():
+	with pytest.raises(InvalidCursorError):
+		apply_keyset(
+			build_query(ExampleModel),
+			ExampleModel,
+			cursor=Cursor(id=uuid7()),
+			order_by="created_at",
+		)
+
+
+def test_sortable_columns_lead_an_index():
+	leading = {index.expressions[0].name for index in ExampleModel.__table__.indexes}
+	choices = get_args(ExampleQueryParams.model_fields["order_by"].annotation)
+
+	assert set(choices) <= leading
@@ -0,0 +1,218 @@
+import os
+from datetime import UTC, datetime
+from typing import get_args
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import delete, inspect, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.exceptions.query import InvalidFilterError
+from app.domain.models.base import uuid7
+from app.domain.models.example import ExampleModel
+from app.domain.schemas.example import ExampleQueryParams
+from app.domain.schemas.pagination import (
+	Cursor,
+	CursorDirection,
+	PaginationMode,
+	SortDirection,
+)
+from app.infra.db.helpers.explain import (
+	filter_scanned_relations,
+	seq_scanned_relations,
+	unindexed_scans,
+)
+from app.infra.db.helpers.query_builder import (
+	LIST_OPERATORS,
+	OPERATORS,
+	build_query,
+	compile_filter,
+)
+from app.infra.repositories.example import ExampleRepository
+
+# A migrated database to plan against; these checks are skipped without one
+TEST_DATABASE_URL: str | None = os.getenv("TEST_DATABASE_URL")
+# Unindexed scans over tables estimated below this many rows are tolerated
+PLAN_CHECK_MIN_ROWS: float = float(os.getenv("PLAN_CHECK_MIN_ROWS", "0"))
+
+SAMPLES: dict[type, object] = {
+	int: 1,
+	float: 1.0,
+	bool: True,
+	str: "x",
+	UUID: uuid4(),
+	datetime: datetime.now(UTC),
+}
+ORDER_BY: tuple[str, ...] = get_args(
+	ExampleQueryParams.model_fields["order_by"].annotation
+)
+# Filters an index must serve: btree operators on the leading column of one
+INDEX_OPERATORS: set[str] = {"eq", "lt", "lte", "gt", "gte", "in", "between", "isnull"}
+INDEXED_COLUMNS: set[str] = {
+	next(iter(index.columns)).name
+	for index in [*ExampleModel.__table__.indexes, ExampleModel.__table__.primary_key]
+}
+
+
+def _sample(column, op):
+	is_array = isinstance(column.type, ARRAY)
+	python_type = (
+		column.type.item_type.python_type if is_array else column.type.python_type
+	)
+	value = SAMPLES[python_type]
+	if op == "isnull":
+		return True
+	if op in LIST_OPERATORS or (op == "contains" and is_array):
+		return [value, value]
+	return value
+
+
+def _filters(indexed: bool = False):
+	"""Every `field__op` the query builder accepts on the model, or with
+	`indexed` only those an index must serve."""
+	for column in inspect(ExampleModel).columns:
+		for op in OPERATORS:
+			if indexed and (
+				column.key not in INDEXED_COLUMNS or op not in INDEX_OPERATORS
+			):
+				continue
+			key = f"{column.key}__{op}"
+			try:
+				compile_filter(ExampleModel, key)
+			except InvalidFilterError:
+				continue
+			yield key, _sample(column, op)
+
+
+def _page_cases(indexed: bool):
+	"""The page queries of the repository: each filter under each sort, and
+	the pages following a cursor in both directions."""
+	params = {"limit": 10, "offset": 0}
+	for order_by in ORDER_BY:
+		for key, value in _filters(indexed):
+			yield f"{key}/{order_by}", {**params, key: value, "order_by": order_by}
+		for direction in SortDirection:
+			cursor = Cursor(
+				id=uuid7(),
+				order_by=order_by,
+				value=None if order_by == "id" else datetime.now(UTC).isoformat(),
+				direction=CursorDirection.NEXT,
+			)
+			yield (
+				f"cursor/{order_by}/{direction}",
+				{
+					**params,
+					"pagination": PaginationMode.CURSOR,
+					"cursor": cursor.encode(),
+					"order_by": order_by,
+					"direction": direction,
+				},
+			)
+
+
+def _by_id():
+	return build_query(ExampleModel, {"id": uuid4()}, return_conditions=True)
+
+
+def _page(filter_params):
+	query, _ = ExampleRepository(session=None).page_query(filter_params, fields=None)
+	return query
+
+
+def repository_queries(indexed: bool = False):
+	"""Name and statement of every query the repository can issue, built by
+	the repository itself, so a new filter operator, column or sort order
+	is checked without being listed here."""
+	for name, filter_params in _page_cases(indexed):
+		yield f"page:{name}", _page(filter_params)
+	yield "get", build_query(ExampleModel, {"id": uuid4()})
+	yield "get_many", build_query(ExampleModel, {"id__in": [uuid4(), uuid4()]})
+	yield "partial_update", update(ExampleModel).where(*_by_id()).values(age=1)
+	yield "delete", delete(ExampleModel).where(*_by_id())
+
+
+def test_repository_queries_cover_every_filter_and_sort():
+	queries = dict(repository_queries())
+	names = list(queries)
+	for statement in queries.values():
+		statement.compile(dialect=postgresql.asyncpg.dialect())
+
+	assert "page:name__ilike/created_at" in names
+	assert "page:age__between/id" in names
+	assert "page:cursor/created_at/desc" in names
+	assert not any(name.startswith("page:age__like") for name in names)
+
+
+def test_seq_scanned_relations_walks_the_whole_plan():
+	plan = {
+		"Node Type": "Nested Loop",
+		"Plans": [
+			{"Node Type": "Index Scan", "Relation Name": "example"},
+			{
+				"Node Type": "Hash",
+				"Plans": [{"Node Type": "Seq Scan", "Relation Name": "job"}],
+			},
+		],
+	}
+
+	assert seq_scanned_relations(plan) == ["job"]
+
+
+def test_filter_scanned_relations_flags_filters_without_an_index_condition():
+	plan = {
+		"Node Type": "Limit",
+		"Plans": [
+			{
+				"Node Type": "Index Scan",
+				"Relation Name": "example",
+				"Filter": "(name = 'x'::text)",
+			},
+			{
+				"Node Type": "Index Scan",
+				"Relation Name": "job",
+				"Index Cond": "(id = 'x'::uuid)",
+				"Filter": "(status = 'running'::text)",
+			},
+		],
+	}
+
+	assert filter_scanned_relations(plan) == ["example"]
+
+
+async def _offenders(queries):
+	engine = create_async_engine(TEST_DATABASE_URL)
+	offenders = {}
+	try:
+		async with engine.connect() as connection:
+			for name, statement in queries:
+				scans = await unindexed_scans(
+					connection, statement, min_rows=PLAN_CHECK_MIN_ROWS
+				)
+				if scans:
+					offenders[name] = scans
+	finally:
+		await engine.dispose()
+	return offenders
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(TEST_DATABASE_URL is None, reason="TEST_DATABASE_URL is not set")
+async def test_repository_queries_are_served_by_indexes():
+	offenders = await _offenders(repository_queries(indexed=True))
+
+	assert offenders == {}, f"Queries not served by an index: {offenders}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(TEST_DATABASE_URL is None, reason="TEST_DATABASE_URL is not set")
+async def test_filters_on_unindexed_columns_fail_the_check():
+	queries = [
+		(column.key, _page({"limit": 10, f"{column.key}__eq": _sample(column, "eq")}))
+		for column in inspect(ExampleModel).columns
+		if column.key not in INDEXED_COLUMNS
+	]
+
+	assert queries
+	assert await _offenders(queries) == {name: ["example"] for name, _ in queries}
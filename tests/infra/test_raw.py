@@ -0,0 +1,16 @@
+from app.domain.models.example import ExampleModel
+from app.infra.db.helpers.query_builder import build_query
+from app.infra.db.helpers.raw import positional
+
+
+def test_positional_numbers_parameters_and_expands_lists():
+	query = build_query(
+		ExampleModel, {"name": "felipe", "age__in": "19,20"}, columns=["id", "name"]
+	).limit(5)
+
+	sql, args = positional(query)
+
+	assert sql.startswith("SELECT example.id, example.name \nFROM example")
+	assert "example.age IN ($3::INTEGER, $4::INTEGER)" in sql
+	assert "LIMIT $2" in sql
+	assert args == ["felipe", 5, 19, 20]
@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.domain.models.example import ExampleModel
+from app.infra.db.routing import ReplicaSet, RoutingSession
+from app.infra.db.transaction import Transaction
+
+DSN = "postgresql+asyncpg://user:pass@{}/db"
+
+
+def _session(strategy="round_robin"):
+	primary = create_async_engine(DSN.format("primary"))
+	replicas = [create_async_engine(DSN.format(f"replica{i}")) for i in range(2)]
+	session = AsyncSession(
+		bind=primary,
+		sync_session_class=RoutingSession,
+		replicas=ReplicaSet(
+			engines=[engine.sync_engine for engine in replicas], strategy=strategy
+		),
+	)
+	return session, primary.sync_engine, [engine.sync_engine for engine in replicas]
+
+
+def _bind(session, clause):
+	return session.sync_session.get_bind(clause=clause)
+
+
+def test_reads_go_to_one_replica_per_session():
+	session, primary, replicas = _session()
+
+	first = _bind(session, select(ExampleModel))
+	second = _bind(session, select(ExampleModel))
+
+	assert first in replicas
+	assert first is second
+
+
+def test_round_robin_spreads_sessions_across_replicas():
+	session, _, replicas = _session()
+	replica_set = session.sync_session.replicas
+
+	assert [replica_set.pick() for _ in range(3)] == [*replicas, replicas[0]]
+
+
+def test_write_pins_session_to_primary_for_following_reads():
+	session, primary, _ = _session()
+
+	assert _bind(session, update(ExampleModel).values(name="x")) is primary
+	assert _bind(session, select(ExampleModel)) is primary
+
+
+def test_locking_reads_go_to_primary():
+	session, primary, _ = _session()
+
+	assert _bind(session, select(ExampleModel).with_for_update()) is primary
+
+
+@pytest.mark.asyncio
+async def test_transaction_routes_everything_to_primary():
+	session, primary, _ = _session()
+
+	async with Transaction(session=session):
+		assert _bind(session, select(ExampleModel)) is primary
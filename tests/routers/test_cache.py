@@ -0,0 +1,29 @@
+import pytest
+
+from app.domain.usecases.cache import CacheUsecase
+from app.main import app
+from tests.conftest import override_dependency
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_returns_counters(async_client, mocker):
+	stats_response = {
+		"entity": {
+			"backend": "memory",
+			"hits": 3,
+			"misses": 1,
+			"evictions": 0,
+			"size": 1,
+			"hit_ratio": 0.75,
+			"available": True,
+		},
+		"query": None,
+	}
+	usecase = mocker.MagicMock()
+	usecase.stats = mocker.AsyncMock(return_value=stats_response)
+
+	with override_dependency(app=app, dependency=CacheUsecase, replacement=usecase):
+		response = await async_client.get("/cache/stats")
+
+	assert response.status_code == 200
+	assert response.json() == stats_response
@@ -1,9 +1,23 @@
-from uuid import UUID
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
 
 import pytest
 
-from app.domain.schemas.bulk_insert import BulkInsertCreate
-from app.domain.schemas.example import ExampleCreate, ExampleQueryParams, ExampleUpdate
+from app.domain.schemas.base import project
+from app.domain.schemas.bulk_insert import BulkInsertCreate, OnConflict
+from app.domain.schemas.example import (
+	ExampleCreate,
+	ExampleExportParams,
+	ExampleQueryParams,
+	ExampleResponse,
+	ExampleUpdate,
+)
+from app.domain.schemas.export import ExportFormat
+from app.domain.schemas.pagination import CountMode, PaginationMode
+from app.domain.usecases.example import ExampleUsecase
+from app.main import app
+from tests.conftest import override_dependency
 
 
 @pytest.mark.asyncio
@@ -17,7 +31,122 @@ async def test_get_example_returns_200(
 
 	assert response.status_code == 200
 	assert response.json() == fake_data
-	mock_example_usecase.get.assert_called_once_with(id=UUID(fake_data["id"]))
+	mock_example_usecase.get.assert_called_once_with(
+		id=UUID(fake_data["id"]), fields=None
+	)
+
+
+@pytest.mark.asyncio
+async def test_get_example_returns_304_when_client_copy_is_current(
+	async_client, mock_example_usecase, single_examaple_response_fac
+):
+	fake_data = single_examaple_response_fac()
+	mock_example_usecase.get.return_value = fake_data
+	first = await async_client.get(f"/example/{fake_data['id']}")
+
+	response = await async_client.get(
+		f"/example/{fake_data['id']}", headers={"If-None-Match": first.headers["ETag"]}
+	)
+
+	assert response.status_code == 304
+	assert response.content == b""
+	assert response.headers["ETag"] == first.headers["ETag"]
+	assert response.headers["Last-Modified"] == "Thu, 06 Nov 2025 00:00:00 GMT"
+	mock_example_usecase.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_plain_gets_read_the_repository_once(
+	async_client, example_usecase, mock_example_repository
+):
+	now = datetime.now(UTC)
+	row = SimpleNamespace(id=uuid4(), created_at=now, updated_at=now, name="joão", age=19)
+	mock_example_repository.get.return_value = row
+	mock_example_repository.query.return_value = [row]
+	mock_example_repository.count.return_value = 1
+
+	with override_dependency(
+		app=app, dependency=ExampleUsecase, replacement=example_usecase
+	):
+		single = await async_client.get(f"/example/{row.id}")
+		page = await async_client.get("/example/")
+
+	assert (single.status_code, page.status_code) == (200, 200)
+	assert "ETag" in single.headers and "Last-Modified" in single.headers
+	assert "ETag" in page.headers
+	mock_example_repository.get.assert_awaited_once()
+	mock_example_repository.modified_at.assert_not_awaited()
+	mock_example_repository.query.assert_awaited_once()
+	mock_example_repository.count.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_example_with_fields_returns_only_those_fields(
+	async_client, mock_example_usecase
+):
+	id = uuid4()
+	mock_example_usecase.get.return_value = project(ExampleResponse, ("id", "name"))(
+		id=id, name="felipe"
+	)
+
+	response = await async_client.get(f"/example/{id}?fields=id,name")
+
+	assert response.status_code == 200
+	assert response.json() == {"id": str(id), "name": "felipe"}
+	mock_example_usecase.get.assert_called_once_with(id=id, fields="id,name")
+
+
+@pytest.mark.asyncio
+async def test_export_example_streams_csv(async_client, mock_example_usecase, mocker):
+	async def content():
+		yield b"id,name\n"
+		yield b"1,felipe\n"
+
+	mock_example_usecase.export.return_value = content()
+	response = await async_client.get("/example/export?format=csv&fields=id,name")
+
+	assert response.status_code == 200
+	assert response.headers["content-type"].startswith("text/csv")
+	assert 'filename="example.csv"' in response.headers["content-disposition"]
+	assert response.content == b"id,name\n1,felipe\n"
+	mock_example_usecase.export.assert_called_once_with(
+		request=mocker.ANY,
+		export_params=ExampleExportParams(format=ExportFormat.CSV, fields="id,name"),
+	)
+
+
+@pytest.mark.asyncio
+async def test_get_many_examples_takes_repeated_ids(async_client, mock_example_usecase):
+	ids = [uuid4(), uuid4()]
+	mock_example_usecase.get_many.return_value = {"results": [], "missing": ids}
+
+	response = await async_client.get(f"/example/batch?ids={ids[0]}&ids={ids[1]}")
+
+	assert response.status_code == 200
+	assert response.json() == {"results": [], "missing": [str(id) for id in ids]}
+	mock_example_usecase.get_many.assert_called_once_with(ids=ids)
+
+
+@pytest.mark.asyncio
+async def test_get_many_examples_requires_ids(async_client, mock_example_usecase):
+	response = await async_client.get("/example/batch")
+
+	assert response.status_code == 422
+	mock_example_usecase.get_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_query_example_only_sorts_on_indexed_columns(
+	async_client, mock_example_usecase
+):
+	response = await async_client.get("/example/?order_by=name")
+
+	assert response.status_code == 422
+	mock_example_usecase.query.assert_not_called()
+	schema = (await async_client.get("/openapi.json")).json()
+	parameters = schema["paths"]["/example/"]["get"]["parameters"]
+	order_by = next(param for param in parameters if param["name"] == "order_by")
+	assert order_by["schema"]["enum"] == ["id", "created_at"]
 
 
 @pytest.mark.asyncio
@@ -56,6 +185,68 @@ async def test_query_example_returns_paginated_results(
 	)
 
 
+@pytest.mark.asyncio
+async def test_query_example_validates_page_before_reading_it(
+	async_client, mock_example_usecase
+):
+	query_response = {"count": 0, "next": None, "previous": None, "results": []}
+	mock_example_usecase.query.return_value = query_response
+
+	response = await async_client.get("/example/")
+	assert response.status_code == 200
+	assert response.headers["ETag"] == 'W/"page"'
+
+	response = await async_client.get("/example/", headers={"If-None-Match": 'W/"page"'})
+	assert response.status_code == 304
+	assert mock_example_usecase.query.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_query_example_with_cursor_switches_to_keyset_pagination(
+	async_client, mock_example_usecase
+):
+	query_response = {
+		"count": 0,
+		"next": None,
+		"previous": "http://test/example/?limit=10&cursor=abc",
+		"results": [],
+	}
+	mock_example_usecase.query.return_value = query_response
+	response = await async_client.get("/example/?cursor=abc&limit=10")
+
+	assert response.status_code == 200
+	assert response.json() == query_response
+	query_params = mock_example_usecase.query.call_args.kwargs["query_params"]
+	assert query_params.pagination == PaginationMode.CURSOR
+	assert query_params.cursor == "abc"
+
+
+@pytest.mark.asyncio
+async def test_query_example_forwards_count_mode(async_client, mock_example_usecase):
+	mock_example_usecase.query.return_value = {
+		"count": 0,
+		"next": None,
+		"previous": None,
+		"results": [],
+	}
+	response = await async_client.get("/example/?count_mode=estimated")
+
+	assert response.status_code == 200
+	query_params = mock_example_usecase.query.call_args.kwargs["query_params"]
+	assert query_params.count_mode == CountMode.ESTIMATED
+	assert query_params.filters() == {}
+
+
+@pytest.mark.asyncio
+async def test_query_example_rejects_unknown_count_mode(
+	async_client, mock_example_usecase
+):
+	response = await async_client.get("/example/?count_mode=guess")
+
+	assert response.status_code == 422
+	mock_example_usecase.query.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_create_example_returns_201_with_valid_data(
 	async_client, mock_example_usecase, single_examaple_response_fac
@@ -93,7 +284,13 @@ async def test_bulk_insert_example_inserts_multiple_records(
 	async_client, mock_example_usecase
 ):
 	json_data = {"items": [{"age": 19, "name": "felipe"}, {"age": 20, "name": "gustavo"}]}
-	bulk_insert_response = {"elapsed_time": 1.0}
+	bulk_insert_response = {
+		"inserted_rows": 2,
+		"updated_rows": 0,
+		"skipped_rows": 0,
+		"elapsed_time": 1.0,
+		"connections": [{"rows": 2, "batches": 1, "rows_per_second": 2.0}],
+	}
 	mock_example_usecase.bulk_insert.return_value = bulk_insert_response
 	response = await async_client.post("/example/bulk_insert", json=json_data)
 
@@ -109,6 +306,94 @@ async def test_bulk_insert_example_inserts_multiple_records(
 	)
 
 
+@pytest.mark.asyncio
+async def test_bulk_insert_columnar_validates_columns(async_client, mock_example_usecase):
+	mock_example_usecase.bulk_insert_columnar.return_value = {"elapsed_time": 1.0}
+	response = await async_client.post(
+		"/example/bulk_insert/columnar",
+		json={"columns": {"name": ["felipe", "gustavo"], "age": [19]}},
+	)
+
+	assert response.status_code == 422
+	mock_example_usecase.bulk_insert_columnar.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_merge_forwards_conflict_action(async_client, mock_example_usecase):
+	mock_example_usecase.bulk_merge.return_value = {
+		"inserted_rows": 1,
+		"updated_rows": 0,
+		"skipped_rows": 1,
+		"elapsed_time": 1.0,
+	}
+	item = {"id": str(uuid4()), "name": "felipe", "age": 19}
+	response = await async_client.post(
+		"/example/bulk_insert/merge?on_conflict=nothing", json={"items": [item, item]}
+	)
+
+	assert response.status_code == 200
+	assert response.json()["skipped_rows"] == 1
+	kwargs = mock_example_usecase.bulk_merge.call_args.kwargs
+	assert kwargs["on_conflict"] == OnConflict.NOTHING
+	assert len(kwargs["data"].items) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_partial_update_sends_only_fields_set(
+	async_client, mock_example_usecase
+):
+	mock_example_usecase.bulk_partial_update.return_value = {
+		"matched_rows": 1,
+		"changed_rows": 1,
+	}
+	id = uuid4()
+	response = await async_client.patch(
+		"/example/bulk", json={"items": [{"id": str(id), "age": 20}]}
+	)
+
+	assert response.status_code == 200
+	assert response.json() == {"matched_rows": 1, "changed_rows": 1}
+	data = mock_example_usecase.bulk_partial_update.call_args.kwargs["data"]
+	assert data.items[0].model_dump(exclude_unset=True) == {"id": id, "age": 20}
+
+
+@pytest.mark.asyncio
+async def test_bulk_partial_update_rejects_repeated_ids(
+	async_client, mock_example_usecase
+):
+	item = {"id": str(uuid4()), "age": 20}
+	response = await async_client.patch("/example/bulk", json={"items": [item, item]})
+
+	assert response.status_code == 422
+	mock_example_usecase.bulk_partial_update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_stream_forwards_body_stream_and_media_type(
+	async_client, mock_example_usecase
+):
+	mock_example_usecase.bulk_insert_stream.return_value = {
+		"inserted_rows": 1,
+		"elapsed_time": 1.0,
+	}
+	response = await async_client.post(
+		"/example/bulk_insert/stream",
+		content=b'{"name": "felipe", "age": 19}\n',
+		headers={"content-type": "application/x-ndjson"},
+	)
+
+	assert response.status_code == 200
+	assert response.json() == {
+		"inserted_rows": 1,
+		"updated_rows": 0,
+		"skipped_rows": 0,
+		"elapsed_time": 1.0,
+		"connections": [],
+	}
+	kwargs = mock_example_usecase.bulk_insert_stream.call_args.kwargs
+	assert kwargs["media_type"] == "application/x-ndjson"
+
+
 @pytest.mark.asyncio
 async def test_delete_example_returns_204(
 	async_client, mock_example_usecase, single_examaple_response_fac
@@ -120,3 +405,14 @@ async def test_delete_example_returns_204(
 	assert response.status_code == 204
 	assert response.text == ""
 	mock_example_usecase.delete.assert_called_once_with(id=UUID(example_id))
+
+
+@pytest.mark.asyncio
+async def test_delete_by_filter_forwards_filters(async_client, mock_example_usecase):
+	mock_example_usecase.delete_by_filter.return_value = {"deleted_rows": 3}
+	response = await async_client.delete("/example/", params={"age": 19})
+
+	assert response.status_code == 200
+	assert response.json() == {"deleted_rows": 3}
+	filters = mock_example_usecase.delete_by_filter.call_args.kwargs["filters"]
+	assert filters.model_dump(exclude_none=True) == {"age": 19}
@@ -0,0 +1,56 @@
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.domain.schemas.job import JobResponse
+from app.domain.usecases.job import JobUsecase
+from app.main import app
+from tests.conftest import override_dependency
+
+
+def _job(**overrides):
+	now = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+	return {
+		"id": str(uuid4()),
+		"kind": "example.bulk_insert",
+		"status": "running",
+		"total_rows": 2,
+		"inserted_rows": 1,
+		"progress": 0.5,
+		"errors": [],
+		"created_at": now,
+		"started_at": now,
+		"finished_at": None,
+		**overrides,
+	}
+
+
+@pytest.mark.asyncio
+async def test_get_job_returns_200(async_client, mocker):
+	job = _job()
+	usecase = mocker.MagicMock()
+	usecase.get = mocker.AsyncMock(return_value=job)
+
+	with override_dependency(app=app, dependency=JobUsecase, replacement=usecase):
+		response = await async_client.get(f"/jobs/{job['id']}")
+
+	assert response.status_code == 200
+	assert response.json() == job
+	usecase.get.assert_called_once_with(id=UUID(job["id"]))
+
+
+@pytest.mark.asyncio
+async def test_submit_bulk_insert_returns_202_with_location(
+	async_client, mock_example_usecase
+):
+	job = _job(status="pending", inserted_rows=0, progress=0.0, started_at=None)
+	mock_example_usecase.submit_bulk_insert.return_value = JobResponse.model_validate(job)
+	response = await async_client.post(
+		"/example/bulk_insert/jobs",
+		json={"items": [{"name": "felipe", "age": 19}, {"name": "gustavo"}]},
+	)
+
+	assert response.status_code == 202
+	assert response.json() == job
+	assert response.headers["location"] == f"/jobs/{job['id']}"